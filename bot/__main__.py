@@ -5,13 +5,13 @@ import discord
 from async_rediscache import RedisSession
 from discord.ext import commands
 from pydis_core import StartupError
-from pydis_core.site_api import APIClient
 from redis import RedisError
 
 import bot
 from bot import constants
 from bot.bot import Bot
 from bot.log import get_logger, setup_sentry
+from bot.utils.site_api import CACHED_ENDPOINTS, SiteAPIClient
 
 LOCALHOST = "127.0.0.1"
 
@@ -65,9 +65,10 @@ async def main() -> None:
             allowed_mentions=discord.AllowedMentions(everyone=False, roles=allowed_roles),
             intents=intents,
             allowed_roles=list({discord.Object(id_) for id_ in constants.MODERATION_ROLES}),
-            api_client=APIClient(
+            api_client=SiteAPIClient(
                 site_api_url=constants.URLs.site_api,
                 site_api_token=constants.Keys.site_api,
+                cache_ttls=CACHED_ENDPOINTS,
             ),
         )
         async with bot.instance as _bot:
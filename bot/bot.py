@@ -1,18 +1,30 @@
 import asyncio
 import contextlib
+import importlib.machinery
+import socket
+import time
+import types
+from collections.abc import Callable, Coroutine
+from dataclasses import dataclass
 from sys import exception
 
 import aiohttp
 from discord.errors import Forbidden
+from discord.ext import commands
 from pydis_core import BotBase
 from pydis_core.utils.error_handling import handle_forbidden_from_block
 from sentry_sdk import new_scope, start_transaction
 
 from bot import constants, exts
 from bot.log import get_logger
+from bot.utils.site_api import SiteAPIClient
+from bot.utils.stats import BufferedStatsClient, ListenerTimings
 
 log = get_logger("bot")
 
+# How many of the slowest extensions to log once all extensions have loaded
+SLOWEST_EXTENSIONS_REPORTED = 10
+
 
 class StartupError(Exception):
     """Exception class for startup errors."""
@@ -22,6 +34,41 @@ class StartupError(Exception):
         self.exception = base
 
 
+@dataclass
+class ExtensionTiming:
+    """How long each stage of loading an extension took, in seconds."""
+
+    import_time: float = 0
+    setup_time: float = 0
+    cog_load_time: float = 0
+
+    @property
+    def total(self) -> float:
+        """The total time it took to load the extension."""
+        return self.import_time + self.setup_time + self.cog_load_time
+
+
+class _TimedLoader:
+    """Wrap a module loader to record how long executing the module takes."""
+
+    def __init__(self, loader: importlib.machinery.SourceFileLoader, timing: ExtensionTiming):
+        self.loader = loader
+        self.timing = timing
+
+    def create_module(self, spec: importlib.machinery.ModuleSpec) -> types.ModuleType | None:
+        return self.loader.create_module(spec)
+
+    def exec_module(self, module: types.ModuleType) -> None:
+        start = time.perf_counter()
+        try:
+            self.loader.exec_module(module)
+        finally:
+            self.timing.import_time = time.perf_counter() - start
+
+    def __getattr__(self, name: str):
+        return getattr(self.loader, name)
+
+
 class Bot(BotBase):
     """A subclass of `pydis_core.BotBase` that implements bot-specific functions."""
 
@@ -29,10 +76,103 @@ class Bot(BotBase):
 
         super().__init__(*args, **kwargs)
 
+        # Timings of the most recent load of each extension
+        self.extension_timings: dict[str, ExtensionTiming] = {}
+        self._finished_extensions: set[str] = set()
+        self._extensions_loaded = asyncio.Event()
+        # Timings of every event listener invocation, only kept when enabled
+        self.listener_timings = ListenerTimings() if constants.Stats.time_listeners else None
+
     async def load_extension(self, name: str, *args, **kwargs) -> None:
         """Extend D.py's load_extension function to also record sentry performance stats."""
-        with start_transaction(op="cog-load", name=name):
-            await super().load_extension(name, *args, **kwargs)
+        try:
+            with start_transaction(op="cog-load", name=name):
+                await super().load_extension(name, *args, **kwargs)
+        finally:
+            self._finished_extensions.add(name)
+            self._check_extensions_loaded()
+
+    async def _load_from_module_spec(self, spec: importlib.machinery.ModuleSpec, key: str) -> None:
+        """Extend D.py's extension loading to time each stage of it and let cogs know the bot's extensions changed."""
+        timing = self.extension_timings[key] = ExtensionTiming()
+        original_loader = spec.loader
+        spec.loader = _TimedLoader(original_loader, timing)
+
+        start = time.perf_counter()
+        try:
+            await super()._load_from_module_spec(spec, key)
+        finally:
+            spec.loader = original_loader
+            if (module := self.extensions.get(key)) is not None:
+                module.__loader__ = original_loader
+            self.dispatch("extension_change", key)
+
+        timing.setup_time = time.perf_counter() - start - timing.import_time - timing.cog_load_time
+        self._send_extension_timing_stats(key, timing)
+
+    async def unload_extension(self, name: str, *args, **kwargs) -> None:
+        """Extend D.py's unload_extension function to let cogs know the bot's extensions changed."""
+        await super().unload_extension(name, *args, **kwargs)
+        self.dispatch("extension_change", name)
+
+    async def add_cog(self, cog: commands.Cog) -> None:
+        """Extend pydis_core's add_cog to attribute the time spent in the cog's `cog_load` to its extension."""
+        start = time.perf_counter()
+        await super().add_cog(cog)
+
+        if (extension := self._get_loading_extension(type(cog).__module__)) is not None:
+            self.extension_timings[extension].cog_load_time += time.perf_counter() - start
+
+    def _get_loading_extension(self, module: str) -> str | None:
+        """Return the name of the extension being loaded which `module` belongs to, if there is one."""
+        candidates = [
+            name for name in self.extension_timings
+            if name not in self.extensions and (module == name or module.startswith(f"{name}."))
+        ]
+        return max(candidates, key=len, default=None)
+
+    def _send_extension_timing_stats(self, name: str, timing: ExtensionTiming) -> None:
+        """Send the load timings of the extension `name` to statsd."""
+        stat_name = name.removeprefix(f"{exts.__name__}.")
+        self.stats.timing(f"extensions.{stat_name}.import", timing.import_time * 1000)
+        self.stats.timing(f"extensions.{stat_name}.setup", timing.setup_time * 1000)
+        self.stats.timing(f"extensions.{stat_name}.cog_load", timing.cog_load_time * 1000)
+
+    def _check_extensions_loaded(self) -> None:
+        """Open the extension readiness gate and report the slowest extensions once every extension was tried."""
+        if self._extensions_loaded.is_set() or self.all_extensions is None:
+            return
+        if not self._finished_extensions.issuperset(self.all_extensions):
+            return
+
+        self._extensions_loaded.set()
+        log.info(f"Finished loading {len(self.extensions)}/{len(self.all_extensions)} extensions.")
+        for name, timing in self.get_slowest_extensions(SLOWEST_EXTENSIONS_REPORTED):
+            log.info(
+                f"Loaded {name} in {timing.total:.3f}s (import {timing.import_time:.3f}s, "
+                f"setup {timing.setup_time:.3f}s, cog_load {timing.cog_load_time:.3f}s)."
+            )
+
+    def get_slowest_extensions(self, limit: int | None = None) -> list[tuple[str, ExtensionTiming]]:
+        """Return up to `limit` loaded extensions and their load timings, from slowest to fastest."""
+        loaded = [(name, timing) for name, timing in self.extension_timings.items() if name in self.extensions]
+        loaded.sort(key=lambda item: item[1].total, reverse=True)
+        return loaded[:limit]
+
+    async def wait_until_extensions_loaded(self) -> None:
+        """
+        Wait until loading every extension found on startup has been attempted.
+
+        Heavy start-up work which isn't needed for a cog to function can wait on this in the background,
+        so it doesn't compete with the rest of the extensions while they load.
+        """
+        await self._extensions_loaded.wait()
+
+    def _schedule_event(self, coro: Callable[..., Coroutine], event_name: str, *args, **kwargs) -> asyncio.Task:
+        """Extend D.py's event scheduling to time the listener, when listener timings are enabled."""
+        if self.listener_timings is not None and self.stats is not None:
+            coro = self.listener_timings.wrap(coro, event_name, self.stats)
+        return super()._schedule_event(coro, event_name, *args, **kwargs)
 
     async def ping_services(self) -> None:
         """A helper to make sure all the services the bot relies on are available on startup."""
@@ -50,11 +190,43 @@ class Bot(BotBase):
                     raise
                 await asyncio.sleep(constants.URLs.connect_cooldown)
 
+    async def _create_buffered_stats_client(self) -> None:
+        """Replace the stats client, which sends a packet for every metric, with one which sends them in batches."""
+        if not self.statsd_url:
+            return
+
+        try:
+            stats = BufferedStatsClient(
+                asyncio.get_running_loop(),
+                self.statsd_url,
+                8125,
+                prefix="bot",
+                flush_interval=constants.Stats.flush_interval,
+                max_buffered=constants.Stats.max_buffered,
+            )
+        except socket.gaierror:
+            log.warning("Couldn't resolve the statsd host, so metrics won't be buffered.")
+            return
+
+        await stats.create_socket()
+        if getattr(self.stats, "_transport", False):
+            self.stats._transport.close()
+        self.stats = stats
+
     async def setup_hook(self) -> None:
         """Default async initialisation method for discord.py."""
         await super().setup_hook()
+        await self._create_buffered_stats_client()
+        if isinstance(self.api_client, SiteAPIClient):
+            self.api_client.stats = self.stats
         await self.load_extensions(exts)
 
+    async def close(self) -> None:
+        """Send any buffered metrics before closing the bot."""
+        if isinstance(self.stats, BufferedStatsClient):
+            self.stats.stop()
+        await super().close()
+
     async def on_error(self, event: str, *args, **kwargs) -> None:
         """Log errors raised in event listeners rather than printing them to stderr."""
         e_val = exception()
@@ -373,6 +373,11 @@ class _Branding(EnvConfig, env_prefix="branding_"):
 
     cycle_frequency: int = 3
 
+    # Downloaded banners and icons are kept here, by content hash, to avoid downloading them again.
+    asset_cache_dir: str = "cache/branding"
+    # The maximum total size of the cached assets, in bytes.
+    asset_cache_size: int = 64 * 1024 * 1024
+
 
 Branding = _Branding()
 
@@ -408,6 +413,14 @@ class _Stats(EnvConfig, env_prefix="stats_"):
 
     presence_update_timeout: int = 30
     statsd_host: str = "graphite.default.svc.cluster.local"
+    # Metrics are buffered and sent in batches every interval, or sooner once enough are buffered
+    flush_interval: float = 1
+    max_buffered: int = 1000
+    # How often the event loop's lag is measured, and how long a callback can block it before being reported
+    loop_lag_interval: float = 0.5
+    slow_callback_threshold: float = 0.1
+    # Whether to time every event listener invocation from startup, which can also be toggled at runtime
+    time_listeners: bool = False
 
 
 Stats = _Stats()
@@ -433,6 +446,24 @@ class _Metabase(EnvConfig, env_prefix="metabase_"):
 Metabase = _Metabase()
 
 
+class _Snekbox(EnvConfig, env_prefix="snekbox_"):
+
+    # The number of jobs which may be evaluated at once, across all users.
+    max_concurrent_jobs: int = 4
+    # The number of jobs which may wait for a free slot before new jobs are rejected.
+    max_queued_jobs: int = 20
+
+    # Whether results of identical, deterministic jobs are reused instead of being evaluated again.
+    cache_results: bool = False
+    # How long a result is reused for, in seconds.
+    cache_ttl: int = 300
+    # The maximum number of results kept.
+    cache_size: int = 128
+
+
+Snekbox = _Snekbox()
+
+
 class _BaseURLs(EnvConfig, env_prefix="urls_"):
 
     # Snekbox endpoints
@@ -0,0 +1,93 @@
+import re
+import typing as t
+from pathlib import Path
+
+from bot.log import get_logger
+
+log = get_logger(__name__)
+
+# Git blob hashes are SHA-1 or SHA-256 hex digests. Anything else is not used as a file name.
+SHA_REGEX = re.compile(r"[0-9a-f]{40}|[0-9a-f]{64}")
+
+
+class StoreResult(t.NamedTuple):
+    """How many assets were evicted to store an asset, and the size of the stored assets afterwards."""
+
+    evicted: int
+    size: int
+
+
+class AssetStore:
+    """
+    Bounded, content-addressed store of branding assets on disk.
+
+    Assets are stored under their git blob hash, so a stored asset is valid for as long as the hash is
+    referenced by the branding repository. Once the stored assets exceed `max_size` bytes in total,
+    the least recently used ones are evicted.
+
+    The methods do blocking file I/O, so callers on the event loop should run them in an executor.
+    They return what happened rather than sending stats themselves, as the stats client isn't thread-safe.
+    """
+
+    def __init__(self, directory: Path, max_size: int) -> None:
+        self.directory = directory
+        self.max_size = max_size
+
+    def _path(self, sha: str) -> Path | None:
+        """Return the path where the asset with `sha` is stored, or None if `sha` isn't a valid hash."""
+        if not SHA_REGEX.fullmatch(sha):
+            return None
+        return self.directory / sha
+
+    def get(self, sha: str) -> bytes | None:
+        """Return the stored asset with `sha`, or None if it isn't stored or can't be read."""
+        if (path := self._path(sha)) is None:
+            return None
+
+        try:
+            content = path.read_bytes()
+            path.touch()  # Mark the asset as recently used.
+        except FileNotFoundError:
+            return None
+        except OSError:
+            log.exception(f"Failed to read stored branding asset {sha}.")
+            return None
+
+        return content
+
+    def put(self, sha: str, content: bytes) -> StoreResult | None:
+        """
+        Store the asset `content` with `sha`, evicting the least recently used assets if needed.
+
+        Return None if the asset wasn't stored.
+        """
+        if (path := self._path(sha)) is None:
+            log.warning(f"Not storing branding asset with invalid hash: {sha!r}.")
+            return None
+        if len(content) > self.max_size:
+            log.debug(f"Not storing branding asset {sha}: its size exceeds the store's limit.")
+            return None
+
+        self.directory.mkdir(parents=True, exist_ok=True)
+        # Write to a temporary file first, so a partially written asset is never read.
+        temp_path = path.with_suffix(".tmp")
+        temp_path.write_bytes(content)
+        temp_path.replace(path)
+
+        return self._evict()
+
+    def _evict(self) -> StoreResult:
+        """Delete the least recently used assets until the store fits within its size limit."""
+        files = [(path, path.stat()) for path in self.directory.iterdir() if self._path(path.name) is not None]
+        total_size = sum(stat.st_size for _, stat in files)
+        evicted = 0
+
+        for path, stat in sorted(files, key=lambda file: file[1].st_mtime):
+            if total_size <= self.max_size:
+                break
+            log.trace(f"Evicting branding asset {path.name} from the store.")
+            path.unlink(missing_ok=True)
+            total_size -= stat.st_size
+            evicted += 1
+
+        return StoreResult(evicted, total_size)
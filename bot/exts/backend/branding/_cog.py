@@ -123,6 +123,13 @@ class Branding(commands.Cog):
         AssetType.BANNER: RedisCache(namespace="Branding.banner_cache")
     })
 
+    # Git blob hashes of the icons and banners in current rotation, by download URL.
+    # These key the repository's local asset store, so unchanged assets aren't downloaded again.
+    asset_hashes = types.MappingProxyType({
+        AssetType.ICON: RedisCache(namespace="Branding.icon_hashes"),
+        AssetType.BANNER: RedisCache(namespace="Branding.banner_hashes")
+    })
+
     # All available event names & durations. Cached by the daemon nightly; read by the calendar command.
     cache_events = RedisCache()
 
@@ -142,12 +149,15 @@ class Branding(commands.Cog):
         """
         Download asset from `download_url` and apply it to PyDis as `asset_type`.
 
+        The asset is only downloaded if it isn't already in the repository's local asset store.
+
         Return a boolean indicating whether the application was successful.
         """
         log.info(f"Applying '{asset_type.value}' asset to the guild.")
 
         try:
-            file = await self.repository.fetch_file(download_url)
+            sha = await self.asset_hashes[asset_type].get(download_url)
+            file = await self.repository.fetch_asset(download_url, sha)
         except Exception:
             log.exception(f"Failed to fetch '{asset_type.value}' asset.")
             return False
@@ -248,9 +258,11 @@ class Branding(commands.Cog):
         log.debug(f"Initiating new {asset_type.value} rotation.")
 
         await self.asset_caches[asset_type].clear()
+        await self.asset_hashes[asset_type].clear()
 
         new_state = {asset.download_url: 0 for asset in available_assets}
         await self.asset_caches[asset_type].update(new_state)
+        await self.asset_hashes[asset_type].update({asset.download_url: asset.sha for asset in available_assets})
 
         log.trace(f"{asset_type.value.title()} rotation initiated for {len(new_state)} assets.")
 
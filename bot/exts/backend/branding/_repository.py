@@ -1,14 +1,17 @@
+import asyncio
 import inspect
 import typing as t
 from datetime import UTC, date, datetime
+from pathlib import Path
 
 import frontmatter
 from aiohttp import ClientResponse, ClientResponseError
 from tenacity import retry, retry_if_exception_type, stop_after_attempt, wait_exponential
 
 from bot.bot import Bot
-from bot.constants import Keys
+from bot.constants import Branding as BrandingConfig, Keys
 from bot.errors import BrandingMisconfigurationError
+from bot.exts.backend.branding._assets import AssetStore
 from bot.log import get_logger
 
 # Base URL for requests into the branding repository.
@@ -28,6 +31,9 @@ ARBITRARY_YEAR = 2020
 # Format used to parse date strings after we inject `ARBITRARY_YEAR` at the end.
 DATE_FMT = "%B %d %Y"  # Ex: July 10 2020
 
+# Maximum number of requests made to GitHub at the same time.
+MAX_CONCURRENT_REQUESTS = 5
+
 log = get_logger(__name__)
 
 
@@ -75,6 +81,14 @@ class Event(t.NamedTuple):
         return f"<Event at '{self.path}'>"
 
 
+class CachedDirectory(t.NamedTuple):
+    """Directory listing kept to avoid fetching it again while it's unchanged."""
+
+    sha: str | None  # Tree hash of the directory, if known from its parent's listing.
+    etag: str | None  # ETag of the response the listing came from.
+    listing: list[dict[str, t.Any]]
+
+
 class GitHubServerError(Exception):
     """
     GitHub responded with 5xx status code.
@@ -117,30 +131,65 @@ class BrandingRepository:
     We work with the assumption that the branding repository checks for such conflicts and prevents them
     from reaching the main branch.
 
-    This class keeps no internal state. All `get_current_event` calls will result in GitHub API requests.
-    The caller is therefore responsible for being responsible and caching information to prevent API abuse.
+    Directory listings and 'meta.md' files are cached. A directory whose tree hash is unchanged since it
+    was last listed is not requested again, and other directories are requested conditionally using
+    their ETag, so unchanged ones only cost a 304 response. Still, all `get_current_event` calls will
+    result in at least one GitHub API request. The caller is therefore responsible for being responsible
+    and caching information to prevent API abuse.
 
-    Requests are made using the HTTP session looked up on the bot instance.
+    Requests are made concurrently, up to `MAX_CONCURRENT_REQUESTS` at a time, using the HTTP session
+    looked up on the bot instance.
     """
 
     def __init__(self, bot: Bot) -> None:
         self.bot = bot
 
+        self._request_limit = asyncio.Semaphore(MAX_CONCURRENT_REQUESTS)
+        self._directories: dict[str, CachedDirectory] = {}
+        self._meta_files: dict[str, bytes] = {}  # Raw 'meta.md' files by blob hash.
+        self.assets = AssetStore(Path(BrandingConfig.asset_cache_dir), BrandingConfig.asset_cache_size)
+
     @_retry_server_error
-    async def fetch_directory(self, path: str, types: t.Container[str] = ("file", "dir")) -> dict[str, RemoteObject]:
+    async def fetch_directory(
+        self,
+        path: str,
+        types: t.Container[str] = ("file", "dir"),
+        sha: str | None = None,
+    ) -> dict[str, RemoteObject]:
         """
         Fetch directory found at `path` in the branding repository.
 
         Raise an exception if the request fails, or if the response lacks the expected keys.
 
         Passing custom `types` allows getting only files or directories. By default, both are included.
-        """
-        full_url = f"{BRANDING_URL}/{path}"
-        log.debug(f"Fetching directory from branding repository: '{full_url}'.")
 
-        async with self.bot.http_session.get(full_url, params=PARAMS, headers=HEADERS) as response:
-            _raise_for_status(response)
-            json_directory = await response.json()
+        If the directory's tree `sha` is given and matches the cached listing's, no request is made.
+        """
+        cached = self._directories.get(path)
+
+        if sha is not None and cached is not None and cached.sha == sha:
+            log.trace(f"Directory '{path}' is unchanged, using cached listing.")
+            json_directory = cached.listing
+        else:
+            full_url = f"{BRANDING_URL}/{path}"
+            log.debug(f"Fetching directory from branding repository: '{full_url}'.")
+
+            headers = HEADERS
+            if cached is not None and cached.etag is not None:
+                headers = {**HEADERS, "If-None-Match": cached.etag}
+
+            async with self._request_limit, self.bot.http_session.get(
+                full_url, params=PARAMS, headers=headers
+            ) as response:
+                _raise_for_status(response)
+                if response.status == 304:
+                    log.trace(f"Directory '{path}' is unchanged since it was last fetched.")
+                    json_directory = cached.listing
+                else:
+                    json_directory = await response.json()
+                etag = response.headers.get("ETag")
+
+            self._directories[path] = CachedDirectory(sha, etag, json_directory)
 
         return {file["name"]: RemoteObject(file) for file in json_directory if file["type"] in types}
 
@@ -153,10 +202,46 @@ class BrandingRepository:
         """
         log.debug(f"Fetching file from branding repository: '{download_url}'.")
 
-        async with self.bot.http_session.get(download_url, params=PARAMS, headers=HEADERS) as response:
+        async with self._request_limit, self.bot.http_session.get(
+            download_url, params=PARAMS, headers=HEADERS
+        ) as response:
             _raise_for_status(response)
             return await response.read()
 
+    async def fetch_asset(self, download_url: str, sha: str | None) -> bytes:
+        """
+        Fetch asset as bytes from `download_url`, unless an asset with the same `sha` is stored locally.
+
+        Raise an exception if the asset must be downloaded but the request does not succeed.
+        """
+        if sha is not None:
+            if asset := await self.bot.loop.run_in_executor(None, self.assets.get, sha):
+                log.debug(f"Using stored branding asset {sha} for '{download_url}'.")
+                self.bot.stats.incr("branding.asset_cache.hit")
+                return asset
+            self.bot.stats.incr("branding.asset_cache.miss")
+
+        asset = await self.fetch_file(download_url)
+
+        if sha is not None:
+            try:
+                result = await self.bot.loop.run_in_executor(None, self.assets.put, sha, asset)
+            except OSError:
+                log.exception(f"Failed to store branding asset {sha}.")
+            else:
+                if result is not None:
+                    if result.evicted:
+                        self.bot.stats.incr("branding.asset_cache.evicted", result.evicted)
+                    self.bot.stats.gauge("branding.asset_cache.size", result.size)
+
+        return asset
+
+    async def fetch_meta_file(self, meta: RemoteObject) -> bytes:
+        """Fetch the 'meta.md' file `meta` as bytes, unless a file with the same hash was fetched before."""
+        if (raw_file := self._meta_files.get(meta.sha)) is None:
+            raw_file = self._meta_files[meta.sha] = await self.fetch_file(meta.download_url)
+        return raw_file
+
     def parse_meta_file(self, raw_file: bytes) -> MetaFile:
         """
         Parse a 'meta.md' file from raw bytes.
@@ -190,23 +275,25 @@ class BrandingRepository:
 
         The caller is responsible for handling errors caused by misconfiguration.
         """
-        contents = await self.fetch_directory(directory.path)
+        log.trace(f"Reading event directory: '{directory.path}'.")
+        contents = await self.fetch_directory(directory.path, sha=directory.sha)
 
         missing_assets = {"meta.md", "server_icons", "banners"} - contents.keys()
 
         if missing_assets:
             raise BrandingMisconfigurationError(f"Directory is missing following assets: {missing_assets}")
 
-        server_icons = await self.fetch_directory(contents["server_icons"].path, types=("file",))
-        banners = await self.fetch_directory(contents["banners"].path, types=("file",))
+        server_icons, banners, meta_bytes = await asyncio.gather(
+            self.fetch_directory(contents["server_icons"].path, types=("file",), sha=contents["server_icons"].sha),
+            self.fetch_directory(contents["banners"].path, types=("file",), sha=contents["banners"].sha),
+            self.fetch_meta_file(contents["meta.md"]),
+        )
 
         if len(server_icons) == 0:
             raise BrandingMisconfigurationError("Found no server icons!")
         if len(banners) == 0:
             raise BrandingMisconfigurationError("Found no server banners!")
 
-        meta_bytes = await self.fetch_file(contents["meta.md"].download_url)
-
         meta_file = self.parse_meta_file(meta_bytes)
 
         return Event(directory.path, meta_file, list(banners.values()), list(server_icons.values()))
@@ -221,14 +308,20 @@ class BrandingRepository:
 
         event_directories = await self.fetch_directory("events", types=("dir",))  # Skip files.
 
-        instances: list[Event] = []
+        instances = await asyncio.gather(*(
+            self.construct_event(event_directory) for event_directory in event_directories.values()
+        ))
 
-        for event_directory in event_directories.values():
-            log.trace(f"Reading event directory: '{event_directory.path}'.")
-            instance = await self.construct_event(event_directory)
-            instances.append(instance)
+        # Forget 'meta.md' files which no longer belong to any event.
+        meta_shas = {
+            file["sha"]
+            for directory in event_directories.values()
+            for file in self._directories[directory.path].listing
+            if file["name"] == "meta.md"
+        }
+        self._meta_files = {sha: raw for sha, raw in self._meta_files.items() if sha in meta_shas}
 
-        return instances
+        return list(instances)
 
     async def get_current_event(self) -> tuple[Event, list[Event]]:
         """
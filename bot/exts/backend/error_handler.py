@@ -1,5 +1,4 @@
 import copy
-import difflib
 
 import discord
 from discord import ButtonStyle, Embed, Forbidden, Interaction, Member, User
@@ -7,6 +6,7 @@ from discord.ext.commands import ChannelNotFound, Cog, Context, TextChannelConve
 from pydis_core.site_api import ResponseCodeError
 from pydis_core.utils.error_handling import handle_forbidden_from_block
 from pydis_core.utils.interactions import DeleteMessageButton, ViewWithUserAndRoleCheck
+from rapidfuzz import fuzz, process
 from sentry_sdk import new_scope
 
 from bot.bot import Bot
@@ -17,6 +17,9 @@ from bot.utils.checks import ContextCheckFailure
 
 log = get_logger(__name__)
 
+# The minimum similarity, out of 100, for a command name to be suggested for a misspelled one
+COMMAND_SUGGESTION_CUTOFF = 60
+
 
 class HelpEmbedView(ViewWithUserAndRoleCheck):
     """View to allow showing the help command for command error responses."""
@@ -52,6 +55,24 @@ class ErrorHandler(Cog):
 
     def __init__(self, bot: Bot):
         self.bot = bot
+        # The names and aliases of all visible commands, built when first needed after the commands change
+        self._command_names: list[str] | None = None
+
+    @Cog.listener()
+    async def on_extension_change(self, _name: str) -> None:
+        """Rebuild the command name index when it's next needed, as an extension's commands have changed."""
+        self._command_names = None
+
+    @property
+    def command_names(self) -> list[str]:
+        """The names and aliases of all commands which aren't hidden."""
+        if self._command_names is None:
+            names = []
+            for cmd in self.bot.walk_commands():
+                if not cmd.hidden:
+                    names += (cmd.name, *cmd.aliases)
+            self._command_names = list(dict.fromkeys(names))
+        return self._command_names
 
     def _get_error_embed(self, title: str, body: str) -> Embed:
         """Return an embed that contains the exception."""
@@ -260,12 +281,10 @@ class ErrorHandler(Cog):
         """Sends user similar commands if any can be found."""
         # No similar tag found, or tag on cooldown -
         # searching for a similar command
-        raw_commands = []
-        for cmd in self.bot.walk_commands():
-            if not cmd.hidden:
-                raw_commands += (cmd.name, *cmd.aliases)
-        if similar_command_data := difflib.get_close_matches(command_name, raw_commands, 1):
-            similar_command_name = similar_command_data[0]
+        if similar_command_data := process.extractOne(
+            command_name, self.command_names, scorer=fuzz.ratio, score_cutoff=COMMAND_SUGGESTION_CUTOFF
+        ):
+            similar_command_name, _, _ = similar_command_data
             similar_command = self.bot.get_command(similar_command_name)
 
             if not similar_command:
@@ -1,4 +1,6 @@
 import asyncio
+from collections import OrderedDict
+from dataclasses import dataclass, field
 
 import discord
 from discord import Color, Embed, Message, RawReactionActionEvent, errors
@@ -9,11 +11,40 @@ from bot.bot import Bot
 from bot.converters import MemberOrUser
 from bot.log import get_logger
 from bot.utils.checks import has_any_role
-from bot.utils.messages import count_unique_users_reaction, send_attachments
+from bot.utils.messages import send_attachments
 from bot.utils.webhooks import send_webhook
 
 log = get_logger(__name__)
 
+# How many messages to keep a duck tally of before forgetting the least recently reacted to
+MAX_TRACKED_MESSAGES = 1000
+
+
+@dataclass
+class DuckTally:
+    """The staff members who reacted to a message with ducks."""
+
+    author_is_staff: bool
+    # Maps the ID of each staff member who reacted with a duck to the ducks they reacted with
+    reactors: dict[int, set[str]] = field(default_factory=dict)
+
+    @property
+    def count(self) -> int:
+        """The number of unique staff members who reacted with a duck."""
+        return len(self.reactors)
+
+    def add(self, user_id: int, emoji: str) -> None:
+        """Record that the user reacted with the duck `emoji`."""
+        self.reactors.setdefault(user_id, set()).add(emoji)
+
+    def remove(self, user_id: int, emoji: str) -> None:
+        """Record that the user removed their `emoji` duck reaction."""
+        if (ducks := self.reactors.get(user_id)) is None:
+            return
+        ducks.discard(emoji)
+        if not ducks:
+            del self.reactors[user_id]
+
 
 class DuckPond(Cog):
     """Relays messages to #duck-pond whenever a certain number of duck reactions have been achieved."""
@@ -25,6 +56,10 @@ class DuckPond(Cog):
         self.ducked_messages = []
         self.relay_lock = None
 
+        self.tallies: OrderedDict[int, DuckTally] = OrderedDict()
+        # Seeding tasks of tallies which are being counted for the first time, so events can wait on them
+        self._seeding: dict[int, asyncio.Task[DuckTally]] = {}
+
     @staticmethod
     def is_staff(member: MemberOrUser) -> bool:
         """Check if a specific member or user is staff."""
@@ -34,14 +69,10 @@ class DuckPond(Cog):
                     return True
         return False
 
-    async def has_green_checkmark(self, message: Message) -> bool:
+    @staticmethod
+    async def has_green_checkmark(message: Message) -> bool:
         """Check if the message has a green checkmark reaction."""
-        for reaction in message.reactions:
-            if reaction.emoji == "✅":
-                async for user in reaction.users():
-                    if user == self.bot.user:
-                        return True
-        return False
+        return any(reaction.emoji == "✅" and reaction.me for reaction in message.reactions)
 
     @staticmethod
     def _is_duck_emoji(emoji: str | discord.PartialEmoji | discord.Emoji) -> bool:
@@ -50,18 +81,61 @@ class DuckPond(Cog):
             return emoji == "🦆"
         return hasattr(emoji, "name") and emoji.name.startswith("ducky_")
 
-    async def count_ducks(self, message: Message) -> int:
+    async def seed_tally(self, message: Message) -> DuckTally:
+        """Count the staff duck reactors of a message which isn't tracked yet, and start tracking it."""
+        tally = DuckTally(author_is_staff=self.is_staff(message.author) and not message.author.bot)
+        for reaction in message.reactions:
+            if self._is_duck_emoji(reaction.emoji):
+                async for user in reaction.users():
+                    if not user.bot and self.is_staff(user):
+                        tally.add(user.id, str(reaction.emoji))
+
+        self.bot.stats.incr("duck_pond.tally.seed")
+        self._store_tally(message.id, tally)
+        return tally
+
+    def _store_tally(self, message_id: int, tally: DuckTally) -> None:
+        """Track `tally`, forgetting the least recently used tallies if too many are tracked."""
+        self.tallies[message_id] = tally
+        self.tallies.move_to_end(message_id)
+        while len(self.tallies) > MAX_TRACKED_MESSAGES:
+            self.tallies.popitem(last=False)
+
+    async def get_tally(self, message_id: int) -> DuckTally | None:
+        """Return the tracked tally of the message, waiting for it if it's being seeded."""
+        if (task := self._seeding.get(message_id)) is not None:
+            try:
+                return await asyncio.shield(task)
+            except Exception:
+                return None
+
+        if (tally := self.tallies.get(message_id)) is not None:
+            self.tallies.move_to_end(message_id)
+            self.bot.stats.incr("duck_pond.tally.hit")
+        return tally
+
+    async def get_or_seed_tally(self, message: discord.PartialMessage) -> tuple[DuckTally, Message | None] | None:
         """
-        Count the number of ducks in the reactions of a specific message.
+        Return the tally of `message`, seeding it if it isn't tracked.
 
-        Only counts ducks added by staff members.
+        The full message is also returned if it had to be fetched. None is returned if the message was deleted.
         """
-        return await count_unique_users_reaction(
-            message,
-            lambda r: self._is_duck_emoji(r.emoji),
-            self.is_staff,
-            False
-        )
+        if (tally := await self.get_tally(message.id)) is not None:
+            return tally, None
+
+        try:
+            full_message = await message.fetch()
+        except discord.NotFound:
+            return None  # Message was deleted.
+
+        # Concurrent events for this message wait for this task instead of seeding it again
+        task = asyncio.create_task(self.seed_tally(full_message))
+        self._seeding[message.id] = task
+        try:
+            tally = await task
+        finally:
+            del self._seeding[message.id]
+        return tally, full_message
 
     async def relay_message(self, message: Message) -> None:
         """Relays the message's content and attachments to the duck pond channel."""
@@ -131,9 +205,9 @@ class DuckPond(Cog):
         """
         Determine if a message should be sent to the duck pond.
 
-        This will count the number of duck reactions on the message, and if this amount meets the
-        amount of ducks specified in the config under duck_pond/threshold, it will
-        send the message off to the duck pond.
+        This will update the tally of staff duck reactions on the message, counting them the first time
+        the message is seen, and if this amount meets the amount of ducks specified in the config under
+        duck_pond/threshold, it will send the message off to the duck pond.
         """
         # Ignore other guilds and DMs.
         if payload.guild_id != constants.Guild.id:
@@ -158,48 +232,65 @@ class DuckPond(Cog):
         if not channel.permissions_for(helper_role).view_channel:
             return
 
-        try:
-            message = await channel.fetch_message(payload.message_id)
-        except discord.NotFound:
-            return  # Message was deleted.
-
-        member = discord.utils.get(message.guild.members, id=payload.user_id)
+        member = payload.member or guild.get_member(payload.user_id)
         if not member:
             return  # Member left or wasn't in the cache.
 
-        # Was the message sent by a human staff member?
-        if not self.is_staff(message.author) or message.author.bot:
-            return
-
         # Is the reactor a human staff member?
         if not self.is_staff(member) or member.bot:
             return
 
         # Time to count our ducks!
-        duck_count = await self.count_ducks(message)
+        result = await self.get_or_seed_tally(channel.get_partial_message(payload.message_id))
+        if result is None:
+            return
+        tally, message = result
+
+        # Was the message sent by a human staff member?
+        if not tally.author_is_staff:
+            return
+
+        # A seeded tally already counts this reaction, but adding it again is harmless.
+        tally.add(member.id, str(payload.emoji))
 
         # If we've got more than the required amount of ducks, send the message to the duck_pond.
-        if duck_count >= constants.DuckPond.threshold and message.id not in self.ducked_messages:
-            self.ducked_messages.append(message.id)
+        if tally.count >= constants.DuckPond.threshold and payload.message_id not in self.ducked_messages:
+            self.ducked_messages.append(payload.message_id)
+            if message is None:
+                try:
+                    message = await channel.fetch_message(payload.message_id)
+                except discord.NotFound:
+                    return
             await self.locked_relay(message)
 
     @Cog.listener()
     async def on_raw_reaction_remove(self, payload: RawReactionActionEvent) -> None:
-        """Ensure that people don't remove the green checkmark from duck ponded messages."""
+        """Keep duck tallies up to date, and prevent the green checkmark being removed from duck ponded messages."""
         # Ignore other guilds and DMs.
         if payload.guild_id != constants.Guild.id:
             return
 
+        if self._payload_has_duckpond_emoji(payload.emoji):
+            if (tally := await self.get_tally(payload.message_id)) is not None:
+                tally.remove(payload.user_id, str(payload.emoji))
+            return
+
+        # Prevent the bot's green checkmark from being removed
+        if payload.emoji.name != "✅" or payload.user_id != self.bot.user.id:
+            return
+
         channel = discord.utils.get(self.bot.get_all_channels(), id=payload.channel_id)
         if channel is None:
             return
 
-        # Prevent the green checkmark from being removed
-        if payload.emoji.name == "✅":
-            message = await channel.fetch_message(payload.message_id)
-            duck_count = await self.count_ducks(message)
-            if duck_count >= constants.DuckPond.threshold:
-                await message.add_reaction("✅")
+        message = channel.get_partial_message(payload.message_id)
+        result = await self.get_or_seed_tally(message)
+        if result is None:
+            return
+        tally, _ = result
+
+        if tally.count >= constants.DuckPond.threshold:
+            await message.add_reaction("✅")
 
     @command(name="duckify", aliases=("duckpond", "pondify"))
     @has_any_role(constants.Roles.admins)
@@ -0,0 +1,123 @@
+"""Tracks the activity in open help posts, so it doesn't need to be fetched from their history."""
+import json
+from dataclasses import dataclass, field
+from datetime import datetime
+
+import discord
+
+import bot
+from bot.exts.help_channels import _caches
+from bot.log import get_logger
+
+log = get_logger(__name__)
+
+# The most messages that can be fetched in one API call.
+HISTORY_SCAN_LIMIT = 100
+
+
+@dataclass
+class PostActivity:
+    """The activity in a help post."""
+
+    last_message_id: int
+    # The last message from the post's owner, not counting the starter message.
+    last_owner_message_id: int | None = None
+    # Non-bot authors of messages in the post.
+    participant_ids: set[int] = field(default_factory=set)
+    # The number of messages in the post, not counting the starter message, capped at `HISTORY_SCAN_LIMIT`.
+    message_count: int = 0
+
+    @property
+    def last_message_at(self) -> datetime:
+        """The time the last message was sent."""
+        return discord.utils.snowflake_time(self.last_message_id)
+
+    def to_json(self) -> str:
+        """Serialise the activity for the cache."""
+        return json.dumps({
+            "last_message_id": self.last_message_id,
+            "last_owner_message_id": self.last_owner_message_id,
+            "participant_ids": list(self.participant_ids),
+            "message_count": self.message_count,
+        })
+
+    @classmethod
+    def from_json(cls, data: str) -> PostActivity:
+        """Deserialise activity from the cache."""
+        data = json.loads(data)
+        return cls(
+            last_message_id=data["last_message_id"],
+            last_owner_message_id=data["last_owner_message_id"],
+            participant_ids=set(data["participant_ids"]),
+            message_count=data["message_count"],
+        )
+
+    def add_message(self, post: discord.Thread, message: discord.Message) -> None:
+        """Update the activity with a `message` in `post`. Messages may be added in any order."""
+        self.last_message_id = max(self.last_message_id, message.id)
+        if not message.author.bot:
+            self.participant_ids.add(message.author.id)
+        if message.id == post.id:
+            # The starter message may be added by both a scan and the message listener, so it's never counted.
+            return
+        if message.author.id == post.owner_id:
+            self.last_owner_message_id = max(self.last_owner_message_id or message.id, message.id)
+        self.message_count = min(self.message_count + 1, HISTORY_SCAN_LIMIT)
+
+
+# The activity of each open post, by post ID.
+_activities: dict[int, PostActivity] = {}
+
+
+async def load(open_post_ids: set[int]) -> None:
+    """Restore the activity of the `open_post_ids` from the cache, and drop the activity of any other post."""
+    _activities.clear()
+    for post_id, data in (await _caches.post_activity.to_dict()).items():
+        if post_id in open_post_ids:
+            _activities[post_id] = PostActivity.from_json(data)
+        else:
+            await _caches.post_activity.delete(post_id)
+    log.trace(f"Restored the activity of {len(_activities)} help posts.")
+
+
+async def record_message(post: discord.Thread, message: discord.Message) -> None:
+    """Record a new `message` in `post`."""
+    activity = _activities.get(post.id)
+    if activity is None:
+        if message.id != post.id:
+            # Earlier messages are unknown, so leave the post to be scanned when its activity is needed.
+            return
+        activity = _activities[post.id] = PostActivity(last_message_id=post.id)
+
+    activity.add_message(post, message)
+    await _caches.post_activity.set(post.id, activity.to_json())
+
+
+async def get_activity(post: discord.Thread) -> PostActivity:
+    """
+    Return the activity in `post`.
+
+    The activity is scanned from the post's last messages if it isn't tracked, or if messages were missed,
+    e.g. while the bot was offline. It's tracked from then on.
+    """
+    activity = _activities.get(post.id)
+
+    if activity is not None and post.last_message_id is not None and post.last_message_id > activity.last_message_id:
+        log.trace(f"Messages in post #{post} ({post.id}) were missed; its activity will be scanned again.")
+        activity = None
+
+    if activity is None:
+        bot.instance.stats.incr("help.activity.scans")
+        activity = PostActivity(last_message_id=post.id)
+        async for message in post.history(limit=HISTORY_SCAN_LIMIT, oldest_first=False):
+            activity.add_message(post, message)
+        _activities[post.id] = activity
+        await _caches.post_activity.set(post.id, activity.to_json())
+
+    return activity
+
+
+async def forget(post_id: int) -> None:
+    """Stop tracking the activity of the post with `post_id`."""
+    _activities.pop(post_id, None)
+    await _caches.post_activity.delete(post_id)
@@ -3,3 +3,7 @@ from async_rediscache import RedisCache
 # Stores posts that have had a non-claimant, non-bot, reply.
 # Currently only used to determine whether the post was answered or not when collecting stats.
 posts_with_non_claimant_messages = RedisCache(namespace="HelpChannels.posts_with_non_claimant_messages")
+
+# Stores the activity of each open post, so its idle time can be determined without fetching its history.
+# The values are JSON objects; see `_activity.PostActivity`.
+post_activity = RedisCache(namespace="HelpChannels.post_activity")
@@ -8,7 +8,7 @@ from pydis_core.utils.channel import get_or_fetch_channel
 
 import bot
 from bot import constants
-from bot.exts.help_channels import _stats
+from bot.exts.help_channels import _activity, _stats
 from bot.log import get_logger
 
 log = get_logger(__name__)
@@ -65,11 +65,8 @@ async def _close_help_post(
     # Include a ping in the close message if no one else engages, to encourage them
     # to read the guide for asking better questions
     if closing_reason == _stats.ClosingReason.INACTIVE and closed_post.owner is not None:
-        participant_ids = {
-            message.author.id async for message in closed_post.history(limit=100, oldest_first=False)
-            if not message.author.bot
-        }
-        if participant_ids == {closed_post.owner_id}:
+        activity = await _activity.get_activity(closed_post)
+        if activity.participant_ids == {closed_post.owner_id}:
             message = closed_post.owner.mention
 
     try:
@@ -85,6 +82,7 @@ async def _close_help_post(
     )
     if closed_post.id in scheduler:
         scheduler.cancel(closed_post.id)
+    await _activity.forget(closed_post.id)
 
     _stats.report_post_count()
     await _stats.report_complete_session(closed_post, closing_reason)
@@ -138,6 +136,7 @@ async def help_post_closed(closed_post: discord.Thread, scheduler: scheduling.Sc
 
 async def help_post_archived(archived_post: discord.Thread, scheduler: scheduling.Scheduler) -> None:
     """Apply archive logic to an archived help forum post."""
+    await _activity.forget(archived_post.id)
     async for thread_update in archived_post.guild.audit_logs(limit=50, action=discord.AuditLogAction.thread_update):
         if thread_update.target.id != archived_post.id:
             continue
@@ -153,6 +152,7 @@ async def help_post_archived(archived_post: discord.Thread, scheduler: schedulin
 async def help_post_deleted(deleted_post_event: discord.RawThreadDeleteEvent) -> None:
     """Record appropriate stats when a help post is deleted."""
     _stats.report_post_count()
+    await _activity.forget(deleted_post_event.thread_id)
     cached_post = deleted_post_event.thread
     if cached_post and not cached_post.archived:
         # If the post is in the bot's cache, and it was not archived before deleting,
@@ -165,26 +165,28 @@ async def get_closing_time(post: discord.Thread) -> tuple[arrow.Arrow, _stats.Cl
     Return the time at which the given help `post` should be closed along with the reason.
 
     The time is calculated by first checking if the opening message is deleted.
-    If it is, then get the last 100 messages (the most that can be fetched in one API call).
-    If less than 100 message are returned, and none are from the post owner, then assume the poster
-        has sent no further messages and close deleted_idle_minutes after the post creation time.
+    If it is, and the post has less than 100 messages (the most that can be fetched in one API call),
+        none of which are from the post owner, then assume the poster has sent no further messages
+        and close deleted_idle_minutes after the post creation time.
 
     Otherwise, use the most recent message's create_at date and add `idle_minutes_claimant`.
+
+    The post's messages are known from its tracked activity, see `_activity.get_activity`.
     """
     try:
         starter_message = post.starter_message or await post.fetch_message(post.id)
     except discord.NotFound:
         starter_message = None
 
-    last_100_messages = [message async for message in post.history(limit=100, oldest_first=False)]
+    activity = await _activity.get_activity(post)
 
-    if starter_message is None and len(last_100_messages) < 100:
-        if not discord.utils.get(last_100_messages, author__id=post.owner_id):
+    if starter_message is None and activity.message_count < _activity.HISTORY_SCAN_LIMIT:
+        if activity.last_owner_message_id is None:
             time = arrow.Arrow.fromdatetime(post.created_at)
             time += timedelta(minutes=constants.HelpChannels.deleted_idle_minutes)
             return time, _stats.ClosingReason.DELETED
 
-    time = arrow.Arrow.fromdatetime(last_100_messages[0].created_at)
+    time = arrow.Arrow.fromdatetime(activity.last_message_at)
     time += timedelta(minutes=constants.HelpChannels.idle_minutes)
     return time, _stats.ClosingReason.INACTIVE
 
@@ -8,7 +8,7 @@ from pydis_core.utils import scheduling
 
 from bot import constants
 from bot.bot import Bot
-from bot.exts.help_channels import _caches, _channel
+from bot.exts.help_channels import _activity, _caches, _channel
 from bot.log import get_logger
 from bot.utils.checks import has_any_role_check
 
@@ -40,6 +40,7 @@ class HelpForum(commands.Cog):
         self.help_forum_channel = self.bot.get_channel(constants.Channels.python_help)
         if not isinstance(self.help_forum_channel, discord.ForumChannel):
             raise TypeError("Channels.python_help is not a forum channel!")
+        await _activity.load({post.id for post in self.help_forum_channel.threads})
         self.check_all_open_posts_have_close_task.start()
 
     @tasks.loop(minutes=5)
@@ -141,6 +142,8 @@ class HelpForum(commands.Cog):
         if not _channel.is_help_forum_post(message.channel):
             return
 
+        await _activity.record_message(message.channel, message)
+
         if not message.author.bot and message.author.id != message.channel.owner_id:
             await _caches.posts_with_non_claimant_messages.set(message.channel.id, "sentinel")
 
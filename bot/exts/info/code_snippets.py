@@ -1,7 +1,10 @@
+import asyncio
 import logging
 import re
 import textwrap
-from typing import Any
+import time
+from collections.abc import Awaitable, Callable
+from typing import Any, NamedTuple
 from urllib.parse import quote_plus
 
 import discord
@@ -12,6 +15,7 @@ from discord.ext.commands import Cog
 from bot.bot import Bot
 from bot.constants import Channels, Keys
 from bot.log import get_logger
+from bot.utils.caching import TTLCache
 from bot.utils.messages import wait_for_deletion
 
 log = get_logger(__name__)
@@ -48,6 +52,25 @@ PYDIS_PASTEBIN_RE = re.compile(
 
 PASTEBIN_LINE_SELECTION_RE = re.compile(r"(\d+)L(\d+)-L(\d+)")
 
+# Maximum number of snippets fetched at once for a single message
+MAX_CONCURRENT_FETCHES = 3
+
+# Responses are reused without any request for `RESPONSE_FRESH_SECONDS` after being fetched.
+# Afterwards they're kept for up to `RESPONSE_CACHE_SECONDS`, and revalidated with their ETag when requested again.
+RESPONSE_FRESH_SECONDS = 5 * 60
+RESPONSE_CACHE_SECONDS = 24 * 60 * 60
+RESPONSE_CACHE_SIZE = 256
+# Text responses longer than this are not cached, to bound the memory used by the cache
+MAX_CACHED_TEXT_LENGTH = 512 * 1024
+
+
+class CachedResponse(NamedTuple):
+    """A response body cached by `CodeSnippets._fetch_response`."""
+
+    body: Any
+    etag: str | None
+    fresh_until: float
+
 
 class CodeSnippets(Cog):
     """
@@ -59,6 +82,8 @@ class CodeSnippets(Cog):
     def __init__(self, bot: Bot):
         """Initializes the cog's bot."""
         self.bot = bot
+        # Maps request URLs, which include the repo, ref and file path, to their cached response
+        self._response_cache: TTLCache[str, CachedResponse] = TTLCache(RESPONSE_CACHE_SIZE, RESPONSE_CACHE_SECONDS)
 
         self.pattern_handlers = [
             (GITHUB_RE, self._fetch_github_snippet),
@@ -68,14 +93,40 @@ class CodeSnippets(Cog):
             (PYDIS_PASTEBIN_RE, self._fetch_pastebin_snippets),
         ]
 
-    async def _fetch_response(self, url: str, response_format: str, **kwargs) -> Any:
-        """Makes http requests using aiohttp."""
-        async with self.bot.http_session.get(url, raise_for_status=True, **kwargs) as response:
-            if response_format == "text":
-                return await response.text()
-            if response_format == "json":
-                return await response.json()
-            return None
+    async def _fetch_response(self, url: str, response_format: str, headers: dict | None = None, **kwargs) -> Any:
+        """
+        Makes http requests using aiohttp.
+
+        Responses are cached by URL. A cached response is returned as is while it's fresh,
+        and afterwards it's revalidated with a conditional request if the server sent an ETag,
+        so an unchanged file costs a 304 instead of a full download (and no GitHub rate limit).
+        """
+        cached = self._response_cache.get(url)
+        if cached is not None and time.monotonic() < cached.fresh_until:
+            return cached.body
+
+        headers = dict(headers or {})
+        if cached is not None and cached.etag is not None:
+            headers["If-None-Match"] = cached.etag
+
+        async with self.bot.http_session.get(url, raise_for_status=True, headers=headers, **kwargs) as response:
+            etag = response.headers.get("ETag")
+            if response.status == 304 and cached is not None:
+                body = cached.body
+                # A 304 isn't required to repeat the ETag, in which case the cached one still applies.
+                etag = etag or cached.etag
+            elif response_format == "text":
+                body = await response.text()
+            elif response_format == "json":
+                body = await response.json()
+            else:
+                return None
+            # Other successful statuses, such as partial content, don't hold the full response for the URL.
+            cacheable = response.status == 200 or (response.status == 304 and cached is not None)
+
+        if cacheable and not (isinstance(body, str) and len(body) > MAX_CACHED_TEXT_LENGTH):
+            self._response_cache.set(url, CachedResponse(body, etag, time.monotonic() + RESPONSE_FRESH_SECONDS))
+        return body
 
     def _find_ref(self, path: str, refs: tuple) -> tuple:
         """Loops through all branches and tags to find the required ref."""
@@ -98,12 +149,10 @@ class CodeSnippets(Cog):
     ) -> str:
         """Fetches a snippet from a GitHub repo."""
         # Search the GitHub API for the specified branch
-        branches = await self._fetch_response(
-            f"https://api.github.com/repos/{repo}/branches",
-            "json",
-            headers=GITHUB_HEADERS
+        branches, tags = await asyncio.gather(
+            self._fetch_response(f"https://api.github.com/repos/{repo}/branches", "json", headers=GITHUB_HEADERS),
+            self._fetch_response(f"https://api.github.com/repos/{repo}/tags", "json", headers=GITHUB_HEADERS),
         )
-        tags = await self._fetch_response(f"https://api.github.com/repos/{repo}/tags", "json", headers=GITHUB_HEADERS)
         refs = branches + tags
         ref, file_path = self._find_ref(path, refs)
 
@@ -150,11 +199,10 @@ class CodeSnippets(Cog):
         enc_repo = quote_plus(repo)
 
         # Searches the GitLab API for the specified branch
-        branches = await self._fetch_response(
-            f"https://gitlab.com/api/v4/projects/{enc_repo}/repository/branches",
-            "json"
+        branches, tags = await asyncio.gather(
+            self._fetch_response(f"https://gitlab.com/api/v4/projects/{enc_repo}/repository/branches", "json"),
+            self._fetch_response(f"https://gitlab.com/api/v4/projects/{enc_repo}/repository/tags", "json"),
         )
-        tags = await self._fetch_response(f"https://gitlab.com/api/v4/projects/{enc_repo}/repository/tags", "json")
         refs = branches + tags
         ref, file_path = self._find_ref(path, refs)
         enc_ref = quote_plus(ref)
@@ -270,8 +318,12 @@ class CodeSnippets(Cog):
         return f"{ret}``` ```"
 
     async def _parse_snippets(self, content: str) -> str:
-        """Parse message content and return a string with a code block for each URL found."""
-        all_snippets = []
+        """
+        Parse message content and return a string with a code block for each URL found.
+
+        The snippets are fetched concurrently, at most `MAX_CONCURRENT_FETCHES` at a time.
+        """
+        matches = []
 
         for pattern, handler in self.pattern_handlers:
             for match in pattern.finditer(content):
@@ -289,22 +341,38 @@ class CodeSnippets(Cog):
                             unsanitized
                         )
                         continue
-                try:
-                    result = await handler(**match.groupdict())
-                except ClientResponseError as error:
-                    error_message = error.message
-                    log.log(
-                        logging.DEBUG if error.status == 404 else logging.ERROR,
-                        f"Failed to fetch code snippet from {match[0]!r}: {error.status} "
-                        f"{error_message} for GET {error.request_info.real_url.human_repr()}"
-                    )
-                    continue
-
-                if isinstance(result, list):
-                    # The handler returned multiple snippets (currently only possible with our pastebin)
-                    all_snippets.extend((match.start(), snippet) for snippet in result)
-                else:
-                    all_snippets.append((match.start(), result))
+                matches.append((handler, match))
+
+        semaphore = asyncio.Semaphore(MAX_CONCURRENT_FETCHES)
+
+        async def fetch_snippet(
+            handler: Callable[..., Awaitable[str | list[str]]],
+            match: re.Match
+        ) -> str | list[str] | None:
+            try:
+                async with semaphore:
+                    return await handler(**match.groupdict())
+            except ClientResponseError as error:
+                error_message = error.message
+                log.log(
+                    logging.DEBUG if error.status == 404 else logging.ERROR,
+                    f"Failed to fetch code snippet from {match[0]!r}: {error.status} "
+                    f"{error_message} for GET {error.request_info.real_url.human_repr()}"
+                )
+                return None
+
+        results = await asyncio.gather(*(fetch_snippet(handler, match) for handler, match in matches))
+
+        all_snippets = []
+        for (_, match), result in zip(matches, results, strict=True):
+            if result is None:
+                continue
+
+            if isinstance(result, list):
+                # The handler returned multiple snippets (currently only possible with our pastebin)
+                all_snippets.extend((match.start(), snippet) for snippet in result)
+            else:
+                all_snippets.append((match.start(), result))
 
         # Sort the list of snippets by ONLY their match index
         all_snippets.sort(key=lambda item: item[0])
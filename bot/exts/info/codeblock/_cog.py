@@ -1,3 +1,4 @@
+import asyncio
 import time
 
 import discord
@@ -17,6 +18,14 @@ from bot.utils.messages import wait_for_deletion
 
 log = get_logger(__name__)
 
+# Content longer than this is parsed in a worker thread instead of on the event loop
+OFFLOAD_PARSE_LENGTH = 1000
+# Content longer than this is never parsed
+MAXIMUM_PARSE_LENGTH = 10_000
+# How long to wait for content parsed in a worker thread, in seconds.
+# The thread can't be stopped, so it keeps running after a timeout; `MAXIMUM_PARSE_LENGTH` bounds for how long.
+PARSE_TIMEOUT = 2
+
 
 class CodeBlockCog(Cog, name="Code Block"):
     """
@@ -60,6 +69,9 @@ class CodeBlockCog(Cog, name="Code Block"):
         # Maps users' messages to the messages the bot sent with instructions.
         self.codeblock_message_ids = {}
 
+        # The last parse which timed out, whose worker thread may still be running.
+        self.timed_out_parse: asyncio.Future | None = None
+
     @staticmethod
     def create_embed(instructions: str) -> discord.Embed:
         """Return an embed which displays code block formatting `instructions`."""
@@ -118,6 +130,35 @@ class CodeBlockCog(Cog, name="Code Block"):
         # Increase amount of codeblock correction in stats
         self.bot.stats.incr("codeblock_corrections")
 
+    async def parse_instructions(self, content: str) -> str | None:
+        """
+        Return code block formatting instructions for `content`, or None if nothing is wrong with it.
+
+        Content over `OFFLOAD_PARSE_LENGTH` characters is parsed in a worker thread, and given up on after
+        `PARSE_TIMEOUT` seconds. Content over `MAXIMUM_PARSE_LENGTH` characters isn't parsed at all.
+        While the thread of a parse which timed out is still running, no other content is offloaded,
+        so pathological content can't tie up more than one worker thread at a time.
+        """
+        if len(content) > MAXIMUM_PARSE_LENGTH:
+            log.trace("Skipping code block detection: content is too long.")
+            return None
+
+        if len(content) <= OFFLOAD_PARSE_LENGTH:
+            return get_instructions(content)
+
+        if self.timed_out_parse is not None and not self.timed_out_parse.done():
+            log.trace("Skipping code block detection: a parse which timed out is still running.")
+            return None
+
+        future = self.bot.loop.run_in_executor(None, get_instructions, content)
+        try:
+            # Shielded, so the future is only done once the thread actually finished.
+            return await asyncio.wait_for(asyncio.shield(future), PARSE_TIMEOUT)
+        except TimeoutError:
+            log.info(f"Code block detection timed out for content of length {len(content)}.")
+            self.timed_out_parse = future
+            return None
+
     def should_parse(self, message: discord.Message) -> bool:
         """
         Return True if `message` should be parsed.
@@ -149,7 +190,7 @@ class CodeBlockCog(Cog, name="Code Block"):
             log.trace(f"Skipping code block detection of {msg.id}: #{msg.channel} is on cooldown.")
             return
 
-        instructions = get_instructions(msg.content)
+        instructions = await self.parse_instructions(msg.content)
         if instructions:
             await self.send_instructions(msg, instructions)
 
@@ -170,7 +211,7 @@ class CodeBlockCog(Cog, name="Code Block"):
 
         # Parse the message to see if the code blocks have been fixed.
         content = payload.data.get("content")
-        instructions = get_instructions(content)
+        instructions = await self.parse_instructions(content)
 
         bot_message = await self.get_sent_instructions(payload)
         if not bot_message:
@@ -1,6 +1,7 @@
 """This module provides functions for parsing Markdown code blocks."""
 
 import ast
+import functools
 import re
 import textwrap
 from collections.abc import Sequence
@@ -28,6 +29,13 @@ _TICKS = {
     "\u3003",  # VERTICAL KANA REPEAT MARK UPPER HALF
 }
 
+# Any Python statement other than an expression contains one of these, so content without them is never parsed.
+# It's either a compound statement or assignment containing ":" or "=", or a simple statement starting with a keyword.
+_RE_STATEMENT_HINT = re.compile(
+    r"[=:]|(?:^|;)[ \t\f]*(?:import|from|return|raise|assert|del|pass|break|continue|global|nonlocal)\b",
+    re.MULTILINE
+)
+
 _RE_PYTHON_REPL = re.compile(r"^(>>>|\.\.\.)( |$)")
 _RE_IPYTHON_REPL = re.compile(r"^((In|Out) \[\d+\]: |\s*\.{3,}: ?)")
 
@@ -103,6 +111,10 @@ def find_code_blocks(message: str) -> Sequence[CodeBlock] | None:
 def _is_python_code(content: str) -> bool:
     """Return True if `content` is valid Python consisting of more than just expressions."""
     log.trace("Checking if content is Python code.")
+    if not _RE_STATEMENT_HINT.search(content):
+        log.trace("Code has no statements other than expressions.")
+        return False
+
     try:
         # Remove null bytes because they cause ast.parse to raise a ValueError.
         content = content.replace("\x00", "")
@@ -150,8 +162,14 @@ def _is_repl_code(content: str, threshold: int = 3) -> bool:
     return False
 
 
+@functools.lru_cache(maxsize=256)
 def is_python_code(content: str) -> bool:
-    """Return True if `content` is valid Python code or (I)Python REPL output."""
+    """
+    Return True if `content` is valid Python code or (I)Python REPL output.
+
+    Results are memoised, so re-checking the same content, like when a message is edited
+    without its code changing, doesn't parse it again.
+    """
     dedented = textwrap.dedent(content)
 
     # Parse AST twice in case _fix_indentation ends up breaking code due to its inaccuracies.
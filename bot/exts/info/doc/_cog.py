@@ -10,6 +10,7 @@ import aiohttp
 import discord
 from discord.ext import commands
 from pydis_core.site_api import ResponseCodeError
+from pydis_core.utils import scheduling
 from pydis_core.utils.scheduling import Scheduler
 
 from bot.bot import Bot
@@ -65,11 +66,22 @@ class DocCog(commands.Cog):
         self.refresh_event = asyncio.Event()
         self.refresh_event.set()
         self.symbol_get_event = SharedEvent()
+        self.initial_refresh_task: asyncio.Task | None = None
 
     async def cog_load(self) -> None:
-        """Refresh documentation inventory on cog initialization."""
-        await self.bot.wait_until_guild_available()
-        await self.refresh_inventories()
+        """Refresh documentation inventory in the background once all extensions have loaded."""
+        # Symbol lookups wait on this until the first refresh is done.
+        self.refresh_event.clear()
+        self.initial_refresh_task = scheduling.create_task(self._initial_refresh())
+
+    async def _initial_refresh(self) -> None:
+        """Refresh the inventories without holding up the loading of other extensions."""
+        try:
+            await self.bot.wait_until_guild_available()
+            await self.bot.wait_until_extensions_loaded()
+            await self.refresh_inventories()
+        finally:
+            self.refresh_event.set()
 
     def update_single(self, package_name: str, base_url: str, inventory: InventoryDict) -> None:
         """
@@ -451,5 +463,7 @@ class DocCog(commands.Cog):
 
     async def cog_unload(self) -> None:
         """Clear scheduled inventories, queued symbols and cleanup task on cog unload."""
+        if self.initial_refresh_task is not None:
+            self.initial_refresh_task.cancel()
         self.inventory_scheduler.cancel_all()
         await self.item_fetcher.clear()
@@ -1,8 +1,9 @@
+import asyncio
 import colorsys
 import pprint
 import textwrap
 from collections import defaultdict
-from collections.abc import Mapping
+from collections.abc import Awaitable, Callable, Mapping
 from textwrap import shorten
 from typing import Any, TYPE_CHECKING
 
@@ -24,6 +25,7 @@ from bot.errors import NonExistentRoleError
 from bot.log import get_logger
 from bot.pagination import LinePaginator
 from bot.utils import time
+from bot.utils.caching import TTLCache
 from bot.utils.channel import is_mod_channel, is_staff_channel
 from bot.utils.checks import cooldown_with_role_bypass, has_no_roles_check, in_whitelist_check
 from bot.utils.messages import send_denial
@@ -36,6 +38,11 @@ DEFAULT_RULES_DESCRIPTION = (
     " all members of the community to have read and understood these."
 )
 
+# How long site data shown in the `!user` embed is cached for, in seconds.
+# Writes made through the bot invalidate the cache early, see `on_user_info_update`.
+USER_INFO_CACHE_TTL = 60
+USER_INFO_CACHE_SIZE = 256
+
 if TYPE_CHECKING:
     from bot.exts.moderation.defcon import Defcon
     from bot.exts.moderation.watchchannels.bigbrother import BigBrother
@@ -47,6 +54,8 @@ class Information(Cog):
 
     def __init__(self, bot: Bot):
         self.bot = bot
+        # Maps a user ID to a mapping of the site data fetched for that user, keyed by the field or data name
+        self.user_info_cache: TTLCache[int, dict[str, Any]] = TTLCache(USER_INFO_CACHE_SIZE, USER_INFO_CACHE_TTL)
 
     @staticmethod
     def get_channel_type_counts(guild: Guild) -> defaultdict[str, int]:
@@ -264,7 +273,26 @@ class Information(Cog):
 
     async def create_user_embed(self, ctx: Context, user: MemberOrUser, passed_as_message: bool) -> Embed:
         """Creates an embed containing information on the `user`."""
-        on_server = bool(await get_or_fetch_member(ctx.guild, user.id))
+        # Show more verbose output in moderation channels for infractions and nominations
+        if is_mod_channel(ctx.channel):
+            site_fields = (
+                ("messages", self.user_messages),
+                ("expanded_infractions", self.expanded_user_infraction_counts),
+                ("nominations", self.user_nomination_counts),
+                ("alts", self.user_alt_count),
+            )
+        else:
+            site_fields = (
+                ("messages", self.user_messages),
+                ("basic_infractions", self.basic_user_infraction_counts),
+            )
+
+        # None of these depend on each other, so fetch them all at once.
+        member, *site_field_values = await asyncio.gather(
+            get_or_fetch_member(ctx.guild, user.id),
+            *(self._get_cached_user_info(user.id, key, fetch, user) for key, fetch in site_fields)
+        )
+        on_server = bool(member)
 
         created = time.format_relative(user.created_at)
 
@@ -317,17 +345,9 @@ class Information(Cog):
                 "Member information",
                 membership
             ),
-            await self.user_messages(user),
+            *site_field_values,
         ]
 
-        # Show more verbose output in moderation channels for infractions and nominations
-        if is_mod_channel(ctx.channel):
-            fields.append(await self.expanded_user_infraction_counts(user))
-            fields.append(await self.user_nomination_counts(user))
-            fields.append(await self.user_alt_count(user))
-        else:
-            fields.append(await self.basic_user_infraction_counts(user))
-
         # Let's build the embed now
         embed = Embed(
             title=name,
@@ -342,6 +362,37 @@ class Information(Cog):
 
         return embed
 
+    async def _get_cached_user_info[T](
+        self,
+        user_id: int,
+        key: str,
+        fetch: Callable[..., Awaitable[T]],
+        *args,
+    ) -> T:
+        """
+        Return the `key` site data for `user_id` from the cache, or await `fetch(*args)` to get it.
+
+        The data for a user is cached for `USER_INFO_CACHE_TTL` seconds,
+        unless it's invalidated earlier by an `on_user_info_update` event.
+        """
+        user_info = self.user_info_cache.get(user_id)
+        if user_info is None:
+            user_info = {}
+            self.user_info_cache.set(user_id, user_info)
+
+        if key not in user_info:
+            user_info[key] = await fetch(*args)
+        return user_info[key]
+
+    @Cog.listener()
+    async def on_user_info_update(self, user_id: int) -> None:
+        """
+        Drop the cached site data of the user with the given ID.
+
+        This event is dispatched whenever an infraction, nomination or alt of the user is written through the bot.
+        """
+        self.user_info_cache.pop(user_id)
+
     async def user_alt_count(self, user: MemberOrUser) -> tuple[str, int | str]:
         """Get the number of alts for the given member."""
         try:
@@ -355,7 +406,6 @@ class Information(Cog):
             # If we have any other issue, re-raise the exception
             raise e
 
-
     async def basic_user_infraction_counts(self, user: MemberOrUser) -> tuple[str, str]:
         """Gets the total and active infraction counts for the given `member`."""
         infractions = await self.bot.api_client.get(
@@ -1,4 +1,6 @@
+import asyncio
 import re
+import time
 import typing as t
 from datetime import UTC, datetime, timedelta
 
@@ -24,6 +26,9 @@ THREAD_URL = "https://mail.python.org/archives/list/{list}@python.org/thread/{id
 
 AVATAR_URL = "https://www.python.org/static/opengraph-icon-200x200.png"
 
+# Maximum number of mailing list threads fetched at the same time.
+MAX_CONCURRENT_THREAD_FETCHES = 5
+
 # By first matching everything within a codeblock,
 # when matching markdown it won't be within a codeblock
 MARKDOWN_REGEX = re.compile(
@@ -35,6 +40,13 @@ MARKDOWN_REGEX = re.compile(
 log = get_logger(__name__)
 
 
+class Page(t.NamedTuple):
+    """A fetched page, along with the validators to request it conditionally next time."""
+
+    text: str
+    validators: dict[str, str]
+
+
 class PythonNews(Cog):
     """Post new PEPs and Python News to `#python-news`."""
 
@@ -43,6 +55,12 @@ class PythonNews(Cog):
         self.webhook_names = {}
         self.webhook: discord.Webhook | None = None
         self.seen_items: dict[str, set[str]] = {}
+        # Validators of each polled page's last fully processed response, used for conditional requests.
+        self.page_validators: dict[str, dict[str, str]] = {}
+        # Threads which were fetched but won't ever be posted, by mailing list.
+        self.skipped_threads: dict[str, set[str]] = {}
+        # Requests made during the current fetch cycle.
+        self.request_count = 0
 
     async def cog_load(self) -> None:
         """Load all existing seen items from db and create any missing mailing lists."""
@@ -82,9 +100,39 @@ class PythonNews(Cog):
         if not self.webhook:
             await self.get_webhooks()
 
+        start = time.monotonic()
+        self.request_count = 0
+
         await self.post_maillist_news()
         await self.post_pep_news()
 
+        self.bot.stats.timing("python_news.cycle_duration", (time.monotonic() - start) * 1000)
+        self.bot.stats.gauge("python_news.cycle_requests", self.request_count)
+
+    async def fetch_page(self, url: str, encoding: str | None = None) -> Page | None:
+        """
+        Fetch the page at `url`, or return None if it hasn't changed since it was last processed.
+
+        The page's validators are only stored for the next request once the caller has processed it.
+        """
+        headers = {}
+        if validators := self.page_validators.get(url):
+            if "ETag" in validators:
+                headers["If-None-Match"] = validators["ETag"]
+            if "Last-Modified" in validators:
+                headers["If-Modified-Since"] = validators["Last-Modified"]
+
+        self.request_count += 1
+        async with self.bot.http_session.get(url, headers=headers) as resp:
+            if resp.status == 304:
+                log.trace(f"{url} hasn't changed since it was last fetched.")
+                return None
+
+            text = await resp.text(encoding)
+            validators = {key: resp.headers[key] for key in ("ETag", "Last-Modified") if key in resp.headers}
+
+        return Page(text, validators)
+
     @staticmethod
     def escape_markdown(content: str) -> str:
         """Escape the markdown underlines and spoilers that aren't in codeblocks."""
@@ -95,8 +143,11 @@ class PythonNews(Cog):
 
     async def post_pep_news(self) -> None:
         """Fetch new PEPs and when they don't have announcement in #python-news, create it."""
-        async with self.bot.http_session.get(PEPS_RSS_URL) as resp:
-            data = feedparser.parse(await resp.text("utf-8"))
+        page = await self.fetch_page(PEPS_RSS_URL, "utf-8")
+        if page is None:
+            return
+
+        data = await self.bot.loop.run_in_executor(None, feedparser.parse, page.text)
 
         pep_numbers = self.seen_items["pep"]
 
@@ -140,48 +191,97 @@ class PythonNews(Cog):
                 log.trace("Publishing PEP announcement because it was in a news channel")
                 await msg.publish()
 
+        self.page_validators[PEPS_RSS_URL] = page.validators
+
+    @staticmethod
+    def parse_recent_threads(text: str) -> list[str]:
+        """Return the identifiers of the threads listed in the recent threads page `text` of a mailing list."""
+        recents = BeautifulSoup(text, features="lxml")
+
+        # When a <p> element is present in the response then the mailing list
+        # has not had any activity during the current month, so therefore it
+        # can be ignored.
+        if recents.p:
+            return []
+
+        return [
+            thread["href"].split("/")[-2]
+            for thread in recents.html.body.div.find_all("a", href=True)
+            # We want only these threads that have identifiers
+            if "latest" not in thread["href"]
+        ]
+
+    async def fetch_new_threads(self, maillist: str) -> tuple[Page | None, list[tuple[datetime, t.Any, t.Any]]]:
+        """
+        Fetch the threads of `maillist` which should be posted.
+
+        Return the recent threads page, or None if it hasn't changed, and a list of each new thread's date,
+        thread information and first email information.
+        Threads which are already posted, or were fetched before and rejected, are not fetched.
+        """
+        page = await self.fetch_page(RECENT_THREADS_TEMPLATE.format(name=maillist))
+        if page is None:
+            return None, []
+
+        identifiers = await self.bot.loop.run_in_executor(None, self.parse_recent_threads, page.text)
+
+        skipped = self.skipped_threads.setdefault(maillist, set())
+        # Threads drop off the recent threads page, so there's no need to remember them afterwards.
+        skipped.intersection_update(identifiers)
+        identifiers = [
+            identifier for identifier in identifiers
+            if identifier not in self.seen_items[maillist] and identifier not in skipped
+        ]
+
+        semaphore = asyncio.Semaphore(MAX_CONCURRENT_THREAD_FETCHES)
+
+        async def fetch(identifier: str) -> tuple[t.Any, t.Any]:
+            async with semaphore:
+                return await self.get_thread_and_first_mail(maillist, identifier)
+
+        fetched = await asyncio.gather(*(fetch(identifier) for identifier in identifiers))
+
+        threads = []
+        for identifier, (thread_information, email_information) in zip(identifiers, fetched, strict=True):
+            try:
+                new_date = datetime.strptime(email_information["date"], "%Y-%m-%dT%X%z")
+            except ValueError:
+                log.warning(f"Invalid datetime from Thread email: {email_information['date']}")
+                skipped.add(identifier)
+                continue
+
+            if "Re: " in thread_information["subject"] or new_date.date() < datetime.now(tz=UTC).date():
+                skipped.add(identifier)
+                continue
+
+            threads.append((new_date, thread_information, email_information))
+
+        return page, threads
+
     async def post_maillist_news(self) -> None:
         """Send new maillist threads to #python-news that is listed in configuration."""
+        maillists = []
         for maillist in constants.PythonNews.mail_lists:
             if maillist not in self.seen_items:
                 # If for some reason we have a mailing list that isn't tracked.
                 log.warning("Mailing list %s doesn't exist in the database", maillist)
                 continue
+            maillists.append(maillist)
 
-            async with self.bot.http_session.get(RECENT_THREADS_TEMPLATE.format(name=maillist)) as resp:
-                recents = BeautifulSoup(await resp.text(), features="lxml")
+        # Fetch every list at once, but post them one list at a time, keeping each list's threads together.
+        results = await asyncio.gather(*(self.fetch_new_threads(maillist) for maillist in maillists))
 
-            # When a <p> element is present in the response then the mailing list
-            # has not had any activity during the current month, so therefore it
-            # can be ignored.
-            if recents.p:
+        for maillist, (page, threads) in zip(maillists, results, strict=True):
+            if page is None:
                 continue
 
-            for thread in recents.html.body.div.find_all("a", href=True):
-                # We want only these threads that have identifiers
-                if "latest" in thread["href"]:
-                    continue
-
-                thread_information, email_information = await self.get_thread_and_first_mail(
-                    maillist, thread["href"].split("/")[-2]
-                )
-
-                try:
-                    new_date = datetime.strptime(email_information["date"], "%Y-%m-%dT%X%z")
-                except ValueError:
-                    log.warning(f"Invalid datetime from Thread email: {email_information['date']}")
-                    continue
-
+            for new_date, thread_information, email_information in threads:
                 thread_id = thread_information["thread_id"]
-                if (
-                        thread_id in self.seen_items[maillist]
-                        or "Re: " in thread_information["subject"]
-                        or new_date.date() < datetime.now(tz=UTC).date()
-                ):
+                if thread_id in self.seen_items[maillist]:
                     continue
 
                 content = self.escape_markdown(email_information["content"])
-                link = THREAD_URL.format(id=thread["href"].split("/")[-2], list=maillist)
+                link = THREAD_URL.format(id=thread_id, list=maillist)
 
                 # Build an embed and send a message to the webhook
                 embed = discord.Embed(
@@ -211,6 +311,8 @@ class PythonNews(Cog):
                     log.trace("Publishing mailing list message because it was in a news channel")
                     await msg.publish()
 
+            self.page_validators[RECENT_THREADS_TEMPLATE.format(name=maillist)] = page.validators
+
     async def add_item_to_mail_list(self, mail_list: str, item_identifier: str) -> bool:
         """Adds a new item to a particular mailing_list."""
         try:
@@ -233,6 +335,7 @@ class PythonNews(Cog):
 
     async def get_thread_and_first_mail(self, maillist: str, thread_identifier: str) -> tuple[t.Any, t.Any]:
         """Get mail thread and first mail from mail.python.org based on `maillist` and `thread_identifier`."""
+        self.request_count += 2
         async with self.bot.http_session.get(
                 THREAD_TEMPLATE_URL.format(name=maillist, id=thread_identifier)
         ) as resp:
@@ -1,13 +1,14 @@
 import enum
 import re
 import time
+from collections.abc import Iterator
 from pathlib import Path
 from typing import Literal, NamedTuple
 
 import discord
 import frontmatter
 from discord import Embed, Interaction, Member, app_commands
-from discord.ext.commands import Cog, Context
+from discord.ext.commands import Cog, Context, command, has_any_role
 
 from bot import constants
 from bot.bot import Bot
@@ -38,22 +39,6 @@ class TagIdentifier(NamedTuple):
     group: str | None
     name: str
 
-    def get_fuzzy_score(self, fuzz_tag_identifier: TagIdentifier) -> float:
-        """Get fuzzy score, using `fuzz_tag_identifier` as the identifier to fuzzy match with."""
-        if (self.group is None) != (fuzz_tag_identifier.group is None):
-            # Ignore tags without groups if the identifier has a group and vice versa
-            return .0
-        if self.group == fuzz_tag_identifier.group:
-            # Completely identical, or both None
-            group_score = 1
-        else:
-            group_score = _fuzzy_search(fuzz_tag_identifier.group, self.group)
-
-        fuzzy_score = group_score * _fuzzy_search(fuzz_tag_identifier.name, self.name) * 100
-        if fuzzy_score:
-            log.trace(f"Fuzzy score {fuzzy_score:=06.2f} for tag {self!r} with fuzz {fuzz_tag_identifier!r}")
-        return fuzzy_score
-
     def __str__(self) -> str:
         if self.group is not None:
             return f"{self.group} {self.name}"
@@ -103,26 +88,119 @@ class Tag:
         self._cooldowns[channel] = time.time() + constants.Cooldowns.tags
 
 
-def _fuzzy_search(search: str, target: str) -> float:
-    """A simple scoring algorithm based on how many letters are found / total, with order in mind."""
-    _search = REGEX_NON_ALPHABET.sub("", search.lower())
-    if not _search:
-        return 0
+def _normalize_search(search: str) -> str:
+    """Normalize a search string for `_fuzzy_score`, keeping only its letters."""
+    return REGEX_NON_ALPHABET.sub("", search.lower())
+
+
+def _split_target(target: str) -> tuple[str, ...]:
+    """Split a target string into the words `_fuzzy_score` matches against."""
+    return tuple(REGEX_NON_ALPHABET.split(target.lower()))
 
-    _targets = iter(REGEX_NON_ALPHABET.split(target.lower()))
+
+def _fuzzy_score(search: str, target_parts: tuple[str, ...]) -> float:
+    """
+    A simple scoring algorithm based on how many letters are found / total, with order in mind.
+
+    `search` must be normalized with `_normalize_search`, and `target_parts` split with `_split_target`.
+    """
+    if not search:
+        return 0
 
     current = 0
-    for _target in _targets:
+    for target_part in target_parts:
         index = 0
         try:
-            while index < len(_target) and _search[current] == _target[index]:
+            while index < len(target_part) and search[current] == target_part[index]:
                 current += 1
                 index += 1
         except IndexError:
-            # Exit when _search runs out
+            # Exit when search runs out
             break
 
-    return current / len(_search)
+    return current / len(search)
+
+
+def _iter_bits(mask: int) -> Iterator[int]:
+    """Yield the positions of the set bits of `mask`, lowest first."""
+    while mask:
+        lowest_bit = mask & -mask
+        yield lowest_bit.bit_length() - 1
+        mask ^= lowest_bit
+
+
+class TagIndex:
+    """
+    A search index over a set of tags, built once whenever the tags are loaded.
+
+    Every identifier (aliases included) is given a position, and sets of identifiers are stored as bitmasks
+    over those positions. This holds:
+     - The name and group of every identifier, pre-split for fuzzy matching.
+     - A table from each letter to the identifiers with a word in their name starting with it.
+       The fuzzy score is 0 unless the first letter of the search starts a word, so only those identifiers are scored.
+     - The identifiers accessible to each role, and those accessible to everyone.
+    """
+
+    def __init__(self, tags: dict[TagIdentifier, Tag]):
+        self.identifiers = list(tags)
+        self.tags = list(tags.values())
+        self.positions = {identifier: position for position, identifier in enumerate(self.identifiers)}
+        self.autocomplete_names = [identifier.name for identifier in self.identifiers]
+
+        self._name_parts = [_split_target(identifier.name) for identifier in self.identifiers]
+        self._group_parts = [
+            _split_target(identifier.group) if identifier.group is not None else None
+            for identifier in self.identifiers
+        ]
+
+        self._first_letters: dict[str, int] = {}
+        self._unrestricted = 0
+        self._role_access: dict[int, int] = {}
+        for position, (name_parts, tag) in enumerate(zip(self._name_parts, self.tags, strict=True)):
+            bit = 1 << position
+            for first_letter in {part[0] for part in name_parts if part}:
+                self._first_letters[first_letter] = self._first_letters.get(first_letter, 0) | bit
+
+            if not tag._restricted_to:
+                self._unrestricted |= bit
+            for role_id in tag._restricted_to:
+                self._role_access[role_id] = self._role_access.get(role_id, 0) | bit
+
+    def accessible_mask(self, member: Member) -> int:
+        """Return the bitmask of identifiers whose tag is accessible by `member`."""
+        mask = self._unrestricted
+        for role in member.roles:
+            mask |= self._role_access.get(role.id, 0)
+        return mask
+
+    def fuzzy_scores(self, tag_identifier: TagIdentifier) -> Iterator[tuple[int, float]]:
+        """
+        Yield the position and fuzzy score of every identifier with a nonzero score for `tag_identifier`.
+
+        Tags without groups are ignored if `tag_identifier` has a group and vice versa.
+        """
+        search_name = _normalize_search(tag_identifier.name)
+        if not search_name:
+            return
+        search_group = _normalize_search(tag_identifier.group) if tag_identifier.group is not None else None
+
+        for position in _iter_bits(self._first_letters.get(search_name[0], 0)):
+            group = self.identifiers[position].group
+            if (group is None) != (tag_identifier.group is None):
+                continue
+            if group == tag_identifier.group:
+                # Completely identical, or both None
+                group_score = 1
+            else:
+                group_score = _fuzzy_score(search_group, self._group_parts[position])
+
+            fuzzy_score = group_score * _fuzzy_score(search_name, self._name_parts[position]) * 100
+            if fuzzy_score:
+                log.trace(
+                    f"Fuzzy score {fuzzy_score:=06.2f} for tag {self.identifiers[position]!r}"
+                    f" with fuzz {tag_identifier!r}"
+                )
+                yield position, fuzzy_score
 
 
 class Tags(Cog):
@@ -133,12 +211,21 @@ class Tags(Cog):
     def __init__(self, bot: Bot):
         self.bot = bot
         self.tags: dict[TagIdentifier, Tag] = {}
+        self.index = TagIndex(self.tags)
+        # Maps each loaded tag file to its modification time when it was loaded, and the tag loaded from it
+        self._tag_files: dict[Path, tuple[float, Tag]] = {}
         self.initialize_tags()
 
     def initialize_tags(self) -> None:
-        """Load all tags from resources into `self.tags`."""
+        """
+        Load all tags from resources into `self.tags`, and build the search index over them.
+
+        When called again, only files which were added or modified since the last load are read.
+        """
         base_path = Path("bot", "resources", "tags")
 
+        tag_files = {}
+        tags = {}
         for file in base_path.glob("**/*"):
             if file.is_file():
                 parent_dir = file.relative_to(base_path).parent
@@ -146,19 +233,28 @@ class Tags(Cog):
                 # Files directly under `base_path` have an empty string as the parent directory name
                 tag_group = parent_dir.name or None
 
-                tag = Tag(file)
-                self.tags[TagIdentifier(tag_group, tag_name)] = tag
+                modified_at = file.stat().st_mtime
+                loaded_at, tag = self._tag_files.get(file, (None, None))
+                if loaded_at != modified_at:
+                    tag = Tag(file)
+                tag_files[file] = (modified_at, tag)
+                tags[TagIdentifier(tag_group, tag_name)] = tag
 
                 for alias in tag.aliases:
-                    self.tags[TagIdentifier(tag_group, alias)] = tag
+                    tags[TagIdentifier(tag_group, alias)] = tag
+
+        self._tag_files = tag_files
+        self.tags = tags
+        self.index = TagIndex(tags)
 
     def _get_suggestions(self, tag_identifier: TagIdentifier) -> list[tuple[TagIdentifier, Tag]]:
         """Return a list of suggested tags for `tag_identifier`."""
+        scores = list(self.index.fuzzy_scores(tag_identifier))
         for threshold in [100, 90, 80, 70, 60]:
             suggestions = [
-                (identifier, tag)
-                for identifier, tag in self.tags.items()
-                if identifier.get_fuzzy_score(tag_identifier) >= threshold
+                (self.index.identifiers[position], self.index.tags[position])
+                for position, score in scores
+                if score >= threshold
             ]
             if suggestions:
                 return suggestions
@@ -238,7 +334,7 @@ class Tags(Cog):
 
     def accessible_tags(self, member: Member) -> list[str]:
         """Return a formatted list of tags that are accessible by `member`; groups first, and alphabetically sorted."""
-        def tag_sort_key(tag_item: tuple[TagIdentifier, Tag]) -> str:
+        def tag_sort_key(tag_item: tuple[TagIdentifier, int]) -> str:
             group, name = tag_item[0]
             if group is None:
                 # Max codepoint character to force tags without a group to the end
@@ -246,11 +342,12 @@ class Tags(Cog):
 
             return group + name
 
+        accessible_mask = self.index.accessible_mask(member)
         result_lines = []
         current_group = ""
         group_accessible = True
 
-        for identifier, tag in sorted(self.tags.items(), key=tag_sort_key):
+        for identifier, position in sorted(self.index.positions.items(), key=tag_sort_key):
 
             if identifier.group != current_group:
                 if not group_accessible:
@@ -264,7 +361,7 @@ class Tags(Cog):
                 else:
                     result_lines.append("\n")
 
-            if tag.accessible_by(member):
+            if accessible_mask >> position & 1:
                 result_lines.append(f"**\N{RIGHT-POINTING DOUBLE ANGLE QUOTATION MARK}** {identifier.name}")
                 group_accessible = True
 
@@ -272,10 +369,11 @@ class Tags(Cog):
 
     def accessible_tags_in_group(self, group: str, member: Member) -> list[str]:
         """Return a formatted list of tags in `group`, that are accessible by `member`."""
+        accessible_mask = self.index.accessible_mask(member)
         return sorted(
             f"**\N{RIGHT-POINTING DOUBLE ANGLE QUOTATION MARK}** {identifier}"
-            for identifier, tag in self.tags.items()
-            if identifier.group == group and tag.accessible_by(member)
+            for position, identifier in enumerate(self.index.identifiers)
+            if identifier.group == group and accessible_mask >> position & 1
         )
 
     async def get_command_ctx(
@@ -372,12 +470,21 @@ class Tags(Cog):
         current: str
     ) -> list[app_commands.Choice[str]]:
         """Autocompleter for `/tag get` command."""
-        names = [tag.name for tag in self.tags]
-        choices = [
-            app_commands.Choice(name=tag, value=tag)
-            for tag in names if current.lower() in tag
-        ]
-        return choices[:25] if len(choices) > 25 else choices
+        current = current.lower()
+        choices = []
+        for name in self.index.autocomplete_names:
+            if current in name:
+                choices.append(app_commands.Choice(name=name, value=name))
+                if len(choices) == 25:
+                    break
+        return choices
+
+    @command(name="reloadtags", hidden=True)
+    @has_any_role(constants.Roles.admins)
+    async def reload_tags_command(self, ctx: Context) -> None:
+        """Reload the tags which were added, modified or removed since they were last loaded."""
+        self.initialize_tags()
+        await ctx.send(f":white_check_mark: Reloaded tags, {len(self.tags)} tag names are available.")
 
 
 async def setup(bot: Bot) -> None:
@@ -86,6 +86,8 @@ class AlternateAccounts(commands.Cog):
             error = self.error_text_from_error(e)
             await ctx.send(f":x: {error}")
             return
+        self.bot.dispatch("user_info_update", user_1.id)
+        self.bot.dispatch("user_info_update", user_2.id)
         await ctx.send(f"✅ {user_1.mention} and {user_2.mention} successfully marked as alts.")
 
     @association_group.command(name="edit", aliases=("e",))
@@ -126,6 +128,8 @@ class AlternateAccounts(commands.Cog):
             error = self.error_text_from_error(e)
             await ctx.send(f":x: {error}")
             return
+        self.bot.dispatch("user_info_update", user_1.id)
+        self.bot.dispatch("user_info_update", user_2.id)
         await ctx.send(f"✅ {user_1.mention} and {user_2.mention} are no longer marked as alts.")
 
     @association_group.command(name="info", root_aliases=("alts",))
@@ -3,11 +3,12 @@ import traceback
 from collections import namedtuple
 from datetime import datetime
 from enum import Enum
+from io import StringIO
 
 import arrow
 from async_rediscache import RedisCache
 from dateutil.relativedelta import relativedelta
-from discord import Colour, Embed, Forbidden, Member, TextChannel, User
+from discord import Colour, Embed, File, Forbidden, Member, TextChannel, User
 from discord.ext import tasks
 from discord.ext.commands import Cog, Context, group, has_any_role
 from pydis_core.utils import scheduling
@@ -40,6 +41,17 @@ BASE_CHANNEL_TOPIC = "Python Discord Defense Mechanism"
 
 SECONDS_IN_DAY = 86400
 
+# How many rejected members are DMed and kicked at the same time
+MAX_REJECTION_WORKERS = 5
+# How long to wait for a rejection DM to be sent before kicking the member regardless
+REJECTION_DM_TIMEOUT = 5
+# Once this many rejections are queued, members are kicked without being DMed so the queue drains faster
+REJECTION_DM_BACKLOG_LIMIT = 50
+# Rejections in this many seconds after the first one are logged together
+REJECTION_LOG_INTERVAL = 10
+# How many rejected members to list in an aggregated log embed, the rest are only in the attached file
+MAX_LISTED_REJECTIONS = 10
+
 
 class Action(Enum):
     """Defcon Action."""
@@ -69,6 +81,13 @@ class Defcon(Cog):
 
         self.scheduler = Scheduler(self.__class__.__name__)
 
+        # Members waiting to be DMed and kicked, with the loop time they were queued at
+        self.rejection_queue: asyncio.Queue[tuple[Member, float]] = asyncio.Queue()
+        self._rejection_workers: list[asyncio.Task] = []
+        # Members which were rejected, and whether they were DMed, waiting to be logged
+        self._rejections: list[tuple[Member, bool]] = []
+        self._rejection_log_task: asyncio.Task | None = None
+
         scheduling.create_task(self._sync_settings(), event_loop=self.bot.loop)
 
     async def get_mod_log(self) -> ModLog:
@@ -115,36 +134,109 @@ class Defcon(Cog):
 
             if now - member.created_at < time.relativedelta_to_timedelta(self.threshold):
                 log.info(f"Rejecting user {member}: Account is too new")
+                self._queue_rejection(member)
+
+    def _queue_rejection(self, member: Member) -> None:
+        """Queue `member` to be DMed and kicked by the rejection workers, starting them if needed."""
+        if not self._rejection_workers:
+            self._rejection_workers = [
+                scheduling.create_task(self._rejection_worker(), name=f"defcon-rejection-worker-{i}")
+                for i in range(MAX_REJECTION_WORKERS)
+            ]
+
+        self.rejection_queue.put_nowait((member, asyncio.get_running_loop().time()))
+        self.bot.stats.gauge("defcon.rejections.queue_depth", self.rejection_queue.qsize())
+
+    async def _rejection_worker(self) -> None:
+        """Reject queued members one after the other."""
+        while True:
+            member, queued_at = await self.rejection_queue.get()
+            try:
+                await self._reject_member(member, queued_at)
+            except Exception:
+                log.exception(f"Error rejecting {member} from the server.")
+            finally:
+                self.rejection_queue.task_done()
+                self.bot.stats.gauge("defcon.rejections.queue_depth", self.rejection_queue.qsize())
+
+    async def _reject_member(self, member: Member, queued_at: float) -> None:
+        """
+        DM `member` the rejection message and kick them, then queue the rejection to be logged.
 
-                message_sent = False
-
-                try:
-                    await member.send(REJECTION_MESSAGE.format(user=member.mention))
-                    message_sent = True
-                except Forbidden:
-                    log.debug(f"Cannot send DEFCON rejection DM to {member}: DMs disabled")
-                except Exception:
-                    # Broadly catch exceptions because DM isn't critical, but it's imperative to kick them.
-                    log.exception(f"Error sending DEFCON rejection message to {member}")
-
-                await member.kick(reason="DEFCON active, user is too new")
-                self.bot.stats.incr("defcon.leaves")
-
-                message = (
-                    f"{format_user(member)} was denied entry because their account is too new."
-                )
-
-                if not message_sent:
-                    message = f"{message}\n\nUnable to send rejection message via DM; they probably have DMs disabled."
+        Kicking takes priority: the DM is given up on if it takes too long, or skipped while many rejections are queued.
+        """
+        message_sent = False
 
-                await send_log_message(
-                    self.bot,
-                    Icons.defcon_denied,
-                    Colours.soft_red,
-                    "Entry denied",
-                    message,
-                    thumbnail=member.display_avatar.url
-                )
+        if self.rejection_queue.qsize() >= REJECTION_DM_BACKLOG_LIMIT:
+            log.debug(f"Not sending DEFCON rejection DM to {member}: too many rejections are queued")
+        else:
+            try:
+                await asyncio.wait_for(member.send(REJECTION_MESSAGE.format(user=member.mention)), REJECTION_DM_TIMEOUT)
+                message_sent = True
+            except Forbidden:
+                log.debug(f"Cannot send DEFCON rejection DM to {member}: DMs disabled")
+            except TimeoutError:
+                log.debug(f"Gave up sending DEFCON rejection DM to {member}: it took too long")
+            except Exception:
+                # Broadly catch exceptions because DM isn't critical, but it's imperative to kick them.
+                log.exception(f"Error sending DEFCON rejection message to {member}")
+
+        await member.kick(reason="DEFCON active, user is too new")
+        self.bot.stats.incr("defcon.leaves")
+        self.bot.stats.timing("defcon.rejections.time_to_kick", (asyncio.get_running_loop().time() - queued_at) * 1000)
+
+        self._rejections.append((member, message_sent))
+        if self._rejection_log_task is None:
+            self._rejection_log_task = scheduling.create_task(self._send_rejection_log_later())
+
+    async def _send_rejection_log_later(self) -> None:
+        """Log the rejections made during the next `REJECTION_LOG_INTERVAL` seconds together."""
+        await asyncio.sleep(REJECTION_LOG_INTERVAL)
+        self._rejection_log_task = None
+        await self._send_rejection_log()
+
+    async def _send_rejection_log(self) -> None:
+        """Send a single mod log message for all the rejections which weren't logged yet."""
+        rejections, self._rejections = self._rejections, []
+        if not rejections:
+            return
+
+        if len(rejections) == 1:
+            member, message_sent = rejections[0]
+            message = f"{format_user(member)} was denied entry because their account is too new."
+            if not message_sent:
+                message = f"{message}\n\nUnable to send rejection message via DM; they probably have DMs disabled."
+
+            await send_log_message(
+                self.bot,
+                Icons.defcon_denied,
+                Colours.soft_red,
+                "Entry denied",
+                message,
+                thumbnail=member.display_avatar.url
+            )
+            return
+
+        not_sent = sum(not message_sent for _, message_sent in rejections)
+        listed = "\n".join(format_user(member) for member, _ in rejections[:MAX_LISTED_REJECTIONS])
+        message = f"{len(rejections)} accounts were denied entry because their accounts are too new.\n\n{listed}"
+        if len(rejections) > MAX_LISTED_REJECTIONS:
+            message += f"\n...and {len(rejections) - MAX_LISTED_REJECTIONS} more, see the attached file."
+        if not_sent:
+            message += f"\n\nUnable to send the rejection message via DM to {not_sent} of them."
+
+        denied = "\n".join(
+            f"{member} ({member.id}): {'DM sent' if message_sent else 'DM not sent'}"
+            for member, message_sent in rejections
+        )
+        await send_log_message(
+            self.bot,
+            Icons.defcon_denied,
+            Colours.soft_red,
+            f"{len(rejections)} accounts denied",
+            message,
+            files=[File(StringIO(denied), "denied_accounts.txt")],
+        )
 
     @group(name="defcon", aliases=("dc",), invoke_without_command=True)
     @has_any_role(*MODERATION_ROLES)
@@ -327,11 +419,18 @@ class Defcon(Cog):
         await self.channel.send(f"Defcon is on and is set to {time.humanize_delta(self.threshold)}.")
 
     async def cog_unload(self) -> None:
-        """Cancel the notifer and threshold removal tasks when the cog unloads."""
+        """Cancel the notifier, threshold removal and rejection tasks, and log any pending rejections."""
         log.trace("Cog unload: canceling defcon notifier task.")
         self.defcon_notifier.cancel()
         self.scheduler.cancel_all()
 
+        for worker in self._rejection_workers:
+            worker.cancel()
+        if self._rejection_log_task is not None:
+            self._rejection_log_task.cancel()
+            self._rejection_log_task = None
+        await self._send_rejection_log()
+
 
 async def setup(bot: Bot) -> None:
     """Load the Defcon cog."""
@@ -317,6 +317,7 @@ class InfractionScheduler:
             log.trace(f"Trying to delete infraction {id_} from database because applying infraction failed.")
             try:
                 await self.bot.api_client.delete(f"bot/infractions/{id_}")
+                self.bot.dispatch("user_info_update", user.id)
             except ResponseCodeError as e:
                 confirm_msg += " and failed to delete"
                 log_title += " and failed to delete"
@@ -568,6 +569,7 @@ class InfractionScheduler:
                 f"bot/infractions/{id_}",
                 json=data
             )
+            self.bot.dispatch("user_info_update", user_id)
         except ResponseCodeError as e:
             log.exception(f"Failed to deactivate infraction #{id_} ({type_})")
             log_line = f"API request failed with code {e.status}."
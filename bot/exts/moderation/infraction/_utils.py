@@ -145,6 +145,7 @@ async def post_infraction(
     for should_post_user in (True, False):
         try:
             response = await ctx.bot.api_client.post("bot/infractions", json=payload)
+            ctx.bot.dispatch("user_info_update", user.id)
             return response
         except ResponseCodeError as e:
             if e.status == 400 and "user" in e.response_json:
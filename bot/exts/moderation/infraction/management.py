@@ -221,6 +221,7 @@ class ModManagement(commands.Cog):
 
         # Get information about the infraction's user
         user_id = new_infraction["user"]
+        self.bot.dispatch("user_info_update", user_id)
         user = await get_or_fetch_member(ctx.guild, user_id)
 
         # Re-schedule infraction if the expiration has been updated
@@ -1,15 +1,25 @@
 import csv
+import itertools
 import json
+import tempfile
+from collections import OrderedDict
+from collections.abc import Iterator
 from datetime import timedelta
-from io import StringIO
-from typing import Literal
+from pathlib import Path
+from typing import BinaryIO, Literal
 
 import arrow
 from aiohttp.client_exceptions import ClientResponseError
 from arrow import Arrow
 from async_rediscache import RedisCache
 from discord.ext.commands import Cog, Context, group, has_any_role
-from pydis_core.utils.paste_service import PasteFile, PasteTooLongError, PasteUploadError, send_to_paste_service
+from pydis_core.utils.paste_service import (
+    MAX_PASTE_SIZE,
+    PasteFile,
+    PasteTooLongError,
+    PasteUploadError,
+    send_to_paste_service,
+)
 from pydis_core.utils.scheduling import Scheduler
 
 from bot.bot import Bot
@@ -23,6 +33,130 @@ BASE_HEADERS = {
     "Content-Type": "application/json"
 }
 
+# Extracts are streamed to disk in chunks of this size.
+CHUNK_SIZE = 64 * 1024
+# Extracts larger than this are aborted.
+MAX_EXPORT_SIZE = 512 * 1024 * 1024
+# The least recently extracted exports are deleted once there are more, or they're larger in total, than this.
+MAX_EXPORTS = 10
+MAX_EXPORTS_SIZE = 1024 * 1024 * 1024
+
+
+class ExportTooLargeError(Exception):
+    """Raised when a question's output exceeds `MAX_EXPORT_SIZE`."""
+
+
+class Export:
+    """
+    The output of a question, spooled to a file.
+
+    CSV rows are parsed from the file each time the export is iterated, rather than being kept in memory,
+    and the offset of each row is recorded the first time a row is looked up by index.
+    JSON can't be parsed incrementally, so JSON rows are parsed once and kept.
+    """
+
+    def __init__(self, path: Path, extension: Literal["csv", "json"], size: int) -> None:
+        self.path = path
+        self.extension = extension
+        self.size = size
+
+        self._json_rows: list[dict] | None = None
+        self._csv_header: list[str] | None = None
+        self._csv_offsets: list[int] | None = None
+
+    def __repr__(self) -> str:
+        return f"<Export path={str(self.path)!r} extension={self.extension!r} size={self.size}>"
+
+    def __iter__(self) -> Iterator[dict]:
+        """Yield the rows of the export."""
+        if self.extension == "json":
+            yield from self._load_json()
+            return
+
+        with self.path.open("rb") as file:
+            yield from csv.DictReader(_decoded_lines(file))
+
+    def __len__(self) -> int:
+        """Return the number of rows of the export."""
+        if self.extension == "json":
+            return len(self._load_json())
+        return len(self._index_csv())
+
+    def __getitem__(self, item: int | slice) -> dict | list[dict]:
+        """Return the row at the index, or the rows in the slice, provided."""
+        if self.extension == "json":
+            return self._load_json()[item]
+
+        offsets = self._index_csv()[item]
+        with self.path.open("rb") as file:
+            if isinstance(item, slice):
+                return [self._read_csv_row(file, offset) for offset in offsets]
+            return self._read_csv_row(file, offsets)
+
+    def _read_csv_row(self, file: BinaryIO, offset: int) -> dict:
+        """Return the CSV row starting at `offset` in `file`."""
+        file.seek(offset)
+        return next(csv.DictReader(_decoded_lines(file), fieldnames=self._csv_header))
+
+    def _load_json(self) -> list[dict]:
+        """Return the rows of a JSON export, parsing them on first use."""
+        if self._json_rows is None:
+            with self.path.open(encoding="utf-8") as file:
+                self._json_rows = json.load(file)
+        return self._json_rows
+
+    def _index_csv(self) -> list[int]:
+        """Return the offset of each row of a CSV export, indexing them on first use."""
+        if self._csv_offsets is not None:
+            return self._csv_offsets
+
+        with self.path.open("rb") as file:
+            # The offset of each line read, so a row's offset is that of its first line.
+            line_offsets = []
+
+            def lines() -> Iterator[str]:
+                position = 0
+                for line in file:
+                    line_offsets.append(position)
+                    position += len(line)
+                    yield line.decode("utf-8")
+
+            reader = csv.reader(lines())
+            self._csv_header = next(reader, [])
+            offsets = []
+            while True:
+                line_num = reader.line_num
+                if (row := next(reader, None)) is None:
+                    break
+                # Like `csv.DictReader`, skip empty rows.
+                if row:
+                    offsets.append(line_offsets[line_num])
+
+        self._csv_offsets = offsets
+        return offsets
+
+    def rows(self) -> list[dict]:
+        """Return all rows of the export as a list."""
+        return list(self)
+
+    def format(self) -> str:
+        """Return the export as text to be shown to humans."""
+        text = self.path.read_text(encoding="utf-8")
+        if self.extension == "json":
+            # Format it nicely for human eyes
+            text = json.dumps(json.loads(text), indent=4, sort_keys=True)
+        return text
+
+    def delete(self) -> None:
+        """Delete the file the export is spooled to."""
+        self.path.unlink(missing_ok=True)
+
+
+def _decoded_lines(file: BinaryIO) -> Iterator[str]:
+    """Yield the lines of `file` from its current position, decoded from UTF-8."""
+    for line in file:
+        yield line.decode("utf-8")
+
 
 class Metabase(Cog):
     """Commands for admins to interact with metabase."""
@@ -37,7 +171,10 @@ class Metabase(Cog):
         self.session_expiry: float | None = None  # session_info["session_expiry"]: UtcPosixTimestamp
         self.headers = BASE_HEADERS
 
-        self.exports: dict[int, list[dict]] = {}  # Saves the output of each question, so internal eval can access it
+        # Saves the output of each question, so internal eval can access it
+        self.exports: OrderedDict[int, Export] = OrderedDict()
+        self._export_dir = tempfile.TemporaryDirectory(prefix="metabase-")
+        self._export_ids = itertools.count()
 
     async def cog_command_error(self, ctx: Context, error: Exception) -> None:
         """Handle ClientResponseError errors locally to invalidate token if needed."""
@@ -125,41 +262,78 @@ class Metabase(Cog):
         """
         await ctx.typing()
 
-        url = f"{MetabaseConfig.base_url}/api/card/{question_id}/query/{extension}"
+        try:
+            export = await self.extract(question_id, extension)
+        except ExportTooLargeError:
+            await ctx.send(f":x: {ctx.author.mention} That question's output is too large to extract.")
+            return
 
-        async with self.bot.http_session.post(url, headers=self.headers, raise_for_status=True) as resp:
-            if extension == "csv":
-                extension = "text"  # paste site doesn't support csv as a lexer
-                out = await resp.text(encoding="utf-8")
-                # Save the output for use with int e
-                self.exports[question_id] = list(csv.DictReader(StringIO(out)))
+        # Save the output for use with int e
+        self.add_export(question_id, export)
 
-            elif extension == "json":
-                out = await resp.json(encoding="utf-8")
-                # Save the output for use with int e
-                self.exports[question_id] = out
+        message = await self.upload_export(ctx, export)
 
-                # Format it nicely for human eyes
-                out = json.dumps(out, indent=4, sort_keys=True)
+        await ctx.send(
+            f"{message}\nYou can also access this data within internal eval by doing: "
+            f"`bot.get_cog('Metabase').exports[{question_id}]`"
+        )
+
+    async def extract(self, question_id: int, extension: Literal["csv", "json"]) -> Export:
+        """
+        Stream the output of the question with `question_id` to a file, and return it as an `Export`.
+
+        Raise `ExportTooLargeError` if the output exceeds `MAX_EXPORT_SIZE`.
+        """
+        url = f"{MetabaseConfig.base_url}/api/card/{question_id}/query/{extension}"
+        path = Path(self._export_dir.name, f"{question_id}-{next(self._export_ids)}.{extension}")
+        size = 0
 
-        file = PasteFile(content=out, lexer=extension)
+        try:
+            with path.open("wb") as file:
+                async with self.bot.http_session.post(url, headers=self.headers, raise_for_status=True) as resp:
+                    async for chunk in resp.content.iter_chunked(CHUNK_SIZE):
+                        size += len(chunk)
+                        if size > MAX_EXPORT_SIZE:
+                            raise ExportTooLargeError
+                        await self.bot.loop.run_in_executor(None, file.write, chunk)
+        except BaseException:
+            path.unlink(missing_ok=True)
+            raise
+
+        return Export(path, extension, size)
+
+    async def upload_export(self, ctx: Context, export: Export) -> str:
+        """Upload `export` to the paste service and return a message with the link, or why it failed."""
+        # Don't bother reading and formatting an export which is certainly too long to upload.
+        if export.size > MAX_PASTE_SIZE:
+            return f":x: {ctx.author.mention} Too long to upload to paste service."
+
+        out = await self.bot.loop.run_in_executor(None, export.format)
+        lexer = "text" if export.extension == "csv" else export.extension  # paste site doesn't support csv as a lexer
         try:
             resp = await send_to_paste_service(
-                files=[file],
+                files=[PasteFile(content=out, lexer=lexer)],
                 http_session=self.bot.http_session,
                 paste_url=BaseURLs.paste_url,
             )
         except PasteTooLongError:
-            message = f":x: {ctx.author.mention} Too long to upload to paste service."
+            return f":x: {ctx.author.mention} Too long to upload to paste service."
         except PasteUploadError:
-            message = f":x: {ctx.author.mention} Failed to upload to paste service."
-        else:
-            message = f":+1: {ctx.author.mention} Here's your link: {resp.link}"
-
-        await ctx.send(
-            f"{message}\nYou can also access this data within internal eval by doing: "
-            f"`bot.get_cog('Metabase').exports[{question_id}]`"
-        )
+            return f":x: {ctx.author.mention} Failed to upload to paste service."
+        return f":+1: {ctx.author.mention} Here's your link: {resp.link}"
+
+    def add_export(self, question_id: int, export: Export) -> None:
+        """Save `export` as the output of `question_id`, deleting the least recent exports if over the limits."""
+        if (previous := self.exports.pop(question_id, None)) is not None:
+            previous.delete()
+        self.exports[question_id] = export
+
+        total_size = sum(export.size for export in self.exports.values())
+        while len(self.exports) > 1 and (len(self.exports) > MAX_EXPORTS or total_size > MAX_EXPORTS_SIZE):
+            evicted_id, evicted = self.exports.popitem(last=False)
+            log.trace(f"Deleting the export of question {evicted_id} to stay within the export limits.")
+            evicted.delete()
+            total_size -= evicted.size
 
     @metabase_group.command(name="publish", aliases=("share",))
     async def metabase_publish(self, ctx: Context, question_id: int) -> None:
@@ -183,8 +357,10 @@ class Metabase(Cog):
         return all(checks)
 
     async def cog_unload(self) -> None:
-        """Cancel all scheduled tasks."""
+        """Cancel all scheduled tasks and delete saved exports."""
         self._session_scheduler.cancel_all()
+        self.exports.clear()
+        self._export_dir.cleanup()
 
 
 async def setup(bot: Bot) -> None:
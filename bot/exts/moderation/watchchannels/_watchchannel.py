@@ -4,6 +4,7 @@ import textwrap
 from abc import abstractmethod
 from collections import defaultdict, deque
 from dataclasses import dataclass
+from datetime import UTC, datetime
 from typing import Any
 
 import discord
@@ -28,6 +29,9 @@ log = get_logger(__name__)
 
 URL_RE = re.compile(r"(https?://[^\s]+)")
 
+# Discord's limit on the length of a message's content.
+MAX_CONTENT_LENGTH = 2000
+
 
 @dataclass
 class MessageHistory:
@@ -171,6 +175,22 @@ class WatchChannel(metaclass=CogABCMeta):
 
             self.log.trace(f"Received message: {msg.content} ({len(msg.attachments)} attachments)")
             self.message_queue[msg.author.id][msg.channel.id].append(msg)
+            self.report_queue_depth()
+
+    @property
+    def stats_prefix(self) -> str:
+        """The prefix of the stats reported by this watch channel."""
+        return f"watch_channels.{type(self).__name__.lower()}"
+
+    def report_queue_depth(self) -> None:
+        """Report the number of messages waiting to be relayed."""
+        depth = sum(
+            len(channel_queue)
+            for queues in (self.message_queue, self.consumption_queue)
+            for channel_queues in queues.values()
+            for channel_queue in channel_queues.values()
+        )
+        self.bot.stats.gauge(f"{self.stats_prefix}.queue_depth", depth)
 
     async def consume_messages(self, delay_consumption: bool = True) -> None:
         """Consumes the message queues to log watched users' messages."""
@@ -187,14 +207,13 @@ class WatchChannel(metaclass=CogABCMeta):
 
         for user_id, channel_queues in self.consumption_queue.items():
             for channel_queue in channel_queues.values():
-                while channel_queue:
-                    msg = channel_queue.popleft()
-
-                    if watch_info := self.watched_users.get(user_id, None):
-                        self.log.trace(f"Consuming message {msg.id} ({len(msg.attachments)} attachments)")
-                        await self.relay_message(msg, watch_info)
-                    else:
-                        self.log.trace(f"Not consuming message {msg.id} as user {user_id} is no longer watched.")
+                if watch_info := self.watched_users.get(user_id, None):
+                    self.log.trace(f"Consuming {len(channel_queue)} messages from user {user_id}")
+                    await self.relay_messages(channel_queue, watch_info)
+                else:
+                    self.log.trace(f"Not consuming {len(channel_queue)} messages as user {user_id} is unwatched.")
+                    channel_queue.clear()
+                self.report_queue_depth()
 
         self.consumption_queue.clear()
 
@@ -213,6 +232,7 @@ class WatchChannel(metaclass=CogABCMeta):
     ) -> None:
         """Sends a message to the webhook with the specified kwargs."""
         username = messages.sub_clyde(username)
+        self.bot.stats.incr(f"{self.stats_prefix}.webhook_payloads")
         try:
             await self.webhook.send(content=content, username=username, avatar_url=avatar_url, embed=embed)
         except discord.HTTPException as exc:
@@ -221,55 +241,87 @@ class WatchChannel(metaclass=CogABCMeta):
                 exc_info=exc
             )
 
-    async def relay_message(self, msg: Message, watch_info: dict) -> None:
-        """Relays the message to the relevant watch channel."""
-        limit = BigBrotherConfig.header_message_limit
-
-        if (
-            msg.author.id != self.message_history.last_author
-            or msg.channel.id != self.message_history.last_channel
-            or self.message_history.message_count >= limit
-        ):
-            self.message_history = MessageHistory(last_author=msg.author.id, last_channel=msg.channel.id)
-
-            await self.send_header(msg, watch_info)
-
+    @staticmethod
+    def clean_message_content(msg: Message) -> str:
+        """Return the content of `msg` to be relayed, with tokens censored and non-media links unembedded."""
         if DiscordTokenFilter.find_token_in_message(msg.content) or WEBHOOK_URL_RE.search(msg.content):
-            cleaned_content = "Content is censored because it contains a bot or webhook token."
-        elif cleaned_content := msg.clean_content:
+            return "Content is censored because it contains a bot or webhook token."
+
+        cleaned_content = msg.clean_content
+        if cleaned_content:
             # Put all non-media URLs in a code block to prevent embeds
             media_urls = {embed.url for embed in msg.embeds if embed.type in ("image", "video")}
             for url in URL_RE.findall(cleaned_content):
                 if url not in media_urls:
                     cleaned_content = cleaned_content.replace(url, f"`{url}`")
+        return cleaned_content
 
-        if cleaned_content:
+    async def relay_messages(self, queue: deque[Message], watch_info: dict) -> None:
+        """
+        Relay the messages in `queue`, which were all sent by one user in one channel, to the watch channel.
+
+        The queue is consumed as the messages are relayed. Consecutive messages are joined into as few
+        webhook payloads as Discord's content length limit allows. Headers and attachments are still sent
+        separately, in between the content they were sent between.
+        """
+        limit = BigBrotherConfig.header_message_limit
+        content = ""
+        author = None
+
+        async def flush() -> None:
+            nonlocal content
+            if content:
+                await self.webhook_send(content, username=author.display_name, avatar_url=author.display_avatar.url)
+                content = ""
+
+        while queue:
+            msg = queue.popleft()
+            author = msg.author
+            self.log.trace(f"Consuming message {msg.id} ({len(msg.attachments)} attachments)")
+
+            if (
+                msg.author.id != self.message_history.last_author
+                or msg.channel.id != self.message_history.last_channel
+                or self.message_history.message_count >= limit
+            ):
+                await flush()
+                self.message_history = MessageHistory(last_author=msg.author.id, last_channel=msg.channel.id)
+                await self.send_header(msg, watch_info)
+
+            if cleaned_content := self.clean_message_content(msg):
+                if content and len(content) + len(cleaned_content) + 1 > MAX_CONTENT_LENGTH:
+                    await flush()
+                content = f"{content}\n{cleaned_content}" if content else cleaned_content
+
+            if msg.attachments:
+                await flush()
+                await self.relay_attachments(msg)
+
+            self.message_history.message_count += 1
+            lag = datetime.now(tz=UTC) - msg.created_at
+            self.bot.stats.timing(f"{self.stats_prefix}.relay_lag", lag.total_seconds() * 1000)
+
+        await flush()
+
+    async def relay_attachments(self, msg: Message) -> None:
+        """Relays the attachments of the message to the relevant watch channel."""
+        try:
+            await messages.send_attachments(msg, self.webhook)
+        except (errors.Forbidden, errors.NotFound):
+            e = Embed(
+                description=":x: **This message contained an attachment, but it could not be retrieved**",
+                color=Color.red()
+            )
             await self.webhook_send(
-                cleaned_content,
+                embed=e,
                 username=msg.author.display_name,
                 avatar_url=msg.author.display_avatar.url
             )
-
-        if msg.attachments:
-            try:
-                await messages.send_attachments(msg, self.webhook)
-            except (errors.Forbidden, errors.NotFound):
-                e = Embed(
-                    description=":x: **This message contained an attachment, but it could not be retrieved**",
-                    color=Color.red()
-                )
-                await self.webhook_send(
-                    embed=e,
-                    username=msg.author.display_name,
-                    avatar_url=msg.author.display_avatar.url
-                )
-            except discord.HTTPException as exc:
-                self.log.exception(
-                    "Failed to send an attachment to the webhook",
-                    exc_info=exc
-                )
-
-        self.message_history.message_count += 1
+        except discord.HTTPException as exc:
+            self.log.exception(
+                "Failed to send an attachment to the webhook",
+                exc_info=exc
+            )
 
     async def send_header(self, msg: Message, watch_info: dict) -> None:
         """Sends a header embed with information about the relayed messages to the watch channel."""
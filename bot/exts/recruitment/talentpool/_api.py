@@ -1,8 +1,12 @@
+import asyncio
 from datetime import datetime
 
 from pydantic import BaseModel, Field, TypeAdapter
 from pydis_core.site_api import APIClient
 
+# Maximum number of requests in flight at once when editing nominations in bulk
+MAX_CONCURRENT_EDITS = 5
+
 
 class NominationEntry(BaseModel):
     """Pydantic model representing a nomination entry."""
@@ -109,6 +113,34 @@ class NominationAPI:
         result = await self.site_api.patch(f"bot/nominations/{nomination_id}", json=data)
         return Nomination.model_validate(result)
 
+    async def edit_nominations(
+        self,
+        nomination_ids: list[int],
+        *,
+        end_reason: str | None = None,
+        active: bool | None = None,
+        reviewed: bool | None = None,
+    ) -> list[Nomination]:
+        """
+        Apply the same edit to several nominations at once.
+
+        The site has no bulk update endpoint for nominations, so the edits are sent as one batch of
+        concurrent requests, with at most `MAX_CONCURRENT_EDITS` in flight at once.
+        The returned nominations are in the same order as `nomination_ids`.
+        """
+        semaphore = asyncio.Semaphore(MAX_CONCURRENT_EDITS)
+
+        async def edit(nomination_id: int) -> Nomination:
+            async with semaphore:
+                return await self.edit_nomination(
+                    nomination_id,
+                    end_reason=end_reason,
+                    active=active,
+                    reviewed=reviewed,
+                )
+
+        return list(await asyncio.gather(*(edit(nomination_id) for nomination_id in nomination_ids)))
+
     async def edit_nomination_entry(
         self,
         nomination_id: int,
@@ -17,7 +17,7 @@ from bot.bot import Bot
 from bot.constants import Bot as BotConfig, Channels, Emojis, Guild, MODERATION_ROLES, Roles, STAFF_ROLES
 from bot.converters import MemberOrUser, UnambiguousMemberOrUser
 from bot.exts.recruitment.talentpool._api import Nomination, NominationAPI
-from bot.exts.recruitment.talentpool._review import Reviewer
+from bot.exts.recruitment.talentpool._review import MAX_MESSAGE_SIZE, Reviewer
 from bot.log import get_logger
 from bot.pagination import LinePaginator
 from bot.utils import time
@@ -72,6 +72,7 @@ class NominationContextModal(discord.ui.Modal, title="New Nomination"):
 
             raise e
 
+        self.bot.dispatch("user_info_update", self.message.author.id)
         await interaction.response.send_message(
             f":white_check_mark: The nomination for {self.message.author.mention}"
             " has been added to the talent pool",
@@ -220,26 +221,40 @@ class TalentPool(Cog, name="Talentpool"):
             days=DAYS_UNTIL_INACTIVE
         )
 
-        nomination_discussion = await get_or_fetch_channel(self.bot, Channels.nomination_discussion)
-        for nomination in nominations:
-            if messages_per_user[nomination.user_id] > 0:
-                continue
-
-            if nomination.reviewed:
-                continue
+        inactive_nominations = [
+            nomination for nomination in nominations
+            if messages_per_user[nomination.user_id] == 0 and not nomination.reviewed
+        ]
+        if not inactive_nominations:
+            return
 
+        for nomination in inactive_nominations:
             log.info("Removing %s from the talent pool due to inactivity", nomination.user_id)
 
-            await nomination_discussion.send(
-                f":warning: <@{nomination.user_id}> ({nomination.user_id})"
-                " was removed from the talentpool as they have sent no messages"
-                f" in the past {DAYS_UNTIL_INACTIVE} days."
-            )
-            await self.api.edit_nomination(
-                nomination.id,
-                active=False,
-                end_reason=f"Automatic removal: User was inactive for more than {DAYS_UNTIL_INACTIVE}"
-            )
+        nomination_discussion = await get_or_fetch_channel(self.bot, Channels.nomination_discussion)
+        lines = [
+            ":warning: The following users were removed from the talentpool as they have sent no messages"
+            f" in the past {DAYS_UNTIL_INACTIVE} days:",
+            *(f"<@{nomination.user_id}> ({nomination.user_id})" for nomination in inactive_nominations),
+        ]
+        chunk = []
+        chunk_size = 0
+        for line in lines:
+            if chunk and chunk_size + len(line) + 1 > MAX_MESSAGE_SIZE:
+                await nomination_discussion.send("\n".join(chunk))
+                chunk = []
+                chunk_size = 0
+            chunk.append(line)
+            chunk_size += len(line) + 1
+        await nomination_discussion.send("\n".join(chunk))
+
+        await self.api.edit_nominations(
+            [nomination.id for nomination in inactive_nominations],
+            active=False,
+            end_reason=f"Automatic removal: User was inactive for more than {DAYS_UNTIL_INACTIVE}"
+        )
+        for nomination in inactive_nominations:
+            self.bot.dispatch("user_info_update", nomination.user_id)
 
     @nomination_group.group(
         name="list",
@@ -547,6 +562,7 @@ class TalentPool(Cog, name="Talentpool"):
                     return
             raise
 
+        self.bot.dispatch("user_info_update", user.id)
         await ctx.send(f"✅ The nomination for {user.mention} has been added to the talent pool.")
 
         thread_update = f":new: **{ctx.author.mention} has nominated {user.mention}"
@@ -873,6 +889,7 @@ class TalentPool(Cog, name="Talentpool"):
 
         nomination = active_nominations[0]
         await self.api.edit_nomination(nomination.id, end_reason=reason, active=False)
+        self.bot.dispatch("user_info_update", user_id)
         return True
 
     async def _nomination_to_string(self, nomination: Nomination) -> str:
@@ -1,3 +1,4 @@
+import asyncio
 import contextlib
 import random
 import re
@@ -39,6 +40,8 @@ MIN_REVIEW_INTERVAL = timedelta(days=1)
 MIN_NOMINATION_TIME = timedelta(days=7)
 # Number of days ago that the user must have activity since
 RECENT_ACTIVITY_DAYS = 7
+# Maximum number of concurrent member fetches when checking whether nominees are still in the server
+MAX_CONCURRENT_MEMBER_FETCHES = 5
 
 # A constant for weighting number of nomination entries against nomination age when selecting a user to review.
 # The higher this is, the lower the effect of review age. At 1, age and number of entries are weighted equally.
@@ -141,6 +144,29 @@ class Reviewer:
         """Check if a user's message count is enough for them to be autoreviewed."""
         return user_message_count > 0
 
+    @classmethod
+    def is_nomination_eligible_for_review(
+        cls,
+        nomination: Nomination,
+        user_message_count: int,
+        now: datetime,
+    ) -> bool:
+        """
+        Returns a boolean representing whether a nomination passes the checks which don't need any API calls.
+
+        This covers every criteria from `is_nomination_ready_for_review` except server membership.
+        """
+        return (
+            # Must be an active nomination
+            nomination.active and
+            # ... that has not already been reviewed
+            not nomination.reviewed and
+            # ... and has been nominated for long enough
+            cls.is_nomination_old_enough(nomination, now) and
+            # ... and is for a user that has been active recently
+            cls.is_user_active_enough(user_message_count)
+        )
+
     async def is_nomination_ready_for_review(
         self,
         nomination: Nomination,
@@ -156,19 +182,41 @@ class Reviewer:
          - They have sent at least one message in the server recently.
          - They are still a member of the server.
         """
+        if not self.is_nomination_eligible_for_review(nomination, user_message_count, now):
+            return False
+
         guild = self.bot.get_guild(Guild.id)
-        return (
-            # Must be an active nomination
-            nomination.active and
-            # ... that has not already been reviewed
-            not nomination.reviewed and
-            # ... and has been nominated for long enough
-            self.is_nomination_old_enough(nomination, now) and
-            # ... and is for a user that has been active recently
-            self.is_user_active_enough(user_message_count) and
-            # ... and is currently a member of the server
-            await get_or_fetch_member(guild, nomination.user_id) is not None
-        )
+        return await get_or_fetch_member(guild, nomination.user_id) is not None
+
+    async def filter_nominations_ready_for_review(
+        self,
+        nominations: list[Nomination],
+        messages_per_user: dict[int, int],
+        now: datetime,
+    ) -> list[Nomination]:
+        """
+        Return the nominations from `nominations` which are ready for review, preserving their order.
+
+        The checks which don't need an API call are done first, so only the remaining nominees
+        have their membership checked. Those member fetches run concurrently,
+        with at most `MAX_CONCURRENT_MEMBER_FETCHES` in flight at once.
+        """
+        eligible_nominations = [
+            nomination for nomination in nominations
+            if self.is_nomination_eligible_for_review(nomination, messages_per_user[nomination.user_id], now)
+        ]
+        if not eligible_nominations:
+            return []
+
+        guild = self.bot.get_guild(Guild.id)
+        semaphore = asyncio.Semaphore(MAX_CONCURRENT_MEMBER_FETCHES)
+
+        async def is_member(nomination: Nomination) -> bool:
+            async with semaphore:
+                return await get_or_fetch_member(guild, nomination.user_id) is not None
+
+        results = await asyncio.gather(*(is_member(nomination) for nomination in eligible_nominations))
+        return [nomination for nomination, ready in zip(eligible_nominations, results, strict=True) if ready]
 
     async def sort_nominations_to_review(self, nominations: list[Nomination], now: datetime) -> list[Nomination]:
         """
@@ -215,10 +263,7 @@ class Reviewer:
             [nomination.user_id for nomination in nominations],
             days=RECENT_ACTIVITY_DAYS,
         )
-        possible_nominations = [
-            nomination for nomination in nominations
-            if await self.is_nomination_ready_for_review(nomination, messages_per_user[nomination.user_id], now)
-        ]
+        possible_nominations = await self.filter_nominations_ready_for_review(nominations, messages_per_user, now)
         if not possible_nominations:
             log.info("No nominations are ready to review")
             return None
@@ -125,6 +125,27 @@ class Extensions(commands.Cog):
         log.debug(f"{ctx.author} requested a list of all cogs. Returning a paginated list.")
         await LinePaginator.paginate(lines, ctx, embed, scale_to_size=700, empty=False)
 
+    @extensions_group.command(name="timings", aliases=("times", "slowest"))
+    async def timings_command(self, ctx: Context) -> None:
+        """Get a list of loaded extensions from slowest to fastest to load, with how long each stage took."""
+        embed = Embed(colour=Colour.og_blurple())
+        embed.set_author(
+            name="Extension Load Timings",
+            url=URLs.github_bot_repo,
+            icon_url=URLs.bot_avatar
+        )
+
+        lines = []
+        for name, timing in self.bot.get_slowest_extensions():
+            lines.append(
+                f"**{name.removeprefix(f'{exts.__name__}.')}** - {timing.total:.3f}s\n"
+                f"import {timing.import_time:.3f}s, setup {timing.setup_time:.3f}s, "
+                f"cog_load {timing.cog_load_time:.3f}s"
+            )
+
+        log.debug(f"{ctx.author} requested extension load timings. Returning a paginated list.")
+        await LinePaginator.paginate(lines, ctx, embed, empty=False)
+
     def group_extension_statuses(self) -> t.Mapping[str, str]:
         """Return a mapping of extension names and statuses to their categories."""
         categories = {}
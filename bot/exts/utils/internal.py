@@ -1,3 +1,4 @@
+import asyncio
 import contextlib
 import inspect
 import pprint
@@ -6,7 +7,7 @@ import textwrap
 import traceback
 from collections import Counter
 from io import StringIO
-from typing import Any
+from typing import Any, Literal
 
 import arrow
 import discord
@@ -14,9 +15,11 @@ from discord.ext.commands import Cog, Context, group, has_any_role, is_owner
 from pydis_core.utils.paste_service import PasteFile, PasteTooLongError, PasteUploadError, send_to_paste_service
 
 from bot.bot import Bot
-from bot.constants import BaseURLs, DEBUG_MODE, Roles
+from bot.constants import BaseURLs, DEBUG_MODE, Roles, Stats
 from bot.log import get_logger
 from bot.utils import find_nth_occurrence
+from bot.utils.loop_monitor import LoopMonitor
+from bot.utils.stats import ListenerTimings
 
 log = get_logger(__name__)
 
@@ -34,9 +37,26 @@ class Internal(Cog):
         self.socket_event_total = 0
         self.socket_events = Counter()
 
+        self.loop_monitor: LoopMonitor | None = None
+
         if DEBUG_MODE:
             self.eval.add_check(is_owner().predicate)
 
+    async def cog_load(self) -> None:
+        """Start monitoring the event loop's health."""
+        self.loop_monitor = LoopMonitor(
+            asyncio.get_running_loop(),
+            self.bot.stats,
+            interval=Stats.loop_lag_interval,
+            threshold=Stats.slow_callback_threshold,
+        )
+        self.loop_monitor.start()
+
+    async def cog_unload(self) -> None:
+        """Stop monitoring the event loop's health."""
+        if self.loop_monitor is not None:
+            self.loop_monitor.stop()
+
     @Cog.listener()
     async def on_socket_event_type(self, event_type: str) -> None:
         """When a websocket event is received, increase our counters."""
@@ -261,6 +281,74 @@ async def func():  # (None,) -> Any
 
         await ctx.send(embed=stats_embed)
 
+    @internal_group.command(name="listenerstats", aliases=("listeners", "dispatch"))
+    @has_any_role(Roles.admins, Roles.owners, Roles.core_developers)
+    async def listenerstats(self, ctx: Context, toggle: Literal["on", "off"] | None = None) -> None:
+        """
+        Fetch how long the event listeners take to run, from the slowest to the fastest.
+
+        Timing the listeners has a small cost, so it can be turned on or off by passing `on` or `off`.
+        """
+        if toggle == "on":
+            if self.bot.listener_timings is None:
+                self.bot.listener_timings = ListenerTimings()
+            await ctx.send(":ok_hand: Event listeners are being timed.")
+            return
+        if toggle == "off":
+            self.bot.listener_timings = None
+            await ctx.send(":ok_hand: Event listeners are no longer timed.")
+            return
+
+        if (timings := self.bot.listener_timings) is None:
+            await ctx.send(f":x: Event listeners aren't being timed, use `{ctx.prefix}{ctx.command} on` to start.")
+            return
+
+        stats_embed = discord.Embed(
+            title="Event listener statistics",
+            description=f"Timing event listeners since <t:{int(timings.since)}:R>.",
+            color=discord.Color.og_blurple()
+        )
+
+        for (owner, event_name), timing in timings.slowest(25):
+            stats_embed.add_field(
+                name=f"{owner} {event_name}",
+                value=(
+                    f"{timing.calls:,} calls\n"
+                    f"p50 {timing.percentile(50) * 1000:,.1f}ms, p95 {timing.percentile(95) * 1000:,.1f}ms, "
+                    f"p99 {timing.percentile(99) * 1000:,.1f}ms\n"
+                    f"{timing.in_flight} running, peak {timing.peak_in_flight}"
+                ),
+                inline=True
+            )
+
+        await ctx.send(embed=stats_embed)
+
+    @internal_group.command(name="slowcallbacks", aliases=("slow", "blocking", "lag"))
+    @has_any_role(Roles.admins, Roles.owners)
+    async def slow_callbacks(self, ctx: Context) -> None:
+        """Show the code which blocked the event loop for the longest since the bot started."""
+        offenders = self.loop_monitor.get_worst_offenders(10)
+
+        embed = discord.Embed(
+            title="Event loop health",
+            description=f"Worst lag: {self.loop_monitor.worst_lag * 1000:,.0f}ms",
+            color=discord.Color.og_blurple()
+        )
+        if not offenders:
+            embed.description += "\nNothing has blocked the event loop yet."
+            await ctx.send(embed=embed)
+            return
+
+        embed.description += "\n\n" + "\n".join(
+            f"`{offender.location}`: blocked {offender.count:,} times, worst {offender.worst_duration * 1000:,.0f}ms, "
+            f"last <t:{int(offender.last_seen)}:R>"
+            for offender in offenders
+        )
+        worst_stack = offenders[0].stack.replace("`", "\u02cb")
+        embed.add_field(name="Worst offender's stack", value=f"```py\n{worst_stack[-1000:]}```", inline=False)
+
+        await ctx.send(embed=embed)
+
 
 async def setup(bot: Bot) -> None:
     """Load the Internal cog."""
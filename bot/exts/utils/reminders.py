@@ -1,8 +1,11 @@
+import asyncio
 import random
 import textwrap
 import typing as t
+from collections import defaultdict
 from datetime import UTC, datetime
 from operator import itemgetter
+from time import monotonic
 
 import discord
 from dateutil.parser import isoparse
@@ -29,6 +32,7 @@ from bot.errors import LockedResourceError
 from bot.log import get_logger
 from bot.pagination import LinePaginator
 from bot.utils import time
+from bot.utils.caching import TTLCache
 from bot.utils.checks import has_any_role_check, has_no_roles_check
 from bot.utils.lock import lock_arg
 from bot.utils.messages import send_denial
@@ -43,6 +47,13 @@ REMINDER_MENTION_BUTTON_TIMEOUT = 5*60
 # The number of mentions that can be sent when a reminder arrives is limited by
 # the 2000-character message limit.
 MAXIMUM_REMINDER_MENTION_OPT_INS = 80
+# How many channels overdue reminders are sent to at the same time when catching up after downtime.
+# Each channel's reminders are sent one after another, as Discord rate limits messages per channel.
+MAX_CATCH_UP_CHANNELS = 5
+# How long the number of active reminders of a user is cached for, and for how many users at most.
+# It's kept up to date as reminders are created and deleted, so this only bounds changes made elsewhere.
+ACTIVE_REMINDER_COUNT_TTL = 10 * 60
+MAX_CACHED_REMINDER_COUNTS = 1000
 
 Mentionable = discord.Member | discord.Role
 ReminderMention = UnambiguousUser | discord.Role
@@ -216,13 +227,20 @@ class Reminders(Cog):
     def __init__(self, bot: Bot):
         self.bot = bot
         self.scheduler = Scheduler(self.__class__.__name__)
+        self.catch_up_task: asyncio.Task | None = None
+        self.invalid_reminder_deletions: set[asyncio.Task] = set()
+        self.active_reminder_counts: TTLCache[int, int] = TTLCache(
+            MAX_CACHED_REMINDER_COUNTS, ACTIVE_REMINDER_COUNT_TTL
+        )
 
     async def cog_unload(self) -> None:
         """Cancel scheduled tasks."""
         self.scheduler.cancel_all()
+        if self.catch_up_task is not None:
+            self.catch_up_task.cancel()
 
     async def cog_load(self) -> None:
-        """Get all current reminders from the API and reschedule them."""
+        """Get all current reminders from the API, schedule them, and start sending the overdue ones."""
         await self.bot.wait_until_guild_available()
         response = await self.bot.api_client.get(
             "bot/reminders",
@@ -230,6 +248,7 @@ class Reminders(Cog):
         )
 
         now = datetime.now(UTC)
+        overdue = []
 
         for reminder in response:
             is_valid, *_ = self.ensure_valid_reminder(reminder)
@@ -240,10 +259,58 @@ class Reminders(Cog):
 
             # If the reminder is already overdue ...
             if remind_at < now:
-                await self.send_reminder(reminder, remind_at)
+                overdue.append(reminder)
             else:
                 self.schedule_reminder(reminder)
 
+        if overdue:
+            self.catch_up_task = scheduling.create_task(self.send_overdue_reminders(overdue))
+
+    async def send_overdue_reminders(self, reminders: list[dict]) -> None:
+        """
+        Send the reminders which became overdue while the bot was offline.
+
+        Up to `MAX_CATCH_UP_CHANNELS` channels are caught up at the same time, with the reminders of each
+        channel sent oldest first, one at a time, so they queue behind Discord's per-channel rate limit
+        rather than all at once. Progress is reported under `reminders.catch_up.remaining`.
+        """
+        start = monotonic()
+        log.info(f"Sending {len(reminders)} overdue reminders.")
+
+        by_channel = defaultdict(list)
+        for reminder in sorted(reminders, key=itemgetter("expiration")):
+            by_channel[reminder["channel_id"]].append(reminder)
+
+        remaining = len(reminders)
+        failed = 0
+        self.bot.stats.gauge("reminders.catch_up.remaining", remaining)
+        semaphore = asyncio.Semaphore(MAX_CATCH_UP_CHANNELS)
+
+        async def catch_up_channel(channel_reminders: list[dict]) -> None:
+            nonlocal remaining, failed
+            async with semaphore:
+                for reminder in channel_reminders:
+                    try:
+                        await self.send_reminder(reminder, isoparse(reminder["expiration"]))
+                    except LockedResourceError:
+                        log.debug(f"Overdue reminder #{reminder['id']} is already being modified or sent.")
+                    except Exception:
+                        failed += 1
+                        self.bot.stats.incr("reminders.catch_up.failed")
+                        log.exception(f"Failed to send overdue reminder #{reminder['id']}.")
+
+                    remaining -= 1
+                    self.bot.stats.gauge("reminders.catch_up.remaining", remaining)
+
+        await asyncio.gather(*(catch_up_channel(channel_reminders) for channel_reminders in by_channel.values()))
+
+        duration = monotonic() - start
+        self.bot.stats.timing("reminders.catch_up.duration", duration * 1000)
+        log.info(
+            f"Sent {len(reminders) - failed} overdue reminders to {len(by_channel)} channels "
+            f"in {duration:.2f}s ({failed} failed)."
+        )
+
     def ensure_valid_reminder(self, reminder: dict) -> tuple[bool, discord.TextChannel]:
         """Ensure reminder channel can be fetched otherwise delete the reminder."""
         channel = self.bot.get_channel(reminder["channel_id"])
@@ -254,7 +321,10 @@ class Reminders(Cog):
                 f"Reminder {reminder['id']} invalid: "
                 f"Channel {reminder['channel_id']}={channel}."
             )
-            scheduling.create_task(self.bot.api_client.delete(f"bot/reminders/{reminder['id']}"))
+            task = scheduling.create_task(self.bot.api_client.delete(f"bot/reminders/{reminder['id']}"))
+            self.invalid_reminder_deletions.add(task)
+            self._change_active_reminder_count(reminder["author"], -1)
+            task.add_done_callback(self.invalid_reminder_deletions.discard)
 
         return is_valid, channel
 
@@ -316,6 +386,30 @@ class Reminders(Cog):
             if mentionable := (member or guild.get_role(mention_id)):
                 yield mentionable
 
+    async def get_active_reminders(self, author_id: int) -> list[dict]:
+        """Fetch the active reminders of the given user, updating their cached count."""
+        active_reminders = await self.bot.api_client.get(
+            "bot/reminders",
+            params={
+                "author__id": str(author_id)
+            }
+        )
+        self.active_reminder_counts.set(author_id, len(active_reminders))
+        return active_reminders
+
+    async def get_active_reminder_count(self, author_id: int) -> int:
+        """Return how many active reminders the given user has, only fetching them if it isn't cached."""
+        count = self.active_reminder_counts.get(author_id)
+        if count is None:
+            count = len(await self.get_active_reminders(author_id))
+        return count
+
+    def _change_active_reminder_count(self, author_id: int, change: int) -> None:
+        """Add `change` to the cached number of active reminders of the given user, if it's cached."""
+        count = self.active_reminder_counts.get(author_id)
+        if count is not None:
+            self.active_reminder_counts.set(author_id, max(count + change, 0))
+
     def schedule_reminder(self, reminder: dict) -> None:
         """A coroutine which sends the reminder once the time is reached, and cancels the running task."""
         reminder_datetime = isoparse(reminder["expiration"])
@@ -397,6 +491,7 @@ class Reminders(Cog):
 
         log.debug(f"Deleting reminder #{reminder['id']} (the user has been reminded).")
         await self.bot.api_client.delete(f"bot/reminders/{reminder['id']}")
+        self._change_active_reminder_count(reminder["author"], -1)
 
     @staticmethod
     async def try_get_content_from_reply(ctx: Context) -> str:
@@ -465,17 +560,9 @@ class Reminders(Cog):
                 await send_denial(ctx, f"Sorry, you can only do that in {bot_commands.mention}!")
                 return
 
-            # Get their current active reminders
-            active_reminders = await self.bot.api_client.get(
-                "bot/reminders",
-                params={
-                    "author__id": str(ctx.author.id)
-                }
-            )
-
             # Let's limit this, so we don't get 10 000
             # reminders from kip or something like that :P
-            if len(active_reminders) > MAXIMUM_REMINDERS:
+            if await self.get_active_reminder_count(ctx.author.id) > MAXIMUM_REMINDERS:
                 await send_denial(ctx, "You have too many active reminders!")
                 return
 
@@ -505,6 +592,7 @@ class Reminders(Cog):
                 "mentions": mention_ids,
             }
         )
+        self._change_active_reminder_count(ctx.author.id, 1)
 
         formatted_time = time.discord_timestamp(expiration, time.TimestampFormats.DAY_TIME)
         success_message = f"Your reminder will arrive on {formatted_time}!"
@@ -526,10 +614,7 @@ class Reminders(Cog):
     async def list_reminders(self, ctx: Context) -> None:
         """View a paginated embed of all reminders for your user."""
         # Get all the user's reminders from the database.
-        data = await self.bot.api_client.get(
-            "bot/reminders",
-            params={"author__id": str(ctx.author.id)}
-        )
+        data = await self.get_active_reminders(ctx.author.id)
 
         # Make a list of tuples so it can be sorted by time.
         reminders = sorted(
@@ -647,15 +732,29 @@ class Reminders(Cog):
         await self._reschedule_reminder(reminder)
 
     @lock_arg(LOCK_NAMESPACE, "id_", raise_error=True)
-    async def _delete_reminder(self, ctx: Context, id_: int) -> bool:
-        """Acquires a lock on `id_` and returns `True` if reminder is deleted, otherwise `False`."""
-        if not await self._can_modify(ctx, id_, send_on_denial=False):
-            return False
+    async def _delete_reminder(self, ctx: Context, id_: int, reminder: dict | None = None) -> bool:
+        """
+        Acquires a lock on `id_` and returns `True` if reminder is deleted, otherwise `False`.
+
+        `reminder` can be given if it's already known to belong to the ctx author, so it isn't fetched again.
+        """
+        if reminder is None:
+            reminder = await self._get_reminder(id_, missing_ok=True)
+            if reminder is None or not await self._can_modify_reminder(ctx, reminder, send_on_denial=False):
+                return False
 
         await self.bot.api_client.delete(f"bot/reminders/{id_}")
         self.scheduler.cancel(id_)
+        self._change_active_reminder_count(reminder["author"], -1)
         return True
 
+    async def _try_delete_reminder(self, ctx: Context, id_: int, reminder: dict | None = None) -> bool:
+        """Delete the reminder with `_delete_reminder`, returning `False` if it's locked."""
+        try:
+            return await self._delete_reminder(ctx, id_, reminder)
+        except LockedResourceError:
+            return False
+
     @remind_group.command("delete", aliases=("remove", "cancel"))
     async def delete_reminder(self, ctx: Context, ids: Greedy[int]) -> None:
         """Delete up to (and including) 5 of your active reminders."""
@@ -663,15 +762,20 @@ class Reminders(Cog):
             await send_denial(ctx, "You can only delete a maximum of 5 reminders at once.")
             return
 
-        deleted_ids = []
-        for id_ in set(ids):
-            try:
-                reminder_deleted = await self._delete_reminder(ctx, id_)
-            except LockedResourceError:
-                continue
-            else:
-                if reminder_deleted:
-                    deleted_ids.append(str(id_))
+        # Check which reminders belong to the author with a single request, then delete them all at once.
+        own_reminders = {reminder["id"]: reminder for reminder in await self.get_active_reminders(ctx.author.id)}
+        unique_ids = list(dict.fromkeys(ids))
+        own_ids = [id_ for id_ in unique_ids if id_ in own_reminders]
+        results = await asyncio.gather(*(self._try_delete_reminder(ctx, id_, own_reminders[id_]) for id_ in own_ids))
+        deleted = {id_ for id_, reminder_deleted in zip(own_ids, results, strict=True) if reminder_deleted}
+
+        # The other reminders can only be deleted by admins, each after confirmation, so they're done one by one.
+        if await has_any_role_check(ctx, Roles.admins):
+            for id_ in unique_ids:
+                if id_ not in own_reminders and await self._try_delete_reminder(ctx, id_):
+                    deleted.add(id_)
+
+        deleted_ids = [str(id_) for id_ in unique_ids if id_ in deleted]
 
         if deleted_ids:
             colour = discord.Colour.green()
@@ -704,15 +808,24 @@ class Reminders(Cog):
 
         The check passes if the user created the reminder, or if they are an admin (with confirmation).
         """
+        # Override error-handling so that a 404 message isn't sent to Discord when `send_on_denial` is `False`
+        reminder = await self._get_reminder(reminder_id, missing_ok=not send_on_denial)
+        if reminder is None:
+            return False
+        return await self._can_modify_reminder(ctx, reminder, send_on_denial)
+
+    async def _get_reminder(self, reminder_id: str | int, *, missing_ok: bool = False) -> dict | None:
+        """Fetch a reminder from the API, returning None if it doesn't exist and `missing_ok` is True."""
         try:
-            api_response = await self.bot.api_client.get(f"bot/reminders/{reminder_id}")
+            return await self.bot.api_client.get(f"bot/reminders/{reminder_id}")
         except ResponseCodeError as e:
-            # Override error-handling so that a 404 message isn't sent to Discord when `send_on_denial` is `False`
-            if not send_on_denial:
-                if e.status == 404:
-                    return False
+            if missing_ok and e.status == 404:
+                return None
             raise e
-        owner_id = api_response["author"]
+
+    async def _can_modify_reminder(self, ctx: Context, reminder: dict, send_on_denial: bool = True) -> bool:
+        """Check whether the given reminder can be modified by the ctx author, as described in `_can_modify`."""
+        owner_id = reminder["author"]
 
         if owner_id == ctx.author.id:
             log.debug(f"{ctx.author} is the reminder's author and passes the check.")
@@ -1,4 +1,6 @@
+import asyncio
 import contextlib
+import json
 from collections.abc import Iterable
 from functools import partial
 from operator import attrgetter
@@ -12,7 +14,7 @@ from pydis_core.utils.paste_service import PasteFile, send_to_paste_service
 from pydis_core.utils.regex import FORMATTED_CODE_REGEX, RAW_CODE_REGEX
 
 from bot.bot import Bot
-from bot.constants import BaseURLs, Channels, Emojis, MODERATION_ROLES, Roles, URLs
+from bot.constants import BaseURLs, Channels, Emojis, MODERATION_ROLES, Roles, Snekbox as SnekboxConfig, URLs
 from bot.decorators import redirect_output
 from bot.exts.filtering._filter_lists.extension import TXT_LIKE_FILES
 from bot.exts.help_channels._channel import is_help_forum_post
@@ -29,9 +31,11 @@ from bot.exts.utils.snekbox._constants import (
     SNEKBOX_ROLES,
     SupportedPythonVersions,
 )
-from bot.exts.utils.snekbox._eval import EvalJob, EvalResult
+from bot.exts.utils.snekbox._dispatcher import EvalDispatcher, EvalQueueFullError
+from bot.exts.utils.snekbox._eval import EvalJob, EvalResult, SIGKILL
 from bot.exts.utils.snekbox._io import FileAttachment
 from bot.log import get_logger
+from bot.utils.caching import TTLCache
 from bot.utils.lock import LockedResourceError, lock_arg
 
 if TYPE_CHECKING:
@@ -39,6 +43,9 @@ if TYPE_CHECKING:
 
 log = get_logger(__name__)
 
+# Results with larger attachments than this aren't cached, to bound the cache's memory use.
+MAX_CACHED_FILES_SIZE = 1024 * 1024
+
 # The timeit command should only output the very last line, so all other output should be suppressed.
 # This will be used as the setup code along with any setup code provided.
 TIMEIT_SETUP_WRAPPER = """
@@ -164,6 +171,13 @@ class Snekbox(Cog):
     def __init__(self, bot: Bot):
         self.bot = bot
         self.jobs = {}
+        self.dispatcher = EvalDispatcher(
+            SnekboxConfig.max_concurrent_jobs,
+            SnekboxConfig.max_queued_jobs,
+            bot.stats,
+        )
+        self.result_cache: TTLCache[str, EvalResult] = TTLCache(SnekboxConfig.cache_size, SnekboxConfig.cache_ttl)
+        self.pending_results: dict[str, asyncio.Task[EvalResult]] = {}
 
     def build_python_version_switcher_view(
         self,
@@ -190,7 +204,92 @@ class Snekbox(Cog):
         data = job.to_dict()
 
         async with self.bot.http_session.post(URLs.snekbox_eval_api, json=data, raise_for_status=True) as resp:
-            return EvalResult.from_dict(await resp.json())
+            body = await resp.read()
+
+        # Decoding the attachments of a large response can take a while, so don't block the event loop with it.
+        return await self.bot.loop.run_in_executor(None, self._parse_result, body)
+
+    @staticmethod
+    def _parse_result(body: bytes) -> EvalResult:
+        """Parse the snekbox response `body` into an `EvalResult`, decoding the previews of its text files."""
+        result = EvalResult.from_dict(json.loads(body))
+        for file in result.files:
+            if file.suffix in TXT_LIKE_FILES:
+                # Cached on the attachment, so the preview is only decoded once, here
+                _ = file.preview
+        return result
+
+    async def run_eval(self, ctx: Context, job: EvalJob) -> EvalResult:
+        """
+        Evaluate `job` and return the results, reusing those of identical jobs if result caching is enabled.
+
+        Only deterministic jobs are cached, and identical jobs evaluated concurrently share one evaluation.
+        Raise `EvalQueueFullError` if the job must be evaluated but the queue is full.
+        """
+        if not SnekboxConfig.cache_results:
+            return await self.queue_job(ctx, job)
+        if not job.is_cacheable:
+            self.bot.stats.incr("snekbox.cache.bypass")
+            return await self.queue_job(ctx, job)
+
+        key = job.cache_key
+        if (result := self.result_cache.get(key)) is not None:
+            self.bot.stats.incr("snekbox.cache.hit")
+            return result
+
+        if (task := self.pending_results.get(key)) is not None:
+            self.bot.stats.incr("snekbox.cache.coalesced")
+        else:
+            self.bot.stats.incr("snekbox.cache.miss")
+            task = asyncio.create_task(self.queue_job(ctx, job))
+            self.pending_results[key] = task
+            task.add_done_callback(partial(self._store_result, key))
+
+        # Shielded so the evaluation carries on for the other invocations waiting on it if this one is cancelled.
+        return await asyncio.shield(task)
+
+    def _store_result(self, key: str, task: asyncio.Task[EvalResult]) -> None:
+        """Cache the result of a finished evaluation if it's worth reusing."""
+        del self.pending_results[key]
+        if task.cancelled() or task.exception() is not None:
+            return
+
+        result = task.result()
+        # Failures and timeouts may depend on the sandbox's load rather than the code.
+        if result.returncode in (None, 255, 128 + SIGKILL):
+            return
+        if sum(len(file.content) for file in result.files) > MAX_CACHED_FILES_SIZE:
+            return
+        self.result_cache.set(key, result)
+
+    async def queue_job(self, ctx: Context, job: EvalJob) -> EvalResult:
+        """
+        Evaluate `job` once the dispatcher grants it a slot, and return the results.
+
+        If the job has to wait for a slot, its position in the queue is sent to the invoking channel
+        until it starts. Raise `EvalQueueFullError` if the queue is full.
+        """
+        queue_message = None
+
+        async def on_queued(position: int) -> None:
+            nonlocal queue_message
+            queue_message = await ctx.send(
+                f":hourglass: {ctx.author.mention} Your eval job is queued at position {position}, "
+                "it will start as soon as possible.",
+                allowed_mentions=AllowedMentions(users=[ctx.author]),
+            )
+
+        try:
+            async with self.dispatcher.slot(ctx.author.id, on_queued):
+                if queue_message is not None:
+                    with contextlib.suppress(HTTPException):
+                        await queue_message.delete()
+                    queue_message = None
+                return await self.post_job(job)
+        finally:
+            if queue_message is not None:
+                with contextlib.suppress(HTTPException):
+                    await queue_message.delete()
 
     async def upload_output(self, output: str) -> str | None:
         """Upload the job's output to a paste service and return a URL to it if successful."""
@@ -292,7 +391,7 @@ class Snekbox(Cog):
         msg = ""
 
         for file in text_files:
-            file_text = file.content.decode("utf-8", errors="replace") or "[Empty]"
+            file_text = file.preview or "[Empty]"
             # Override to always allow 1 line and <= 50 chars, since this is less than a link
             if len(file_text) <= 50 and not file_text.count("\n"):
                 msg += f"\n`{file.name}`\n```\n{file_text}\n```"
@@ -375,7 +474,7 @@ class Snekbox(Cog):
         Return the bot response.
         """
         async with ctx.typing():
-            result = await self.post_job(job)
+            result = await self.run_eval(ctx, job)
             # Collect stats of job fails + successes
             if result.returncode != 0:
                 self.bot.stats.incr("snekbox.python.fail")
@@ -550,6 +649,12 @@ class Snekbox(Cog):
                     "please wait for it to finish!"
                 )
                 return
+            except EvalQueueFullError:
+                await ctx.send(
+                    f"{ctx.author.mention} The eval queue is currently full - "
+                    "please try again in a little while!"
+                )
+                return
 
             # Store the bot's response message id per invocation, to ensure the `wait_for`s in `continue_job`
             # don't trigger if the response has already been replaced by a new response.
@@ -578,6 +683,9 @@ class Snekbox(Cog):
             If multiple codeblocks are in a message, all of them will be joined and evaluated,
             ignoring the text outside them.
 
+            The output of identical code may be reused for a few minutes. Add a `# no-cache`
+            comment to the code to always evaluate it again.
+
             The currently supported versions are {", ".join(get_args(SupportedPythonVersions))}.
 
             We've done our best to make this sandboxed, but do let us know if you manage to find an
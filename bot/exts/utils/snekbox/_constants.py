@@ -5,6 +5,15 @@ from bot.constants import Channels, Roles
 
 ANSI_REGEX = re.compile(r"\N{ESC}\[[0-9;:]*m")
 ESCAPE_REGEX = re.compile("[`\u202E\u200B]{3,}")
+# Names hinting that code may give a different result each time it runs, so its results shouldn't be reused.
+# Set displays and comprehensions are also nondeterministic, but are found by parsing the code instead.
+NONDETERMINISTIC_REGEX = re.compile(
+    r"\b(?:random|secrets|uuid|time|datetime|os|sys|threading|asyncio|concurrent|multiprocessing|subprocess"
+    r"|hash|id|set|frozenset|object|input|open|globals|locals|vars|dir|gc|tracemalloc|resource"
+    r"|__import__|importlib|builtins|__builtins__|eval|exec|compile|getattr)\b"
+)
+# A comment with which users can ask for their code to be evaluated again rather than reuse a cached result
+NO_CACHE_REGEX = re.compile(r"#\s*no-?cache\b", re.IGNORECASE)
 
 # Max to display in a codeblock before sending to a paste service
 # This also applies to text files
@@ -0,0 +1,131 @@
+"""Bot-wide admission control and scheduling of snekbox jobs."""
+
+import asyncio
+import time
+from collections import OrderedDict, deque
+from collections.abc import AsyncIterator, Awaitable, Callable, Iterator
+from contextlib import asynccontextmanager
+
+from pydis_core.async_stats import AsyncStatsClient
+
+from bot.log import get_logger
+
+log = get_logger(__name__)
+
+
+class EvalQueueFullError(RuntimeError):
+    """Raised when a job is submitted while the dispatcher's queue is full."""
+
+
+class EvalDispatcher:
+    """
+    Limits how many snekbox jobs run at once, and queues the rest fairly across users.
+
+    At most `max_concurrent` jobs hold a slot at the same time. Further jobs wait in a queue of at most
+    `max_queued` jobs, and are rejected with `EvalQueueFullError` once it's full.
+    Waiting jobs are granted slots round-robin between users, so one user queueing several jobs
+    doesn't delay everyone else's.
+
+    Queue depth, wait times and rejections are published through `stats` under `snekbox.queue`.
+    """
+
+    def __init__(self, max_concurrent: int, max_queued: int, stats: AsyncStatsClient):
+        self.max_concurrent = max_concurrent
+        self.max_queued = max_queued
+        self.stats = stats
+
+        self._running = 0
+        # Maps user IDs to their waiting jobs, in the order the users will next be granted a slot
+        self._waiting: OrderedDict[int, deque[asyncio.Future]] = OrderedDict()
+
+    @property
+    def queued(self) -> int:
+        """The number of jobs waiting for a slot."""
+        return sum(len(futures) for futures in self._waiting.values())
+
+    def _iter_queue(self) -> Iterator[asyncio.Future]:
+        """Yield the waiting jobs in the order they will be granted a slot."""
+        queues = [iter(futures) for futures in self._waiting.values()]
+        while queues:
+            remaining = []
+            for futures in queues:
+                if (future := next(futures, None)) is not None:
+                    yield future
+                    remaining.append(futures)
+            queues = remaining
+
+    def _grant_next(self) -> None:
+        """Give a free slot to the next waiting job, if there is one."""
+        while self._waiting and self._running < self.max_concurrent:
+            user_id, futures = next(iter(self._waiting.items()))
+            future = futures.popleft()
+            if futures:
+                # Move the user to the back of the line for their next job
+                self._waiting.move_to_end(user_id)
+            else:
+                del self._waiting[user_id]
+
+            if not future.done():
+                self._running += 1
+                future.set_result(None)
+
+        self.stats.gauge("snekbox.queue.depth", self.queued)
+
+    def _remove_waiting(self, user_id: int, future: asyncio.Future) -> None:
+        """Remove a job which stopped waiting from the queue."""
+        futures = self._waiting.get(user_id)
+        if futures is None or future not in futures:
+            return
+        futures.remove(future)
+        if not futures:
+            del self._waiting[user_id]
+
+    @asynccontextmanager
+    async def slot(
+        self,
+        user_id: int,
+        on_queued: Callable[[int], Awaitable[None]] | None = None,
+    ) -> AsyncIterator[None]:
+        """
+        Hold a slot for running a job on behalf of `user_id` for the duration of the context.
+
+        If no slot is free, the job is queued and `on_queued` is awaited with its 1-based position in the queue.
+        Raise `EvalQueueFullError` if the queue is full.
+        """
+        if self._running < self.max_concurrent and not self._waiting:
+            self._running += 1
+            self.stats.timing("snekbox.queue.wait_time", 0)
+        else:
+            if self.queued >= self.max_queued:
+                log.info(f"Rejecting snekbox job from {user_id}: the queue is full.")
+                self.stats.incr("snekbox.queue.rejected")
+                raise EvalQueueFullError(f"The snekbox queue is full ({self.max_queued} jobs waiting).")
+
+            future = asyncio.get_running_loop().create_future()
+            self._waiting.setdefault(user_id, deque()).append(future)
+            self.stats.gauge("snekbox.queue.depth", self.queued)
+            start = time.monotonic()
+
+            try:
+                if on_queued is not None:
+                    position = next(i for i, queued in enumerate(self._iter_queue(), 1) if queued is future)
+                    await on_queued(position)
+                await future
+            except BaseException:
+                if future.done() and not future.cancelled():
+                    # The slot was granted as the wait was interrupted, so pass it on
+                    self._running -= 1
+                    self._grant_next()
+                else:
+                    future.cancel()
+                    self._remove_waiting(user_id, future)
+                    self.stats.gauge("snekbox.queue.depth", self.queued)
+                raise
+
+            self.stats.timing("snekbox.queue.wait_time", (time.monotonic() - start) * 1000)
+
+        try:
+            yield
+        finally:
+            self._running -= 1
+            self._grant_next()
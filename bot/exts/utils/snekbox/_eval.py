@@ -1,11 +1,18 @@
+import ast
 import contextlib
+import hashlib
 from dataclasses import dataclass, field
 from signal import Signals
 
 from discord.utils import escape_markdown, escape_mentions
 
 from bot.constants import Emojis
-from bot.exts.utils.snekbox._constants import DEFAULT_PYTHON_VERSION, SupportedPythonVersions
+from bot.exts.utils.snekbox._constants import (
+    DEFAULT_PYTHON_VERSION,
+    NONDETERMINISTIC_REGEX,
+    NO_CACHE_REGEX,
+    SupportedPythonVersions,
+)
 from bot.exts.utils.snekbox._io import FILE_COUNT_LIMIT, FILE_SIZE_LIMIT, FileAttachment, sizeof_fmt
 from bot.log import get_logger
 
@@ -40,6 +47,34 @@ class EvalJob:
             version=version,
         )
 
+    @property
+    def cache_key(self) -> str:
+        """Return a digest identifying the job's args, files and Python version."""
+        digest = hashlib.sha256(self.version.encode())
+        for part in (*self.args, *(file.filename for file in self.files)):
+            digest.update(b"\0" + part.encode())
+        for file in self.files:
+            digest.update(b"\0" + hashlib.sha256(file.content).digest())
+        return digest.hexdigest()
+
+    @property
+    def is_cacheable(self) -> bool:
+        """
+        Return whether the job's result may be reused for identical jobs.
+
+        Timings are never reproducible, and neither are jobs which look like they use randomness,
+        the clock, the environment, object identities or the iteration order of sets.
+        Users can also opt out of the cache with a `# no-cache` comment.
+        """
+        if self.name == "timeit":
+            return False
+
+        sources = [file.content.decode("utf-8", errors="replace") for file in self.files]
+        text = "\n".join((*self.args, *sources))
+        if NO_CACHE_REGEX.search(text) or NONDETERMINISTIC_REGEX.search(text):
+            return False
+        return not any(_uses_sets(source) for source in sources)
+
     def to_dict(self) -> dict[str, list[str | dict[str, str]]]:
         """Convert the job to a dict."""
         return {
@@ -49,6 +84,16 @@ class EvalJob:
         }
 
 
+def _uses_sets(source: str) -> bool:
+    """Return True if `source` may contain a set display or comprehension."""
+    try:
+        tree = ast.parse(source)
+    except (SyntaxError, ValueError):
+        # The code may use syntax which only the version it's evaluated with supports.
+        return True
+    return any(isinstance(node, ast.Set | ast.SetComp) for node in ast.walk(tree))
+
+
 @dataclass(frozen=True)
 class EvalResult:
     """The result of an eval job."""
@@ -2,11 +2,13 @@
 
 from base64 import b64decode, b64encode
 from dataclasses import dataclass
+from functools import cached_property
 from io import BytesIO
 from pathlib import PurePosixPath
 
 import regex
 from discord import File
+from pydis_core.utils.paste_service import MAX_PASTE_SIZE
 
 # Note discord bot upload limit is 8 MiB per file,
 # or 50 MiB for lvl 2 boosted servers
@@ -15,6 +17,10 @@ FILE_SIZE_LIMIT = 8 * 1024 * 1024
 # Discord currently has a 10-file limit per message
 FILE_COUNT_LIMIT = 10
 
+# Text previews only need to cover what could be uploaded to the paste service.
+# The extra byte keeps longer files too long to upload.
+PREVIEW_SIZE_LIMIT = MAX_PASTE_SIZE + 1
+
 
 # ANSI escape sequences
 RE_ANSI = regex.compile(r"\\u.*\[(.*?)m")
@@ -70,6 +76,11 @@ class FileAttachment:
         """Return the file name."""
         return PurePosixPath(self.filename).name
 
+    @cached_property
+    def preview(self) -> str:
+        """Return the start of the content decoded as text, up to `PREVIEW_SIZE_LIMIT` bytes."""
+        return self.content[:PREVIEW_SIZE_LIMIT].decode("utf-8", errors="replace")
+
     @classmethod
     def from_dict(cls, data: dict, size_limit: int = FILE_SIZE_LIMIT) -> FileAttachment:
         """Create a FileAttachment from a dict response."""
@@ -1,9 +1,13 @@
+import asyncio
+import time
+from collections.abc import Iterable
 
 import discord
 import sentry_sdk
+from async_rediscache import RedisCache
 from discord.ext import commands
 from pydis_core.site_api import ResponseCodeError
-from pydis_core.utils.channel import get_or_fetch_channel
+from pydis_core.utils import scheduling
 
 from bot import constants
 from bot.bot import Bot
@@ -12,13 +16,22 @@ from bot.pagination import LinePaginator
 
 log = get_logger(__name__)
 THREAD_BUMP_ENDPOINT = "bot/bumped-threads"
+# How many requests to Discord or the site are made at the same time while reconciling bumped threads
+MAX_CONCURRENT_REQUESTS = 5
+# How many archived threads of a channel are listed while looking for bumped threads, before fetching them instead
+MAX_ARCHIVED_THREADS_LISTED = 1000
 
 
 class ThreadBumper(commands.Cog):
     """Cog that allow users to add the current thread to a list that get reopened on archive."""
 
+    # The parent channel of each bumped thread, so archived ones can be found by listing their parent's threads
+    thread_parents = RedisCache()
+
     def __init__(self, bot: Bot):
         self.bot = bot
+        self.request_semaphore = asyncio.Semaphore(MAX_CONCURRENT_REQUESTS)
+        self.reconcile_task: asyncio.Task | None = None
 
     async def thread_exists_in_site(self, thread_id: int) -> bool:
         """Return whether the given thread_id exists in the site api's bump list."""
@@ -36,22 +49,34 @@ class ThreadBumper(commands.Cog):
             # A status other than 204/404 is undefined behaviour from site. Raise error for investigation.
             raise ResponseCodeError(response, response.text())
 
-    async def unarchive_threads_not_manually_archived(self, threads: list[discord.Thread]) -> None:
+    async def remove_threads_from_site(self, thread_ids: Iterable[int]) -> None:
+        """Remove the given threads from the site's bump list, a few requests at a time."""
+        async def remove(thread_id: int) -> None:
+            async with self.request_semaphore:
+                await self.bot.api_client.delete(f"{THREAD_BUMP_ENDPOINT}/{thread_id}")
+            await self.thread_parents.delete(thread_id)
+
+        await asyncio.gather(*(remove(thread_id) for thread_id in thread_ids))
+
+    async def unarchive_threads_not_manually_archived(self, threads: list[discord.Thread]) -> int:
         """
-        Iterate through and unarchive any threads that weren't manually archived recently.
+        Unarchive any threads that weren't manually archived recently, and return how many were unarchived.
 
         This is done by extracting the manually archived threads from the audit log.
+        Those are removed from the bump list instead.
 
         Only the last 200 thread_update logs are checked,
         as this is assumed to be more than enough to cover bot downtime.
         """
         guild = self.bot.get_guild(constants.Guild.id)
 
-        recent_manually_archived_thread_ids = []
+        recent_manually_archived_thread_ids = set()
         async for thread_update in guild.audit_logs(limit=200, action=discord.AuditLogAction.thread_update):
             if getattr(thread_update.after, "archived", False):
-                recent_manually_archived_thread_ids.append(thread_update.target.id)
+                recent_manually_archived_thread_ids.add(thread_update.target.id)
 
+        to_remove = []
+        to_unarchive = []
         for thread in threads:
             if thread.id in recent_manually_archived_thread_ids:
                 log.info(
@@ -59,37 +84,128 @@ class ThreadBumper(commands.Cog):
                     thread.name,
                     thread.id
                 )
-                await self.bot.api_client.delete(f"{THREAD_BUMP_ENDPOINT}/{thread.id}")
+                to_remove.append(thread.id)
             else:
+                to_unarchive.append(thread)
+
+        async def unarchive(thread: discord.Thread) -> None:
+            async with self.request_semaphore:
                 await thread.edit(archived=False)
 
-    async def cog_load(self) -> None:
+        await asyncio.gather(
+            self.remove_threads_from_site(to_remove),
+            *(unarchive(thread) for thread in to_unarchive)
+        )
+        return len(to_unarchive)
+
+    async def list_archived_threads(self, parent_id: int, thread_ids: set[int]) -> dict[int, discord.Thread]:
+        """
+        Return the threads with `thread_ids` found among the archived threads of the channel with `parent_id`.
+
+        The channel's archived threads are listed until all the threads are found, or until
+        `MAX_ARCHIVED_THREADS_LISTED` threads were listed.
+        """
+        parent = self.bot.get_channel(parent_id)
+        if not isinstance(parent, discord.TextChannel | discord.ForumChannel):
+            return {}
+
+        found = {}
+        async with self.request_semaphore:
+            async for thread in parent.archived_threads(limit=MAX_ARCHIVED_THREADS_LISTED):
+                if thread.id in thread_ids:
+                    found[thread.id] = thread
+                    if len(found) == len(thread_ids):
+                        break
+        return found
+
+    async def fetch_bumped_thread(self, thread_id: int) -> discord.Thread | None:
+        """Fetch the bumped thread with the given ID, or return None if it was deleted or isn't a thread."""
+        async with self.request_semaphore:
+            try:
+                thread = await self.bot.fetch_channel(thread_id)
+            except discord.NotFound:
+                log.info("Thread %d has been deleted, removing from bumped threads.", thread_id)
+                return None
+
+        if not isinstance(thread, discord.Thread):
+            return None
+        return thread
+
+    async def resolve_bumped_threads(self, thread_ids: list[int]) -> dict[int, discord.Thread | None]:
+        """
+        Return the bumped threads with the given IDs, or None for those which were deleted or aren't threads.
+
+        Active threads come from the cache. Archived threads are looked for in a single listing of the archived
+        threads of their parent channel, and only those which aren't found there are fetched one by one.
+        """
+        threads: dict[int, discord.Thread | None] = {}
+        for thread_id in thread_ids:
+            if isinstance(thread := self.bot.get_channel(thread_id), discord.Thread):
+                threads[thread_id] = thread
+
+        parents = await self.thread_parents.to_dict()
+        ids_by_parent: dict[int, set[int]] = {}
+        for thread_id in thread_ids:
+            if thread_id not in threads and (parent_id := parents.get(thread_id)) is not None:
+                ids_by_parent.setdefault(parent_id, set()).add(thread_id)
+
+        for found in await asyncio.gather(
+            *(self.list_archived_threads(parent_id, ids) for parent_id, ids in ids_by_parent.items())
+        ):
+            threads.update(found)
+
+        to_fetch = [thread_id for thread_id in thread_ids if thread_id not in threads]
+        fetched = await asyncio.gather(*(self.fetch_bumped_thread(thread_id) for thread_id in to_fetch))
+        threads.update(zip(to_fetch, fetched, strict=True))
+
+        # Remember the parents of the threads found, so they can be listed rather than fetched next time.
+        new_parents = {
+            thread_id: thread.parent_id
+            for thread_id, thread in threads.items()
+            if thread is not None and parents.get(thread_id) != thread.parent_id
+        }
+        if new_parents:
+            await self.thread_parents.update(new_parents)
+        return threads
+
+    async def reconcile_bumped_threads(self) -> None:
         """Ensure bumped threads are active, since threads could have been archived while the bot was down."""
         await self.bot.wait_until_guild_available()
+        start = time.monotonic()
 
-        threads_to_maybe_bump = []
         with sentry_sdk.start_span(description="Fetch threads to bump from site"):
             bumped_threads_from_site = await self.bot.api_client.get(THREAD_BUMP_ENDPOINT)
 
         with sentry_sdk.start_span(description="Sync bumped threads in site with current guild state"):
-            for thread_id in bumped_threads_from_site:
-                try:
-                    thread = await get_or_fetch_channel(self.bot, thread_id)
-                except discord.NotFound:
-                    log.info("Thread %d has been deleted, removing from bumped threads.", thread_id)
-                    await self.bot.api_client.delete(f"{THREAD_BUMP_ENDPOINT}/{thread_id}")
-                    continue
-
-                if not isinstance(thread, discord.Thread):
-                    await self.bot.api_client.delete(f"{THREAD_BUMP_ENDPOINT}/{thread_id}")
-                    continue
-
-                if thread.archived:
-                    threads_to_maybe_bump.append(thread)
+            threads = await self.resolve_bumped_threads(bumped_threads_from_site)
+            stale_thread_ids = [thread_id for thread_id, thread in threads.items() if thread is None]
+            threads_to_maybe_bump = [thread for thread in threads.values() if thread is not None and thread.archived]
+            await self.remove_threads_from_site(stale_thread_ids)
 
+        unarchived = 0
         with sentry_sdk.start_span(description="Unarchive threads that should be bumped"):
             if threads_to_maybe_bump:
-                await self.unarchive_threads_not_manually_archived(threads_to_maybe_bump)
+                unarchived = await self.unarchive_threads_not_manually_archived(threads_to_maybe_bump)
+
+        duration = time.monotonic() - start
+        self.bot.stats.timing("thread_bumper.reconcile.duration", duration * 1000)
+        self.bot.stats.gauge("thread_bumper.reconcile.threads", len(bumped_threads_from_site))
+        log.info(
+            "Reconciled %d bumped threads in %.2fs: removed %d stale threads and unarchived %d.",
+            len(bumped_threads_from_site),
+            duration,
+            len(stale_thread_ids),
+            unarchived,
+        )
+
+    async def cog_load(self) -> None:
+        """Reconcile the bumped threads in the background, so the cog doesn't delay the bot's readiness."""
+        self.reconcile_task = scheduling.create_task(self.reconcile_bumped_threads())
+
+    async def cog_unload(self) -> None:
+        """Stop reconciling the bumped threads if it's still in progress."""
+        if self.reconcile_task is not None:
+            self.reconcile_task.cancel()
 
     @commands.group(name="bump")
     async def thread_bump_group(self, ctx: commands.Context) -> None:
@@ -110,6 +226,7 @@ class ThreadBumper(commands.Cog):
             raise commands.BadArgument("This thread is already in the bump list.")
 
         await self.bot.api_client.post(THREAD_BUMP_ENDPOINT, data={"thread_id": thread.id})
+        await self.thread_parents.set(thread.id, thread.parent_id)
         await ctx.send(f":ok_hand:{thread.mention} has been added to the bump list.")
 
     @thread_bump_group.command(name="remove", aliases=("r", "rem", "d", "del", "delete"))
@@ -125,6 +242,7 @@ class ThreadBumper(commands.Cog):
             raise commands.BadArgument("This thread is not in the bump list.")
 
         await self.bot.api_client.delete(f"{THREAD_BUMP_ENDPOINT}/{thread.id}")
+        await self.thread_parents.delete(thread.id)
         await ctx.send(f":ok_hand: {thread.mention} has been removed from the bump list.")
 
     @thread_bump_group.command(name="list", aliases=("get",))
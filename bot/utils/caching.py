@@ -0,0 +1,60 @@
+import time
+import typing as t
+from collections import OrderedDict
+
+_MISSING = object()
+
+
+class TTLCache[K, V]:
+    """
+    A bounded mapping whose entries expire a fixed number of seconds after being set.
+
+    Once the cache holds `max_size` entries, setting a new key evicts the least recently used one.
+    Expired entries are dropped lazily, when they are next looked up.
+    """
+
+    def __init__(self, max_size: int, ttl: float):
+        if max_size <= 0:
+            raise ValueError("max_size must be positive")
+        self.max_size = max_size
+        self.ttl = ttl
+
+        self._data: OrderedDict[K, tuple[float, V]] = OrderedDict()
+
+    def get(self, key: K, default: t.Any = None) -> V | t.Any:
+        """Return the value for `key` if it's cached and not expired, else `default`."""
+        entry = self._data.get(key, _MISSING)
+        if entry is _MISSING:
+            return default
+
+        expires_at, value = entry
+        if time.monotonic() >= expires_at:
+            del self._data[key]
+            return default
+
+        self._data.move_to_end(key)
+        return value
+
+    def set(self, key: K, value: V) -> None:
+        """Cache `value` under `key`, evicting the least recently used entry if the cache is full."""
+        self._data[key] = (time.monotonic() + self.ttl, value)
+        self._data.move_to_end(key)
+        while len(self._data) > self.max_size:
+            self._data.popitem(last=False)
+
+    def pop(self, key: K, default: t.Any = None) -> V | t.Any:
+        """Remove `key` from the cache and return its value if it wasn't expired, else `default`."""
+        entry = self._data.pop(key, _MISSING)
+        if entry is _MISSING or time.monotonic() >= entry[0]:
+            return default
+        return entry[1]
+
+    def clear(self) -> None:
+        """Remove all entries from the cache."""
+        self._data.clear()
+
+    def __contains__(self, key: K) -> bool:
+        return self.get(key, _MISSING) is not _MISSING
+
+    def __len__(self) -> int:
+        return len(self._data)
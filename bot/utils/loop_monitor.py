@@ -0,0 +1,157 @@
+import asyncio
+import sys
+import threading
+import time
+import traceback
+from dataclasses import dataclass
+from pathlib import Path
+
+from pydis_core.async_stats import AsyncStatsClient
+
+from bot.log import get_logger
+
+log = get_logger(__name__)
+
+ASYNCIO_DIRECTORY = Path(asyncio.__file__).parent
+BOT_DIRECTORY = Path(__file__).parents[1]
+# How many frames of a slow callback's stack to keep
+MAX_STACK_FRAMES = 15
+
+
+@dataclass
+class SlowCallback:
+    """A place in the code which blocked the event loop for too long."""
+
+    location: str
+    stack: str
+    count: int = 0
+    worst_duration: float = 0
+    last_seen: float = 0
+
+
+class LoopMonitor:
+    """
+    Watch an event loop for scheduling lag, and for callbacks which block it.
+
+    A heartbeat is scheduled on the loop every `interval` seconds, and how late it runs is reported under
+    `event_loop.lag`. A watchdog thread checks on the heartbeat, and once it's more than `threshold` seconds
+    late, captures the stack of the code blocking the loop. The places in the code which blocked the loop are
+    kept in `slow_callbacks`, and counted under `event_loop.slow_callbacks`.
+    """
+
+    def __init__(
+        self,
+        loop: asyncio.AbstractEventLoop,
+        stats: AsyncStatsClient,
+        *,
+        interval: float = 0.5,
+        threshold: float = 0.1,
+        max_slow_callbacks: int = 50,
+    ):
+        self.loop = loop
+        self.stats = stats
+        self.interval = interval
+        self.threshold = threshold
+        self.max_slow_callbacks = max_slow_callbacks
+
+        self.slow_callbacks: dict[str, SlowCallback] = {}
+        self.worst_lag = 0.0
+
+        self._loop_thread_id: int | None = None
+        self._due = 0.0
+        self._heartbeat: asyncio.TimerHandle | None = None
+        self._watchdog: threading.Thread | None = None
+        self._stopped = threading.Event()
+        # The location and stack captured by the watchdog during the current stall, if any
+        self._captured: tuple[str, str] | None = None
+        self._lock = threading.Lock()
+
+    def start(self) -> None:
+        """Start monitoring the loop. This must be called from the loop's thread."""
+        self._loop_thread_id = threading.get_ident()
+        self._stopped.clear()
+        self._schedule_heartbeat()
+        self._watchdog = threading.Thread(target=self._watch, name="loop-monitor", daemon=True)
+        self._watchdog.start()
+
+    def stop(self) -> None:
+        """Stop monitoring the loop."""
+        self._stopped.set()
+        if self._heartbeat is not None:
+            self._heartbeat.cancel()
+            self._heartbeat = None
+
+    def _schedule_heartbeat(self) -> None:
+        self._due = time.monotonic() + self.interval
+        self._heartbeat = self.loop.call_later(self.interval, self._beat)
+
+    def _beat(self) -> None:
+        """Report how late the heartbeat ran, and record what blocked the loop if the watchdog caught it."""
+        lag = max(time.monotonic() - self._due, 0)
+        self.worst_lag = max(self.worst_lag, lag)
+        self.stats.timing("event_loop.lag", lag * 1000)
+
+        with self._lock:
+            captured, self._captured = self._captured, None
+        if captured is not None:
+            self._record(*captured, lag)
+
+        self._schedule_heartbeat()
+
+    def _record(self, location: str, stack: str, duration: float) -> None:
+        """Record that the code at `location` blocked the loop for `duration` seconds."""
+        log.warning(f"The event loop was blocked for {duration * 1000:.0f}ms by {location}.")
+        self.stats.incr("event_loop.slow_callbacks")
+
+        if (slow_callback := self.slow_callbacks.get(location)) is None:
+            if len(self.slow_callbacks) >= self.max_slow_callbacks:
+                # Make room by forgetting the least severe offender.
+                least_severe = min(self.slow_callbacks.values(), key=lambda callback: callback.worst_duration)
+                del self.slow_callbacks[least_severe.location]
+            slow_callback = self.slow_callbacks[location] = SlowCallback(location, stack)
+
+        slow_callback.count += 1
+        slow_callback.last_seen = time.time()
+        if duration >= slow_callback.worst_duration:
+            slow_callback.worst_duration = duration
+            slow_callback.stack = stack
+
+    def _watch(self) -> None:
+        """Check on the heartbeat from another thread, capturing the loop's stack once it's late enough."""
+        captured_for = None
+        while not self._stopped.wait(self.threshold / 4):
+            due = self._due
+            if captured_for == due or time.monotonic() - due < self.threshold:
+                continue
+
+            frame = sys._current_frames().get(self._loop_thread_id)
+            if frame is None:
+                continue
+
+            captured_for = due
+            captured = self._describe_stack(traceback.extract_stack(frame))
+            with self._lock:
+                self._captured = captured
+
+    @staticmethod
+    def _describe_stack(stack: traceback.StackSummary) -> tuple[str, str]:
+        """
+        Return where the blocking code was called from, and its formatted stack.
+
+        The location is the innermost frame in the bot's own code, or if there isn't one,
+        the first frame after the loop's own frames, i.e. the callback or coroutine that was run.
+        """
+        start = 0
+        for i, frame in enumerate(stack):
+            if Path(frame.filename).parent == ASYNCIO_DIRECTORY:
+                start = i + 1
+        stack = stack[start:] or stack
+
+        bot_frames = [frame for frame in stack if Path(frame.filename).is_relative_to(BOT_DIRECTORY)]
+        entry = bot_frames[-1] if bot_frames else stack[0]
+        location = f"{entry.name} ({Path(entry.filename).name}:{entry.lineno})"
+        return location, "".join(traceback.format_list(stack[-MAX_STACK_FRAMES:]))
+
+    def get_worst_offenders(self, limit: int | None = None) -> list[SlowCallback]:
+        """Return up to `limit` of the places which blocked the loop, from the longest blocking to the shortest."""
+        return sorted(self.slow_callbacks.values(), key=lambda callback: callback.worst_duration, reverse=True)[:limit]
@@ -0,0 +1,189 @@
+import asyncio
+import copy
+import json
+import time
+from collections import defaultdict
+from collections.abc import Mapping
+from dataclasses import dataclass
+from typing import Any
+
+from pydis_core.async_stats import AsyncStatsClient
+from pydis_core.site_api import APIClient
+
+from bot.log import get_logger
+from bot.utils.caching import TTLCache
+
+log = get_logger(__name__)
+
+_MISSING = object()
+
+# How long, in seconds, responses from each resource may be served from the cache
+CACHED_ENDPOINTS = {
+    "bot/infractions": 5,
+    "bot/off-topic-channel-names": 30,
+    "bot/reminders": 10,
+    "bot/users": 10,
+}
+# How many responses to cache for each resource
+MAX_CACHED_RESPONSES = 500
+# Query parameters asking for a different response each time, so requests using them are never shared
+NONDETERMINISTIC_PARAMS = frozenset({"random_items"})
+
+type _RequestKey = tuple[str, str, bool, str]
+
+
+@dataclass
+class _InFlight:
+    """A GET request which is being sent, and how many callers are waiting for its response."""
+
+    task: asyncio.Task
+    waiters: int = 0
+
+
+class SiteAPIClient(APIClient):
+    """
+    An `APIClient` which merges concurrent identical GET requests, and can cache their responses.
+
+    A GET request which is identical to one already being sent waits for that request's response instead
+    of sending its own. Responses from the resources in `cache_ttls`, such as `bot/reminders`, are also cached
+    for the given number of seconds. Any other request to a resource, such as a PATCH to `bot/reminders/1`,
+    clears its cache and stops GET requests sent before it from being shared or cached.
+
+    The latency of each request is sent under `site_api.latency.<method>`, cache lookups under
+    `site_api.cache.hit` and `site_api.cache.miss`, and merged requests under `site_api.coalesced`.
+    """
+
+    def __init__(
+        self,
+        site_api_url: str,
+        site_api_token: str,
+        *,
+        cache_ttls: Mapping[str, float] | None = None,
+        **session_kwargs,
+    ):
+        super().__init__(site_api_url, site_api_token, **session_kwargs)
+        # Set once the bot's stats client exists, as the API client has to be created before it.
+        self.stats: AsyncStatsClient | None = None
+        self.caches: dict[str, TTLCache[_RequestKey, Any]] = {
+            resource: TTLCache(MAX_CACHED_RESPONSES, ttl) for resource, ttl in (cache_ttls or {}).items()
+        }
+
+        self._in_flight: dict[_RequestKey, _InFlight] = {}
+        # Incremented on each write to a resource, so responses to GET requests sent before it aren't cached
+        self._generations: defaultdict[str, int] = defaultdict(int)
+
+    async def close(self) -> None:
+        """Cancel the GET requests which are being sent, then close the aiohttp session."""
+        for in_flight in self._in_flight.values():
+            in_flight.task.cancel()
+        self._in_flight.clear()
+        await super().close()
+
+    def _resource(self, endpoint: str) -> str:
+        """Return the resource `endpoint` belongs to, e.g. `bot/reminders` for `bot/reminders/1`."""
+        for resource in self.caches:
+            if endpoint == resource or endpoint.startswith(f"{resource}/"):
+                return resource
+        return "/".join(endpoint.split("/", 2)[:2])
+
+    def _request_key(self, endpoint: str, raise_for_status: bool, kwargs: dict) -> _RequestKey | None:
+        """Return what identifies a GET request, or None if its response shouldn't be shared."""
+        if kwargs.keys() - {"params"}:
+            return None
+
+        params = kwargs.get("params") or {}
+        if not isinstance(params, Mapping) or NONDETERMINISTIC_PARAMS & params.keys():
+            return None
+
+        return self._resource(endpoint), endpoint, raise_for_status, json.dumps(params, sort_keys=True, default=str)
+
+    def _incr(self, stat: str) -> None:
+        if self.stats is not None:
+            self.stats.incr(stat)
+
+    async def request(self, method: str, endpoint: str, *, raise_for_status: bool = True, **kwargs) -> dict | None:
+        """
+        Send an HTTP request to the site API and return the JSON response.
+
+        GET requests are merged with identical ones which are already being sent, or served from the cache
+        when possible. Any other request invalidates the cached and in-flight GET requests to the same resource.
+        """
+        method = method.upper()
+        if method != "GET":
+            return await self._write(method, endpoint, raise_for_status=raise_for_status, **kwargs)
+
+        key = self._request_key(endpoint, raise_for_status, kwargs)
+        if key is None:
+            return await self._send(method, endpoint, raise_for_status=raise_for_status, **kwargs)
+
+        if (cache := self.caches.get(key[0])) is not None:
+            response = cache.get(key, _MISSING)
+            if response is not _MISSING:
+                self._incr("site_api.cache.hit")
+                return copy.deepcopy(response)
+            self._incr("site_api.cache.miss")
+
+        if (in_flight := self._in_flight.get(key)) is None:
+            task = asyncio.create_task(self._fetch(key, **kwargs))
+            task.add_done_callback(_retrieve_exception)
+            in_flight = self._in_flight[key] = _InFlight(task)
+        else:
+            self._incr("site_api.coalesced")
+
+        in_flight.waiters += 1
+        try:
+            # Shielded, so a caller being cancelled doesn't cancel the request for the other callers.
+            response = await asyncio.shield(in_flight.task)
+        finally:
+            in_flight.waiters -= 1
+
+        # Every caller but the last gets its own copy, in case any of them modifies the response.
+        return response if in_flight.waiters == 0 else copy.deepcopy(response)
+
+    async def _fetch(self, key: _RequestKey, **kwargs) -> Any:
+        """Send the GET request identified by `key`, and cache its response if nothing was written since."""
+        resource, endpoint, raise_for_status, _ = key
+        generation = self._generations[resource]
+        try:
+            response = await self._send("GET", endpoint, raise_for_status=raise_for_status, **kwargs)
+        finally:
+            in_flight = self._in_flight.get(key)
+            if in_flight is not None and in_flight.task is asyncio.current_task():
+                del self._in_flight[key]
+
+        if generation == self._generations[resource] and (cache := self.caches.get(resource)) is not None:
+            cache.set(key, copy.deepcopy(response))
+        return response
+
+    async def _write(self, method: str, endpoint: str, **kwargs) -> dict | None:
+        """Send a request which modifies `endpoint`, invalidating the GET requests to its resource around it."""
+        resource = self._resource(endpoint)
+        self._invalidate(resource)
+        try:
+            return await self._send(method, endpoint, **kwargs)
+        finally:
+            # GET requests sent while this one was processed may have been answered before the change was made.
+            self._invalidate(resource)
+
+    def _invalidate(self, resource: str) -> None:
+        """Clear the cached responses from `resource`, and stop sharing the GET requests to it being sent."""
+        self._generations[resource] += 1
+        if (cache := self.caches.get(resource)) is not None:
+            cache.clear()
+        for key in [key for key in self._in_flight if key[0] == resource]:
+            del self._in_flight[key]
+
+    async def _send(self, method: str, endpoint: str, **kwargs) -> dict | None:
+        """Send a request to the site API, timing how long it took."""
+        start = time.perf_counter()
+        try:
+            return await super().request(method, endpoint, **kwargs)
+        finally:
+            if self.stats is not None:
+                self.stats.timing(f"site_api.latency.{method.lower()}", (time.perf_counter() - start) * 1000)
+
+
+def _retrieve_exception(task: asyncio.Task) -> None:
+    """Mark the exception of a GET request as retrieved, as all the callers waiting for it may have been cancelled."""
+    if not task.cancelled():
+        task.exception()
@@ -0,0 +1,256 @@
+import asyncio
+import functools
+import re
+import time
+from collections import defaultdict, deque
+from collections.abc import Callable, Coroutine
+from dataclasses import dataclass, field
+from typing import Any
+
+from discord.ext import commands
+from pydis_core.async_stats import AsyncStatsClient
+
+from bot.log import get_logger
+
+log = get_logger(__name__)
+
+# The largest packet which should fit in a single datagram on common networks
+MAX_PACKET_SIZE = 1432
+# How many of the most recent durations of each listener to keep for percentiles
+LISTENER_SAMPLES = 1000
+# Characters which can't be part of a stat name, such as the spaces in some cogs' names
+UNSAFE_STAT_CHARACTERS = re.compile(r"\W+")
+
+
+class BufferedStatsClient(AsyncStatsClient):
+    """
+    An `AsyncStatsClient` which aggregates metrics in memory and sends them in batches.
+
+    Counters are summed and gauges keep their latest value until the next flush, while timings and any other
+    metrics are kept as they are. Buffered metrics are flushed every `flush_interval` seconds, or as soon as
+    `max_buffered` of them are waiting, packed into as few packets of at most `MAX_PACKET_SIZE` bytes as possible.
+
+    How long each flush took is reported under `stats.flush_time`, and how many metrics couldn't be sent under
+    `stats.dropped`.
+    """
+
+    def __init__(
+        self,
+        loop: asyncio.AbstractEventLoop,
+        host: str = "localhost",
+        port: int = 8125,
+        prefix: str | None = None,
+        *,
+        flush_interval: float = 1,
+        max_buffered: int = 1000,
+    ):
+        super().__init__(loop, host, port, prefix)
+        self.flush_interval = flush_interval
+        self.max_buffered = max_buffered
+        self.dropped = 0
+
+        self._counters: defaultdict[str, int] = defaultdict(int)
+        self._gauges: dict[str, float] = {}
+        self._gauge_deltas: defaultdict[str, float] = defaultdict(float)
+        self._lines: list[str] = []
+        # The client's own metrics, which are sent with the next flush but don't cause one by themselves
+        self._unreported_dropped = 0
+        self._last_flush_time: float | None = None
+        self._flush_handle: asyncio.TimerHandle | None = None
+
+    @property
+    def buffered(self) -> int:
+        """The number of metrics waiting to be sent."""
+        return len(self._counters) + len(self._gauges) + len(self._gauge_deltas) + len(self._lines)
+
+    async def create_socket(self) -> None:
+        """Create the socket, then start flushing metrics periodically."""
+        await super().create_socket()
+        self._schedule_flush()
+
+    def stop(self) -> None:
+        """Stop flushing metrics periodically, and flush the ones which are still buffered."""
+        if self._flush_handle is not None:
+            self._flush_handle.cancel()
+            self._flush_handle = None
+        self.flush()
+
+    def _schedule_flush(self) -> None:
+        self._flush_handle = self._loop.call_later(self.flush_interval, self._flush_periodically)
+
+    def _flush_periodically(self) -> None:
+        self.flush()
+        self._schedule_flush()
+
+    def _name(self, stat: str) -> str:
+        return f"{self._prefix}.{stat}" if self._prefix else stat
+
+    def incr(self, stat: str, count: int = 1, rate: float = 1) -> None:
+        """Increment a counter by `count`, aggregating it with previous increments until the next flush."""
+        if rate < 1:
+            # Sampled counts can't be summed with unsampled ones, so they're sent as is.
+            super().incr(stat, count, rate)
+            return
+        self._counters[self._name(stat)] += count
+        self._check_buffer()
+
+    def gauge(self, stat: str, value: float, rate: float = 1, delta: bool = False) -> None:
+        """Set a gauge's value, or change it by `value` if `delta` is True, aggregating until the next flush."""
+        name = self._name(stat)
+        if delta:
+            self._gauge_deltas[name] += value
+        else:
+            # An absolute value replaces any earlier changes to the gauge.
+            self._gauge_deltas.pop(name, None)
+            self._gauges[name] = value
+        self._check_buffer()
+
+    def _send(self, data: str) -> None:
+        """Buffer a metric which can't be aggregated, such as a timing."""
+        self._lines.append(data)
+        self._check_buffer()
+
+    def _check_buffer(self) -> None:
+        if self.buffered >= self.max_buffered:
+            self.flush()
+
+    def _drain(self) -> list[str]:
+        """Return the buffered metrics as statsd lines, and empty the buffer."""
+        lines = [f"{name}:{count}|c" for name, count in self._counters.items()]
+        for name, value in self._gauges.items():
+            if value < 0:
+                # A negative value would be taken as a change, so the gauge has to be reset to 0 first.
+                lines.append(f"{name}:0|g")
+            lines.append(f"{name}:{value}|g")
+        lines.extend(f"{name}:{'+' if value >= 0 else ''}{value}|g" for name, value in self._gauge_deltas.items())
+        lines.extend(self._lines)
+
+        if self._unreported_dropped:
+            lines.append(f"{self._name('stats.dropped')}:{self._unreported_dropped}|c")
+        if self._last_flush_time is not None:
+            lines.append(f"{self._name('stats.flush_time')}:{self._last_flush_time:0.6f}|ms")
+
+        self._unreported_dropped = 0
+        self._last_flush_time = None
+        self._counters.clear()
+        self._gauges.clear()
+        self._gauge_deltas.clear()
+        self._lines = []
+        return lines
+
+    @staticmethod
+    def _pack(lines: list[str]) -> list[str]:
+        """Join `lines` into as few packets of at most `MAX_PACKET_SIZE` bytes as possible."""
+        packets = []
+        packet = []
+        size = 0
+        for line in lines:
+            if packet and size + 1 + len(line) > MAX_PACKET_SIZE:
+                packets.append("\n".join(packet))
+                packet = []
+                size = 0
+            size += len(line) + bool(packet)
+            packet.append(line)
+        if packet:
+            packets.append("\n".join(packet))
+        return packets
+
+    def flush(self) -> None:
+        """Send all the buffered metrics."""
+        if not self.buffered:
+            return
+
+        start = time.perf_counter()
+        lines = self._drain()
+        dropped = 0
+
+        if self._transport is None or self._transport.is_closing():
+            dropped = len(lines)
+        else:
+            for packet in self._pack(lines):
+                try:
+                    self._transport.sendto(packet.encode("ascii"), self._addr)
+                except OSError:
+                    dropped += packet.count("\n") + 1
+
+        if dropped:
+            log.debug(f"Dropped {dropped} metrics which couldn't be sent to statsd.")
+            self.dropped += dropped
+            self._unreported_dropped += dropped
+        self._last_flush_time = (time.perf_counter() - start) * 1000
+
+
+@dataclass
+class ListenerTiming:
+    """How long the recent invocations of an event listener took, and how many are running."""
+
+    durations: deque[float] = field(default_factory=lambda: deque(maxlen=LISTENER_SAMPLES))
+    calls: int = 0
+    in_flight: int = 0
+    peak_in_flight: int = 0
+
+    def percentile(self, percent: float) -> float:
+        """Return the duration, in seconds, which `percent` percent of the recent invocations took at most."""
+        if not self.durations:
+            return 0
+        ordered = sorted(self.durations)
+        return ordered[min(len(ordered) - 1, int(len(ordered) * percent / 100))]
+
+
+class ListenerTimings:
+    """
+    Time each invocation of the event listeners, per owner (usually a cog) and event.
+
+    Durations are sent under `listeners.<owner>.<event>`, and how many invocations are running under
+    `listeners.<owner>.<event>.in_flight`, with any `UNSAFE_STAT_CHARACTERS` in the owner's name replaced
+    by underscores.
+    """
+
+    def __init__(self):
+        self.since = time.time()
+        self.listeners: dict[tuple[str, str], ListenerTiming] = {}
+
+    @staticmethod
+    def _owner_name(listener: Callable) -> str:
+        """Return the name of the cog or other object the listener belongs to."""
+        owner = getattr(listener, "__self__", None)
+        if isinstance(owner, commands.Cog):
+            return owner.qualified_name
+        if owner is not None:
+            return type(owner).__name__
+        return listener.__module__
+
+    def wrap(
+        self,
+        listener: Callable[..., Coroutine[Any, Any, Any]],
+        event_name: str,
+        stats: AsyncStatsClient,
+    ) -> Callable[..., Coroutine[Any, Any, Any]]:
+        """Return a coroutine function which runs `listener` for `event_name` while timing it."""
+        owner = self._owner_name(listener)
+        timing = self.listeners.setdefault((owner, event_name), ListenerTiming())
+        stat_owner = UNSAFE_STAT_CHARACTERS.sub("_", owner)
+        stat = f"listeners.{stat_owner}.{event_name}"
+
+        @functools.wraps(listener)
+        async def timed_listener(*args, **kwargs) -> None:
+            timing.calls += 1
+            timing.in_flight += 1
+            timing.peak_in_flight = max(timing.peak_in_flight, timing.in_flight)
+            stats.gauge(f"{stat}.in_flight", timing.in_flight)
+            start = time.perf_counter()
+            try:
+                await listener(*args, **kwargs)
+            finally:
+                duration = time.perf_counter() - start
+                timing.durations.append(duration)
+                timing.in_flight -= 1
+                stats.gauge(f"{stat}.in_flight", timing.in_flight)
+                stats.timing(stat, duration * 1000)
+
+        return timed_listener
+
+    def slowest(self, limit: int | None = None) -> list[tuple[tuple[str, str], ListenerTiming]]:
+        """Return up to `limit` listeners and their timings, from the slowest 95th percentile to the fastest."""
+        listeners = sorted(self.listeners.items(), key=lambda item: item[1].percentile(95), reverse=True)
+        return listeners[:limit]
@@ -0,0 +1,64 @@
+import os
+import tempfile
+import unittest
+from pathlib import Path
+from unittest.mock import patch
+
+from bot.exts.backend.branding import _assets
+from bot.exts.backend.branding._assets import AssetStore, StoreResult
+
+SHA_A = "a" * 40
+SHA_B = "b" * 40
+SHA_C = "c" * 40
+
+
+class AssetStoreTests(unittest.TestCase):
+    """Tests for the content-addressed branding asset store."""
+
+    def setUp(self):
+        temp_dir = tempfile.TemporaryDirectory()
+        self.addCleanup(temp_dir.cleanup)
+        self.directory = Path(temp_dir.name, "branding")
+        self.store = AssetStore(self.directory, max_size=10)
+
+    def test_get_returns_stored_asset(self):
+        """A stored asset should be returned by its hash."""
+        self.assertIsNone(self.store.get(SHA_A))
+
+        self.assertEqual(self.store.put(SHA_A, b"asset"), StoreResult(evicted=0, size=5))
+
+        self.assertEqual(self.store.get(SHA_A), b"asset")
+
+    def test_unreadable_asset_is_a_miss(self):
+        """An asset which can't be read should be treated as not stored."""
+        self.store.put(SHA_A, b"asset")
+
+        with patch.object(Path, "read_bytes", side_effect=PermissionError), self.assertLogs(_assets.log, "ERROR"):
+            self.assertIsNone(self.store.get(SHA_A))
+
+    def test_put_evicts_least_recently_used(self):
+        """Assets should be evicted, least recently used first, once the store exceeds its size limit."""
+        self.store.put(SHA_A, b"aaaa")
+        self.store.put(SHA_B, b"bbbb")
+        # Make the first asset look older than the second.
+        os.utime(self.directory / SHA_A, (0, 0))
+
+        result = self.store.put(SHA_C, b"cccc")
+
+        self.assertEqual(result, StoreResult(evicted=1, size=8))
+        self.assertIsNone(self.store.get(SHA_A))
+        self.assertEqual(self.store.get(SHA_B), b"bbbb")
+        self.assertEqual(self.store.get(SHA_C), b"cccc")
+
+    def test_invalid_hashes_are_not_used_as_paths(self):
+        """Hashes which aren't hex digests should never be read or written."""
+        self.assertIsNone(self.store.put("../escape", b"asset"))
+
+        self.assertIsNone(self.store.get("../escape"))
+        self.assertFalse(self.directory.exists())
+
+    def test_oversized_assets_are_not_stored(self):
+        """An asset larger than the whole store should not be stored."""
+        self.assertIsNone(self.store.put(SHA_A, b"a" * 11))
+
+        self.assertIsNone(self.store.get(SHA_A))
@@ -0,0 +1,215 @@
+import asyncio
+import hashlib
+import tempfile
+import threading
+import unittest
+from pathlib import Path
+from unittest.mock import MagicMock, call, patch
+
+from bot.exts.backend.branding import _repository
+from bot.exts.backend.branding._repository import BrandingRepository
+
+META_FILE = b"""---
+start_date: July 1
+end_date: July 31
+---
+An event for testing."""
+
+FALLBACK_META_FILE = b"""---
+fallback: True
+---
+The fallback event."""
+
+
+def _sha(content: bytes | dict) -> str:
+    """Return a content hash, like the blob and tree hashes of a git repository."""
+    if isinstance(content, dict):
+        content = repr(sorted((name, _sha(child)) for name, child in content.items())).encode()
+    return hashlib.sha256(content).hexdigest()
+
+
+class FakeResponse:
+    """A response from `FakeGitHub`."""
+
+    def __init__(self, status: int, body: bytes | list | None = None, etag: str | None = None):
+        self.status = status
+        self.body = body
+        self.headers = {"ETag": etag} if etag else {}
+
+    def raise_for_status(self) -> None:
+        pass
+
+    async def json(self) -> list:
+        return self.body
+
+    async def read(self) -> bytes:
+        return self.body
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, *_):
+        pass
+
+
+class _Request:
+    """Async context manager awaiting a `FakeGitHub` response, like `aiohttp.ClientSession.get`."""
+
+    def __init__(self, coro):
+        self.coro = coro
+
+    async def __aenter__(self) -> FakeResponse:
+        return await self.coro
+
+    async def __aexit__(self, *_):
+        pass
+
+
+class FakeGitHub:
+    """
+    A test double of the GitHub contents API, serving the branding repository from nested dicts.
+
+    Each request takes `latency` seconds, and requests are recorded by path, along with how many were in flight at once.
+    """
+
+    def __init__(self, tree: dict, latency: float = 0.05):
+        self.tree = tree
+        self.latency = latency
+        self.requests: list[str] = []
+        self.in_flight = 0
+        self.peak_in_flight = 0
+
+    def _resolve(self, path: str) -> bytes | dict:
+        node = self.tree
+        for part in path.split("/"):
+            node = node[part]
+        return node
+
+    def get(self, url: str, params: dict, headers: dict) -> _Request:
+        return _Request(self._handle(url, headers))
+
+    async def _handle(self, url: str, headers: dict) -> FakeResponse:
+        self.in_flight += 1
+        self.peak_in_flight = max(self.peak_in_flight, self.in_flight)
+        try:
+            await asyncio.sleep(self.latency)
+        finally:
+            self.in_flight -= 1
+
+        if url.startswith("raw:"):
+            path = url.removeprefix("raw:")
+            self.requests.append(path)
+            return FakeResponse(200, self._resolve(path))
+
+        path = url.removeprefix(f"{_repository.BRANDING_URL}/")
+        self.requests.append(path)
+        directory = self._resolve(path)
+        etag = f'"{_sha(directory)}"'
+        if headers.get("If-None-Match") == etag:
+            return FakeResponse(304)
+
+        listing = [
+            {
+                "sha": _sha(child),
+                "name": name,
+                "path": f"{path}/{name}",
+                "type": "dir" if isinstance(child, dict) else "file",
+                "download_url": None if isinstance(child, dict) else f"raw:{path}/{name}",
+            }
+            for name, child in directory.items()
+        ]
+        return FakeResponse(200, listing, etag)
+
+
+def make_event(meta: bytes) -> dict:
+    """Return an event directory with the given `meta` file."""
+    return {
+        "meta.md": meta,
+        "server_icons": {"icon.png": b"icon"},
+        "banners": {"banner.png": b"banner"},
+    }
+
+
+class BrandingRepositoryTests(unittest.IsolatedAsyncioTestCase):
+    """Tests for event discovery in the branding repository."""
+
+    def setUp(self):
+        self.github = FakeGitHub({
+            "events": {
+                "fallback": make_event(FALLBACK_META_FILE),
+                **{f"event_{i}": make_event(META_FILE.replace(b"testing", str(i).encode())) for i in range(5)},
+            },
+        })
+        bot = MagicMock()
+        bot.http_session = self.github
+        temp_dir = tempfile.TemporaryDirectory()
+        self.addCleanup(temp_dir.cleanup)
+        with patch("bot.exts.backend.branding._repository.BrandingConfig.asset_cache_dir", temp_dir.name):
+            self.repository = BrandingRepository(bot)
+
+    async def test_get_events_fetches_concurrently(self):
+        """Discovery should return every event, and make its requests concurrently."""
+        events = await self.repository.get_events()
+
+        self.assertEqual(len(events), 6)
+        self.assertEqual(sum(event.meta.is_fallback for event in events), 1)
+        # The events listing, then 3 directories and 1 meta file per event.
+        self.assertEqual(len(self.github.requests), 1 + 6 * 4)
+        self.assertGreater(self.github.peak_in_flight, 1)
+        self.assertLessEqual(self.github.peak_in_flight, _repository.MAX_CONCURRENT_REQUESTS)
+
+    async def test_get_events_skips_unchanged_directories(self):
+        """Rediscovering an unchanged repository should only cost the conditional events listing request."""
+        first = await self.repository.get_events()
+        self.github.requests.clear()
+
+        second = await self.repository.get_events()
+
+        self.assertEqual(self.github.requests, ["events"])
+        self.assertEqual(
+            [(event.path, event.meta, [banner.sha for banner in event.banners]) for event in second],
+            [(event.path, event.meta, [banner.sha for banner in event.banners]) for event in first],
+        )
+
+    async def test_get_events_refetches_only_changed_parts(self):
+        """Only the directories and meta file on the path to a changed file should be requested again."""
+        await self.repository.get_events()
+        self.github.requests.clear()
+
+        self.github.tree["events"]["event_0"]["meta.md"] = META_FILE.replace(b"testing", b"changes")
+        events = await self.repository.get_events()
+
+        self.assertCountEqual(self.github.requests, ["events", "events/event_0", "events/event_0/meta.md"])
+        descriptions = {event.path: event.meta.description for event in events}
+        self.assertEqual(descriptions["events/event_0"], "An event for changes.")
+
+    async def test_fetch_asset_reuses_stored_assets(self):
+        """An asset should only be downloaded if no asset with the same hash was downloaded before."""
+        self.repository.bot.loop = asyncio.get_running_loop()
+        event = self.github.tree["events"]["event_0"]
+        sha = _sha(event["banners"]["banner.png"])
+
+        first = await self.repository.fetch_asset("raw:events/event_0/banners/banner.png", sha)
+        second = await self.repository.fetch_asset("raw:events/event_1/banners/banner.png", sha)
+
+        self.assertEqual(first, b"banner")
+        self.assertEqual(second, b"banner")
+        self.assertEqual(self.github.requests, ["events/event_0/banners/banner.png"])
+        self.assertTrue(Path(self.repository.assets.directory, sha).exists())
+
+    async def test_fetch_asset_sends_stats_from_the_event_loop(self):
+        """Stats about stored assets should be sent from the event loop, as the stats client isn't thread-safe."""
+        self.repository.bot.loop = asyncio.get_running_loop()
+        stats_threads = set()
+        self.repository.bot.stats.incr.side_effect = lambda *_: stats_threads.add(threading.current_thread())
+        self.repository.bot.stats.gauge.side_effect = lambda *_: stats_threads.add(threading.current_thread())
+        sha = _sha(self.github.tree["events"]["event_0"]["banners"]["banner.png"])
+
+        await self.repository.fetch_asset("raw:events/event_0/banners/banner.png", sha)
+        await self.repository.fetch_asset("raw:events/event_0/banners/banner.png", sha)
+
+        self.assertEqual(stats_threads, {threading.current_thread()})
+        self.repository.bot.stats.incr.assert_has_calls(
+            [call("branding.asset_cache.miss"), call("branding.asset_cache.hit")]
+        )
+        self.repository.bot.stats.gauge.assert_called_once_with("branding.asset_cache.size", len(b"banner"))
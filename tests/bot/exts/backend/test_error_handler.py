@@ -374,6 +374,66 @@ class TryGetTagTests(unittest.IsolatedAsyncioTestCase):
         self.cog.send_command_suggestion.assert_awaited_once_with(self.ctx, "foo")
 
 
+def make_command(name: str, aliases: tuple[str, ...] = (), *, hidden: bool = False) -> MagicMock:
+    """Return a command with the given name and aliases."""
+    command = MagicMock(aliases=aliases, hidden=hidden, can_run=AsyncMock(return_value=True))
+    command.name = name
+    return command
+
+
+class SendCommandSuggestionTests(unittest.IsolatedAsyncioTestCase):
+    """Tests for `send_command_suggestion` and the command name index it uses."""
+
+    def setUp(self):
+        self.bot = MockBot()
+        self.ctx = MockContext(bot=self.bot)
+        self.cog = error_handler.ErrorHandler(self.bot)
+
+        self.commands = {
+            "reminders": make_command("reminders", ("remind", "reminder")),
+            "infraction": make_command("infraction", ("infr",)),
+            "secret": make_command("secret", hidden=True),
+        }
+        self.bot.walk_commands.side_effect = lambda: iter(self.commands.values())
+        self.bot.get_command.side_effect = self.get_command
+
+    def get_command(self, name: str) -> MagicMock | None:
+        for command in self.commands.values():
+            if name == command.name or name in command.aliases:
+                return command
+        return None
+
+    async def test_suggests_similar_command(self):
+        """A misspelled command should be replaced by the closest command name or alias."""
+        self.ctx.message.content = "!remnd me later"
+
+        await self.cog.send_command_suggestion(self.ctx, "remnd")
+
+        embed = self.ctx.send.call_args.kwargs["embed"]
+        self.assertEqual(embed.description, "!remind me later")
+
+    async def test_no_suggestion_for_dissimilar_or_hidden_commands(self):
+        """Nothing should be suggested if only hidden or dissimilar commands exist."""
+        for name in ("secrt", "xyz"):
+            await self.cog.send_command_suggestion(self.ctx, name)
+
+        self.ctx.send.assert_not_awaited()
+
+    async def test_index_is_built_once_until_extensions_change(self):
+        """The command tree should only be walked again after an extension changed."""
+        await self.cog.send_command_suggestion(self.ctx, "infra")
+        await self.cog.send_command_suggestion(self.ctx, "infrc")
+        self.assertEqual(self.bot.walk_commands.call_count, 1)
+
+        self.commands["ping"] = make_command("ping")
+        await self.cog.on_extension_change("bot.exts.utils.ping")
+        self.ctx.message.content = "!pong"
+        await self.cog.send_command_suggestion(self.ctx, "pong")
+
+        self.assertEqual(self.bot.walk_commands.call_count, 2)
+        self.assertEqual(self.ctx.send.call_args.kwargs["embed"].description, "!ping")
+
+
 class IndividualErrorHandlerTests(unittest.IsolatedAsyncioTestCase):
     """Individual error categories handler tests."""
 
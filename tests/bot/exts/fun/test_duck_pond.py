@@ -0,0 +1,154 @@
+import asyncio
+import unittest
+from unittest.mock import AsyncMock, MagicMock, patch
+
+import discord
+
+from bot import constants
+from bot.exts.fun.duck_pond import DuckPond, DuckTally
+from tests.helpers import MockBot, MockGuild, MockMember, MockMessage, MockReaction, MockRole
+
+DUCK = "🦆"
+
+
+class DuckTallyTests(unittest.TestCase):
+    """Tests for the `DuckTally` class."""
+
+    def test_reactors_are_counted_once(self):
+        """A staff member should count once however many ducks they reacted with."""
+        tally = DuckTally(author_is_staff=True)
+        tally.add(1, DUCK)
+        tally.add(1, "<:ducky_yellow:1>")
+        tally.add(2, DUCK)
+        self.assertEqual(tally.count, 2)
+
+        tally.remove(1, DUCK)
+        self.assertEqual(tally.count, 2)
+        tally.remove(1, "<:ducky_yellow:1>")
+        self.assertEqual(tally.count, 1)
+        tally.remove(3, DUCK)
+        self.assertEqual(tally.count, 1)
+
+
+class DuckPondTallyTests(unittest.IsolatedAsyncioTestCase):
+    """Tests for keeping the duck tallies of messages up to date from reaction events."""
+
+    def setUp(self):
+        self.bot = MockBot()
+        self.cog = DuckPond(self.bot)
+        self.cog.locked_relay = AsyncMock()
+
+        self.staff_role = MockRole(id=constants.STAFF_ROLES[0])
+        self.author = MockMember(roles=[self.staff_role], bot=False)
+        self.message = MockMessage(id=42, author=self.author, reactions=[])
+
+        self.channel = MagicMock(id=1234)
+        self.channel.permissions_for.return_value.view_channel = True
+        self.partial_message = MagicMock(id=self.message.id, fetch=AsyncMock(return_value=self.message))
+        self.partial_message.add_reaction = AsyncMock()
+        self.channel.get_partial_message.return_value = self.partial_message
+        self.channel.fetch_message = AsyncMock(return_value=self.message)
+
+        self.guild = MockGuild()
+        self.guild.get_channel_or_thread.return_value = self.channel
+        self.bot.get_guild.return_value = self.guild
+
+        self.staff = [MockMember(id=100 + i, roles=[self.staff_role], bot=False) for i in range(10)]
+
+        patcher = patch("bot.exts.fun.duck_pond.constants.DuckPond.threshold", 3)
+        patcher.start()
+        self.addCleanup(patcher.stop)
+
+    def make_payload(self, member: MockMember, emoji: str = DUCK) -> MagicMock:
+        """Return a reaction event payload for `member` reacting to the message."""
+        return MagicMock(
+            guild_id=constants.Guild.id,
+            channel_id=self.channel.id,
+            message_id=self.message.id,
+            user_id=member.id,
+            member=member,
+            emoji=discord.PartialEmoji(name=emoji),
+        )
+
+    def set_duck_reactors(self, *members: MockMember) -> None:
+        """Make the message's duck reaction list `members` as the users who reacted."""
+        self.message.reactions = [MockReaction(emoji=DUCK, users=list(members))]
+
+    async def test_message_is_seeded_once_then_tallied_from_events(self):
+        """Only the first duck reaction on a message should fetch it and page through its reactions."""
+        self.set_duck_reactors(self.staff[0])
+        await self.cog.on_raw_reaction_add(self.make_payload(self.staff[0]))
+
+        self.set_duck_reactors(self.staff[0], self.staff[1])
+        await self.cog.on_raw_reaction_add(self.make_payload(self.staff[1]))
+
+        self.partial_message.fetch.assert_awaited_once()
+        self.message.reactions[0].users.assert_not_called()
+        self.assertEqual(self.cog.tallies[self.message.id].count, 2)
+        self.bot.stats.incr.assert_any_call("duck_pond.tally.seed")
+        self.bot.stats.incr.assert_any_call("duck_pond.tally.hit")
+        self.cog.locked_relay.assert_not_awaited()
+
+    async def test_message_is_relayed_at_threshold(self):
+        """The message should be fetched and relayed once enough staff members reacted."""
+        self.set_duck_reactors(self.staff[0])
+        for member in self.staff[:4]:
+            await self.cog.on_raw_reaction_add(self.make_payload(member))
+
+        self.cog.locked_relay.assert_awaited_once_with(self.message)
+        self.channel.fetch_message.assert_awaited_once()
+
+    async def test_non_staff_reactions_are_ignored(self):
+        """Reactions from non-staff members or on non-staff messages shouldn't count."""
+        outsider = MockMember(id=1, roles=[], bot=False)
+        await self.cog.on_raw_reaction_add(self.make_payload(outsider))
+        self.assertNotIn(self.message.id, self.cog.tallies)
+
+        self.message.author = MockMember(roles=[], bot=False)
+        for member in self.staff[:4]:
+            await self.cog.on_raw_reaction_add(self.make_payload(member))
+        self.cog.locked_relay.assert_not_awaited()
+
+    async def test_removed_ducks_are_untallied(self):
+        """Removing a duck reaction should lower the tally without fetching the message."""
+        self.set_duck_reactors(self.staff[0], self.staff[1])
+        await self.cog.on_raw_reaction_add(self.make_payload(self.staff[1]))
+
+        await self.cog.on_raw_reaction_remove(self.make_payload(self.staff[0]))
+
+        self.assertEqual(self.cog.tallies[self.message.id].count, 1)
+        self.partial_message.fetch.assert_awaited_once()
+
+    async def test_concurrent_reactions_seed_once(self):
+        """Reactions arriving while the message is being seeded should wait for that seed."""
+        self.set_duck_reactors(*self.staff[:2])
+
+        await asyncio.gather(*(self.cog.on_raw_reaction_add(self.make_payload(m)) for m in self.staff[:2]))
+
+        self.partial_message.fetch.assert_awaited_once()
+        self.assertEqual(self.cog.tallies[self.message.id].count, 2)
+
+    async def test_checkmark_is_restored_without_fetching(self):
+        """The bot's checkmark should be re-added from the tally when removed from a duck ponded message."""
+        self.set_duck_reactors(*self.staff[:3])
+        await self.cog.on_raw_reaction_add(self.make_payload(self.staff[0]))
+        self.bot.get_all_channels.return_value = [self.channel]
+
+        payload = self.make_payload(self.staff[0], emoji="✅")
+        payload.user_id = self.bot.user.id
+        await self.cog.on_raw_reaction_remove(payload)
+
+        self.partial_message.add_reaction.assert_awaited_once_with("✅")
+        self.partial_message.fetch.assert_awaited_once()
+
+    async def test_checkmark_is_not_restored_below_threshold(self):
+        """A checkmark removed from a message without enough ducks should stay removed."""
+        self.set_duck_reactors(self.staff[0])
+        await self.cog.on_raw_reaction_add(self.make_payload(self.staff[0]))
+        self.bot.get_all_channels.return_value = [self.channel]
+
+        payload = self.make_payload(self.staff[0], emoji="✅")
+        payload.user_id = self.bot.user.id
+        await self.cog.on_raw_reaction_remove(payload)
+
+        self.partial_message.add_reaction.assert_not_awaited()
@@ -0,0 +1,99 @@
+import unittest
+from unittest.mock import AsyncMock, MagicMock, patch
+
+from bot.exts.help_channels import _activity
+from bot.exts.help_channels._activity import PostActivity
+from tests.helpers import MockMember, MockMessage
+
+OWNER_ID = 1
+POST_ID = 1000
+
+
+class PostActivityTests(unittest.IsolatedAsyncioTestCase):
+    """Tests for tracking the activity in help posts."""
+
+    def setUp(self):
+        self.post = MagicMock(id=POST_ID, owner_id=OWNER_ID, last_message_id=None)
+        self.post.history = MagicMock()
+
+        cache_patcher = patch("bot.exts.help_channels._activity._caches.post_activity", new=AsyncMock())
+        self.cache = cache_patcher.start()
+        self.addCleanup(cache_patcher.stop)
+        bot_patcher = patch("bot.exts.help_channels._activity.bot")
+        self.bot = bot_patcher.start()
+        self.addCleanup(bot_patcher.stop)
+
+        _activity._activities.clear()
+        self.addCleanup(_activity._activities.clear)
+
+    def message(self, message_id: int, author_id: int, *, bot: bool = False) -> MockMessage:
+        """Return a message in the post."""
+        return MockMessage(id=message_id, author=MockMember(id=author_id, bot=bot))
+
+    async def test_messages_are_tracked_from_the_starter_message(self):
+        """Messages in a post should be tracked once its starter message was seen, without scanning its history."""
+        await _activity.record_message(self.post, self.message(POST_ID, OWNER_ID))
+        await _activity.record_message(self.post, self.message(POST_ID + 1, 2))
+        await _activity.record_message(self.post, self.message(POST_ID + 2, 3, bot=True))
+        self.post.last_message_id = POST_ID + 2
+
+        activity = await _activity.get_activity(self.post)
+
+        self.assertEqual(activity.last_message_id, POST_ID + 2)
+        self.assertIsNone(activity.last_owner_message_id)
+        self.assertEqual(activity.participant_ids, {OWNER_ID, 2})
+        self.assertEqual(activity.message_count, 2)
+        self.post.history.assert_not_called()
+        self.cache.set.assert_awaited_with(POST_ID, activity.to_json())
+
+    async def test_untracked_post_is_scanned_once(self):
+        """The activity of an untracked post should be scanned from its history, then tracked."""
+        history = [self.message(POST_ID + 2, OWNER_ID), self.message(POST_ID + 1, 2)]
+        self.post.history.return_value.__aiter__.return_value = history
+
+        # Messages in untracked posts can't be tracked until they've been scanned.
+        await _activity.record_message(self.post, self.message(POST_ID + 2, OWNER_ID))
+        activity = await _activity.get_activity(self.post)
+        await _activity.record_message(self.post, self.message(POST_ID + 3, 2))
+        self.post.last_message_id = POST_ID + 3
+        activity = await _activity.get_activity(self.post)
+
+        self.post.history.assert_called_once()
+        self.assertEqual(activity.last_message_id, POST_ID + 3)
+        self.assertEqual(activity.last_owner_message_id, POST_ID + 2)
+        self.assertEqual(activity.participant_ids, {OWNER_ID, 2})
+
+    async def test_starter_message_is_not_counted(self):
+        """The starter message shouldn't be counted, even when seen by both a scan and the message listener."""
+        starter = self.message(POST_ID, OWNER_ID)
+        self.post.history.return_value.__aiter__.return_value = [self.message(POST_ID + 1, 2), starter]
+        self.post.last_message_id = POST_ID + 1
+
+        await _activity.get_activity(self.post)
+        await _activity.record_message(self.post, starter)
+        activity = await _activity.get_activity(self.post)
+
+        self.assertEqual(activity.message_count, 1)
+        self.assertIsNone(activity.last_owner_message_id)
+        self.assertEqual(activity.participant_ids, {OWNER_ID, 2})
+
+    async def test_missed_messages_cause_a_scan(self):
+        """A post whose last message is newer than the tracked one should be scanned again."""
+        _activity._activities[POST_ID] = PostActivity(last_message_id=POST_ID + 1, message_count=2)
+        self.post.last_message_id = POST_ID + 5
+        self.post.history.return_value.__aiter__.return_value = [self.message(POST_ID + 5, OWNER_ID)]
+
+        activity = await _activity.get_activity(self.post)
+
+        self.post.history.assert_called_once()
+        self.assertEqual(activity.last_message_id, POST_ID + 5)
+
+    async def test_load_restores_open_posts_only(self):
+        """Activity should be restored for open posts, and dropped for closed ones."""
+        activity = PostActivity(last_message_id=POST_ID, participant_ids={OWNER_ID}, message_count=1)
+        self.cache.to_dict.return_value = {POST_ID: activity.to_json(), POST_ID + 1: activity.to_json()}
+
+        await _activity.load({POST_ID})
+
+        self.assertEqual(_activity._activities, {POST_ID: activity})
+        self.cache.delete.assert_awaited_once_with(POST_ID + 1)
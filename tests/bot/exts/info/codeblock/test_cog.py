@@ -0,0 +1,64 @@
+import asyncio
+import threading
+import unittest
+from unittest.mock import Mock, patch
+
+from bot.exts.info.codeblock import _cog
+from tests.helpers import MockBot
+
+LONG_CONTENT = "x" * (_cog.OFFLOAD_PARSE_LENGTH + 1)
+
+
+class ParseInstructionsTests(unittest.IsolatedAsyncioTestCase):
+    """Tests for bounding the time spent parsing messages for code blocks."""
+
+    async def asyncSetUp(self):
+        self.bot = MockBot()
+        self.bot.loop = asyncio.get_running_loop()
+        self.cog = _cog.CodeBlockCog(self.bot)
+
+        self.released = threading.Event()
+        self.addCleanup(self.released.set)
+        self.get_instructions = Mock(side_effect=self.slow_get_instructions)
+
+        patcher = patch.object(_cog, "get_instructions", self.get_instructions)
+        patcher.start()
+        self.addCleanup(patcher.stop)
+
+    def slow_get_instructions(self, content: str) -> str:
+        """Get instructions for `content` once the test releases it."""
+        self.released.wait(5)
+        return "instructions"
+
+    async def test_short_content_is_parsed_inline(self):
+        """Content up to the offloading length should be parsed without a worker thread."""
+        self.get_instructions.side_effect = lambda content: threading.current_thread().name
+
+        self.assertEqual(await self.cog.parse_instructions("x"), threading.current_thread().name)
+
+    async def test_too_long_content_is_not_parsed(self):
+        """Content over the maximum length shouldn't be parsed at all."""
+        self.assertIsNone(await self.cog.parse_instructions("x" * (_cog.MAXIMUM_PARSE_LENGTH + 1)))
+        self.get_instructions.assert_not_called()
+
+    async def test_long_content_is_parsed_in_a_thread(self):
+        """Long content should be parsed in a worker thread, and its instructions returned."""
+        self.get_instructions.side_effect = lambda content: threading.current_thread().name
+
+        thread_name = await self.cog.parse_instructions(LONG_CONTENT)
+        self.assertNotEqual(thread_name, threading.current_thread().name)
+
+    @patch.object(_cog, "PARSE_TIMEOUT", 0.05)
+    async def test_parse_timeout(self):
+        """A parse which times out should be given up on, and no other parse offloaded while its thread runs."""
+        with self.assertLogs(_cog.log, "INFO"):
+            self.assertIsNone(await self.cog.parse_instructions(LONG_CONTENT))
+
+        # The timed out thread is still running, so the next parse is skipped.
+        self.assertIsNone(await self.cog.parse_instructions(LONG_CONTENT))
+        self.assertEqual(self.get_instructions.call_count, 1)
+
+        self.released.set()
+        await self.cog.timed_out_parse
+        self.assertEqual(await self.cog.parse_instructions(LONG_CONTENT), "instructions")
+        self.assertEqual(self.get_instructions.call_count, 2)
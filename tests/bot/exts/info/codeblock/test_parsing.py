@@ -0,0 +1,78 @@
+import ast
+import textwrap
+import unittest
+from pathlib import Path
+
+import bot
+from bot.exts.info.codeblock import _parsing
+
+
+def _reference_is_python_code(content: str) -> bool:
+    """`_is_python_code` without the statement prefilter, to check the prefilter against."""
+    try:
+        tree = ast.parse(content.replace("\x00", ""))
+    except SyntaxError:
+        return False
+    return not all(isinstance(node, ast.Expr) for node in tree.body)
+
+
+class StatementPrefilterTests(unittest.TestCase):
+    """Tests for skipping the parsing of content which can't contain anything but expressions."""
+
+    def assert_same_as_reference(self, content: str) -> None:
+        self.assertEqual(_parsing._is_python_code(content), _reference_is_python_code(content), repr(content))
+
+    def test_statements_are_python_code(self):
+        """Content with any statement other than an expression should be detected as Python code."""
+        for content in (
+            "a = 1",
+            "x += 1",
+            "x: int",
+            "print(x)\nimport os",
+            "from os import path",
+            "print(x); return",
+            "del x[0]",
+            "pass",
+            "global x",
+            "\fimport os",
+            "x \\\n= 1",
+            "@decorator\ndef f(): pass",
+            "if x:\n    print(x)",
+            "with open(f) as file: file.read()",
+            "class A: ...",
+            "type Number = int | float",
+        ):
+            with self.subTest(content=content):
+                self.assertTrue(_parsing._is_python_code(content))
+
+    def test_expressions_are_not_python_code(self):
+        """Content with only expressions, or which isn't valid Python, shouldn't be detected as Python code."""
+        for content in (
+            "x[0]",
+            "print(x)\nprint(y)",
+            "lambda x: x",
+            "f(key=value)",
+            "a == b",
+            "@decorator",
+            "hello world",
+            "Returns are\nimportant",
+            "x =",
+        ):
+            with self.subTest(content=content):
+                self.assertFalse(_parsing._is_python_code(content))
+
+    def test_prefilter_matches_parsing_on_real_code(self):
+        """The prefilter shouldn't change the result for any statement or line of the bot's source code."""
+        for path in Path(bot.__file__).parent.rglob("*.py"):
+            source = path.read_text(encoding="utf8")
+            try:
+                tree = ast.parse(source)
+            except SyntaxError:
+                continue
+            lines = source.splitlines(keepends=True)
+            for node in ast.walk(tree):
+                # Statements the size of a message, rather than whole classes and functions.
+                if isinstance(node, ast.stmt) and node.end_lineno - node.lineno < 20:
+                    self.assert_same_as_reference(textwrap.dedent("".join(lines[node.lineno - 1:node.end_lineno])))
+            for line in lines:
+                self.assert_same_as_reference(line.strip())
@@ -0,0 +1,122 @@
+import unittest
+from unittest.mock import Mock, patch
+
+import aiohttp
+from aiohttp import web
+from aiohttp.test_utils import TestServer
+
+from bot.exts.info import code_snippets
+from tests.helpers import MockBot
+
+
+class FakeFileHost:
+    """A server hosting files with ETags, which records the requests it receives."""
+
+    def __init__(self):
+        self.requests: list[tuple[str, str | None]] = []
+        self.etag = '"v1"'
+        self.status = 200
+        # Whether 304 responses repeat the ETag, which servers aren't required to do.
+        self.etag_on_not_modified = True
+
+        self.app = web.Application()
+        self.app.router.add_get("/{name}", self.get_file)
+
+    async def get_file(self, request: web.Request) -> web.Response:
+        if_none_match = request.headers.get("If-None-Match")
+        self.requests.append((request.match_info["name"], if_none_match))
+
+        if self.status >= 400:
+            return web.Response(status=self.status)
+        if if_none_match == self.etag:
+            return web.Response(status=304, headers={"ETag": self.etag} if self.etag_on_not_modified else {})
+        return web.Response(status=self.status, text=f"contents {self.etag}", headers={"ETag": self.etag})
+
+
+class FetchResponseTests(unittest.IsolatedAsyncioTestCase):
+    """Tests for the caching of responses in `CodeSnippets._fetch_response`."""
+
+    async def asyncSetUp(self):
+        self.host = FakeFileHost()
+        server = TestServer(self.host.app)
+        await server.start_server()
+        self.addAsyncCleanup(server.close)
+        self.url = str(server.make_url("/file.py"))
+
+        self.bot = MockBot()
+        self.bot.http_session = aiohttp.ClientSession()
+        self.addAsyncCleanup(self.bot.http_session.close)
+        self.cog = code_snippets.CodeSnippets(self.bot)
+
+        # The clocks of the cog and its cache, without affecting the event loop's
+        self.now = 1000.0
+        clock = Mock(monotonic=lambda: self.now)
+        for module in ("bot.exts.info.code_snippets.time", "bot.utils.caching.time"):
+            patcher = patch(module, clock)
+            patcher.start()
+            self.addCleanup(patcher.stop)
+
+    async def test_fresh_response_is_reused_without_a_request(self):
+        """A response should be served from the cache, without any request, while it's fresh."""
+        first = await self.cog._fetch_response(self.url, "text")
+        self.now += code_snippets.RESPONSE_FRESH_SECONDS - 1
+        second = await self.cog._fetch_response(self.url, "text")
+
+        self.assertEqual(first, second)
+        self.assertEqual(self.host.requests, [("file.py", None)])
+
+    async def test_not_modified_response_reuses_cached_body(self):
+        """A stale response should be revalidated with its ETag, and its body reused when it's unchanged."""
+        first = await self.cog._fetch_response(self.url, "text")
+        self.now += code_snippets.RESPONSE_FRESH_SECONDS + 1
+        second = await self.cog._fetch_response(self.url, "text")
+        third = await self.cog._fetch_response(self.url, "text")
+
+        self.assertEqual(first, 'contents "v1"')
+        self.assertEqual(second, first)
+        self.assertEqual(third, first)
+        # The revalidated response is fresh again, so the third fetch didn't make a request.
+        self.assertEqual(self.host.requests, [("file.py", None), ("file.py", '"v1"')])
+
+    async def test_not_modified_response_without_etag_keeps_cached_etag(self):
+        """A 304 without an ETag should keep the cached ETag, so the response can be revalidated again."""
+        self.host.etag_on_not_modified = False
+        await self.cog._fetch_response(self.url, "text")
+        for _ in range(2):
+            self.now += code_snippets.RESPONSE_FRESH_SECONDS + 1
+            await self.cog._fetch_response(self.url, "text")
+
+        self.assertEqual(self.cog._response_cache.get(self.url).etag, '"v1"')
+        self.assertEqual(self.host.requests, [("file.py", None), ("file.py", '"v1"'), ("file.py", '"v1"')])
+
+    async def test_modified_response_replaces_cached_body(self):
+        """A stale response which changed should be downloaded again, along with its new ETag."""
+        await self.cog._fetch_response(self.url, "text")
+        self.host.etag = '"v2"'
+        self.now += code_snippets.RESPONSE_FRESH_SECONDS + 1
+
+        self.assertEqual(await self.cog._fetch_response(self.url, "text"), 'contents "v2"')
+        self.assertEqual(self.cog._response_cache.get(self.url).etag, '"v2"')
+
+    async def test_expired_response_is_fetched_again(self):
+        """Once its cache entry expires, a response should be fetched again without revalidation."""
+        await self.cog._fetch_response(self.url, "text")
+        self.now += code_snippets.RESPONSE_CACHE_SECONDS + 1
+        await self.cog._fetch_response(self.url, "text")
+
+        self.assertEqual(self.host.requests, [("file.py", None), ("file.py", None)])
+
+    async def test_non_200_responses_are_not_cached(self):
+        """Successful responses other than 200, and errors, shouldn't be cached."""
+        self.host.status = 203
+        await self.cog._fetch_response(self.url, "text")
+        await self.cog._fetch_response(self.url, "text")
+        self.assertEqual(len(self.host.requests), 2)
+
+        self.host.status = 404
+        for _ in range(2):
+            with self.assertRaises(aiohttp.ClientResponseError):
+                await self.cog._fetch_response(self.url, "text")
+
+        self.assertEqual(len(self.host.requests), 4)
+        self.assertIsNone(self.cog._response_cache.get(self.url))
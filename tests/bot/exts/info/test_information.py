@@ -489,6 +489,31 @@ class UserEmbedTests(unittest.IsolatedAsyncioTestCase):
 
         self.assertEqual(embed.thumbnail.url, "avatar url")
 
+    @unittest.mock.patch(f"{COG_PATH}.basic_user_infraction_counts", new_callable=unittest.mock.AsyncMock)
+    @unittest.mock.patch(f"{COG_PATH}.user_messages", new_callable=unittest.mock.AsyncMock)
+    async def test_create_user_embed_caches_site_data_until_invalidated(self, user_messages, infraction_counts):
+        """Repeated embeds for the same user should reuse the site data until an update event is received."""
+        ctx = helpers.MockContext(channel=helpers.MockTextChannel(id=100))
+        infraction_counts.return_value = ("Infractions", "basic infractions info")
+        user_messages.return_value = ("Messages", "user message counts")
+
+        user = helpers.MockMember(id=314, colour=100)
+        user.created_at = user.joined_at = datetime.fromtimestamp(1, tz=UTC)
+
+        await self.cog.create_user_embed(ctx, user, False)
+        await self.cog.create_user_embed(ctx, user, False)
+
+        infraction_counts.assert_awaited_once_with(user)
+        user_messages.assert_awaited_once_with(user)
+
+        await self.cog.on_user_info_update(user.id)
+        embed = await self.cog.create_user_embed(ctx, user, False)
+
+        self.assertEqual(infraction_counts.await_count, 2)
+        self.assertEqual(user_messages.await_count, 2)
+        self.assertEqual(embed.fields[2].value, "user message counts")
+        self.assertEqual(embed.fields[3].value, "basic infractions info")
+
 
 @unittest.mock.patch("bot.exts.info.information.constants")
 class UserCommandTests(unittest.IsolatedAsyncioTestCase):
@@ -0,0 +1,231 @@
+import asyncio
+import contextlib
+import unittest
+from datetime import UTC, datetime, timedelta
+from email.utils import format_datetime
+from unittest.mock import AsyncMock, MagicMock, patch
+
+import aiohttp
+from aiohttp import web
+from aiohttp.test_utils import TestServer
+
+from bot.exts.info import python_news
+from tests.helpers import MockBot
+
+
+class FakeMailman:
+    """
+    A server hosting mailing list archives and the PEP feed, which records the requests it receives.
+
+    Pages are served with an ETag changing along with their contents, and answered with 304 when it matches.
+    """
+
+    def __init__(self):
+        self.requests: list[str] = []
+        self.in_flight = 0
+        self.max_in_flight = 0
+        self.saturated = asyncio.Event()
+        self.threads: dict[str, dict] = {}
+        self.peps: list[dict] = []
+        self.url = ""
+
+        self.app = web.Application()
+        self.app.router.add_get("/list/{name}/recent-threads", self.recent_threads)
+        self.app.router.add_get("/api/list/{name}/thread/{id}/", self.thread)
+        self.app.router.add_get("/email/{id}", self.email)
+        self.app.router.add_get("/peps.rss", self.pep_feed)
+
+    def add_thread(self, identifier: str, subject: str = "A new idea", date: datetime | None = None) -> None:
+        self.threads[identifier] = {"subject": subject, "date": date or datetime.now(tz=UTC)}
+
+    def add_pep(self, number: int, published: datetime | None = None) -> None:
+        self.peps.append({"number": number, "published": published or datetime.now(tz=UTC)})
+
+    @staticmethod
+    def _conditional(request: web.Request, text: str, content_type: str) -> web.Response:
+        etag = f'"{hash(text)}"'
+        if request.headers.get("If-None-Match") == etag:
+            return web.Response(status=304, headers={"ETag": etag})
+        return web.Response(text=text, content_type=content_type, headers={"ETag": etag})
+
+    async def recent_threads(self, request: web.Request) -> web.Response:
+        self.requests.append(request.path)
+        links = "".join(
+            f'<a href="/list/{request.match_info["name"]}/thread/{identifier}/">Thread</a>'
+            for identifier in self.threads
+        )
+        html = f'<html><body><div><a href="/latest">Latest</a>{links}</div></body></html>'
+        return self._conditional(request, html, "text/html")
+
+    async def thread(self, request: web.Request) -> web.Response:
+        self.requests.append(request.path)
+        self.in_flight += 1
+        self.max_in_flight = max(self.max_in_flight, self.in_flight)
+        if self.in_flight >= python_news.MAX_CONCURRENT_THREAD_FETCHES:
+            self.saturated.set()
+        try:
+            # Hold the first requests until as many as allowed are in flight, so the bound is reached.
+            with contextlib.suppress(TimeoutError):
+                await asyncio.wait_for(self.saturated.wait(), 1)
+        finally:
+            self.in_flight -= 1
+
+        identifier = request.match_info["id"]
+        return web.json_response({
+            "thread_id": identifier,
+            "subject": self.threads[identifier]["subject"],
+            "starting_email": f"{self.url}/email/{identifier}",
+        })
+
+    async def email(self, request: web.Request) -> web.Response:
+        self.requests.append(request.path)
+        identifier = request.match_info["id"]
+        return web.json_response({
+            "date": self.threads[identifier]["date"].strftime("%Y-%m-%dT%X%z"),
+            "content": "Let's add more walruses.",
+            "sender_name": "Guido",
+            "sender": {"address": "guido (a) python.org", "mailman_id": "1"},
+        })
+
+    async def pep_feed(self, request: web.Request) -> web.Response:
+        self.requests.append(request.path)
+        items = "".join(
+            f"<item><title>PEP {pep['number']}: Something new</title><link>https://peps.python.org/</link>"
+            f"<description>Summary</description><pubDate>{format_datetime(pep['published'], usegmt=True)}</pubDate>"
+            "</item>"
+            for pep in self.peps
+        )
+        feed = f'<?xml version="1.0"?><rss version="2.0"><channel><title>Newest PEPs</title>{items}</channel></rss>'
+        return self._conditional(request, feed, "application/rss+xml")
+
+
+class PythonNewsTests(unittest.IsolatedAsyncioTestCase):
+    """Tests for fetching and posting new mailing list threads and PEPs, against a local fake mailman."""
+
+    async def asyncSetUp(self):
+        self.mailman = FakeMailman()
+        server = TestServer(self.mailman.app)
+        await server.start_server()
+        self.addAsyncCleanup(server.close)
+        self.mailman.url = url = str(server.make_url("")).rstrip("/")
+
+        for name, value in (
+            ("RECENT_THREADS_TEMPLATE", f"{url}/list/{{name}}/recent-threads"),
+            ("THREAD_TEMPLATE_URL", f"{url}/api/list/{{name}}/thread/{{id}}/"),
+            ("PEPS_RSS_URL", f"{url}/peps.rss"),
+        ):
+            patcher = patch.object(python_news, name, value)
+            patcher.start()
+            self.addCleanup(patcher.stop)
+
+        patcher = patch.object(python_news.constants.PythonNews, "mail_lists", ("python-ideas",))
+        patcher.start()
+        self.addCleanup(patcher.stop)
+
+        self.send_webhook = AsyncMock(return_value=MagicMock())
+        self.send_webhook.return_value.channel.is_news.return_value = False
+        patcher = patch.object(python_news, "send_webhook", self.send_webhook)
+        patcher.start()
+        self.addCleanup(patcher.stop)
+
+        self.bot = MockBot()
+        self.bot.loop = asyncio.get_running_loop()
+        self.bot.http_session = aiohttp.ClientSession()
+        self.addAsyncCleanup(self.bot.http_session.close)
+
+        self.cog = python_news.PythonNews(self.bot)
+        self.cog.seen_items = {"pep": set(), "python-ideas": set()}
+        self.cog.webhook_names = {"python-ideas": "Python-Ideas"}
+
+    def posted_titles(self) -> list[str]:
+        return [call.kwargs["embed"].title for call in self.send_webhook.await_args_list]
+
+    async def test_new_threads_are_posted_once(self):
+        """New threads should be posted and marked as seen, and not be fetched again once seen."""
+        self.mailman.add_thread("first")
+        self.mailman.add_thread("second", subject="Another idea")
+
+        await self.cog.post_maillist_news()
+        # The page changed, but only the new thread should be fetched.
+        self.mailman.add_thread("third", subject="A third idea")
+        self.mailman.requests.clear()
+        await self.cog.post_maillist_news()
+
+        self.assertEqual(self.posted_titles(), ["A new idea", "Another idea", "A third idea"])
+        self.assertEqual(self.cog.seen_items["python-ideas"], {"first", "second", "third"})
+        self.assertEqual(
+            self.mailman.requests,
+            [
+                "/list/python-ideas/recent-threads",
+                "/api/list/python-ideas/thread/third/",
+                "/email/third",
+            ],
+        )
+
+    async def test_rejected_threads_are_not_fetched_again(self):
+        """Replies and threads from before today should be skipped, and not be fetched on the next cycles."""
+        self.mailman.add_thread("reply", subject="Re: A new idea")
+        self.mailman.add_thread("old", date=datetime.now(tz=UTC) - timedelta(days=2))
+
+        await self.cog.post_maillist_news()
+        self.mailman.add_thread("new")
+        self.mailman.requests.clear()
+        await self.cog.post_maillist_news()
+
+        self.assertEqual(self.posted_titles(), ["A new idea"])
+        self.assertEqual(self.cog.skipped_threads["python-ideas"], {"reply", "old"})
+        self.assertNotIn("/api/list/python-ideas/thread/reply/", self.mailman.requests)
+        self.assertNotIn("/api/list/python-ideas/thread/old/", self.mailman.requests)
+
+    async def test_unchanged_pages_are_not_processed(self):
+        """A page which hasn't changed since it was last processed should be requested conditionally, and skipped."""
+        self.mailman.add_thread("first")
+        self.mailman.add_pep(9999)
+
+        await self.cog.post_maillist_news()
+        await self.cog.post_pep_news()
+        self.mailman.requests.clear()
+        await self.cog.post_maillist_news()
+        await self.cog.post_pep_news()
+
+        self.assertEqual(self.send_webhook.await_count, 2)
+        self.assertEqual(self.mailman.requests, ["/list/python-ideas/recent-threads", "/peps.rss"])
+
+    async def test_validators_are_stored_once_a_page_is_processed(self):
+        """A page's validators shouldn't be stored until all its new threads were posted."""
+        self.mailman.add_thread("first")
+        self.send_webhook.side_effect = RuntimeError
+
+        with self.assertRaises(RuntimeError):
+            await self.cog.post_maillist_news()
+        self.assertEqual(self.cog.page_validators, {})
+
+        self.send_webhook.side_effect = None
+        await self.cog.post_maillist_news()
+        self.assertEqual(self.posted_titles(), ["A new idea", "A new idea"])
+        self.assertEqual(len(self.cog.page_validators), 1)
+
+    async def test_thread_fetches_are_bounded(self):
+        """No more than `MAX_CONCURRENT_THREAD_FETCHES` threads should be fetched at the same time."""
+        for i in range(20):
+            self.mailman.add_thread(str(i))
+
+        page, threads = await self.cog.fetch_new_threads("python-ideas")
+
+        self.assertIsNotNone(page)
+        self.assertEqual(len(threads), 20)
+        self.assertEqual(self.mailman.max_in_flight, python_news.MAX_CONCURRENT_THREAD_FETCHES)
+        self.assertEqual(self.cog.request_count, 1 + 2 * 20)
+
+    async def test_new_peps_are_posted_once(self):
+        """New PEPs should be posted oldest first, skipping those already posted or created long ago."""
+        now = datetime.now(tz=UTC).replace(microsecond=0)
+        self.mailman.add_pep(9998, now - timedelta(hours=1))
+        self.mailman.add_pep(9999, now - timedelta(hours=2))
+        self.mailman.add_pep(1, now - timedelta(weeks=7))
+        self.cog.seen_items["pep"].add("9998")
+
+        await self.cog.post_pep_news()
+
+        self.assertEqual(self.posted_titles(), ["PEP 9999: Something new"])
+        self.assertEqual(self.cog.seen_items["pep"], {"9998", "9999"})
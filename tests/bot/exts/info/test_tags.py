@@ -0,0 +1,192 @@
+import os
+import random
+import string
+import tempfile
+import unittest
+from pathlib import Path
+
+from bot.exts.info import tags
+from bot.exts.info.tags import TagIdentifier
+from tests.helpers import MockBot, MockMember, MockRole, MockTextChannel
+
+TAGS = {
+    "async-await.md": '---\naliases: ["await"]\n---\nUse `await`.',
+    "abc.md": "Abstract base classes.",
+    "mutable-default-args.md": "Defaults are evaluated once.",
+    "staff-only.md": "---\nrestricted_to: [1234]\n---\nSecret.",
+    "gotchas/floats.md": "Floats are approximations.",
+    "gotchas/identity.md": "`is` compares identity.",
+}
+
+
+def _reference_fuzzy_search(search: str, target: str) -> float:
+    """The scoring used before the index was built, to check the index against."""
+    _search = tags.REGEX_NON_ALPHABET.sub("", search.lower())
+    if not _search:
+        return 0
+
+    current = 0
+    for _target in tags.REGEX_NON_ALPHABET.split(target.lower()):
+        index = 0
+        try:
+            while index < len(_target) and _search[current] == _target[index]:
+                current += 1
+                index += 1
+        except IndexError:
+            break
+
+    return current / len(_search)
+
+
+def _reference_score(identifier: TagIdentifier, search: TagIdentifier) -> float:
+    """The fuzzy score of `identifier` for `search` before the index was built."""
+    if (identifier.group is None) != (search.group is None):
+        return 0
+    group_score = 1 if identifier.group == search.group else _reference_fuzzy_search(search.group, identifier.group)
+    return group_score * _reference_fuzzy_search(search.name, identifier.name) * 100
+
+
+class TagTestCase(unittest.IsolatedAsyncioTestCase):
+    """Base class for tests which load tags from a temporary directory."""
+
+    def setUp(self):
+        directory = tempfile.TemporaryDirectory()
+        self.addCleanup(directory.cleanup)
+        self.tags_path = Path(directory.name, "bot", "resources", "tags")
+        for name, content in TAGS.items():
+            self.write_tag(name, content)
+
+        # Tags are loaded from a path relative to the working directory.
+        self.addCleanup(os.chdir, os.getcwd())
+        os.chdir(directory.name)
+
+        self.bot = MockBot()
+        self.cog = tags.Tags(self.bot)
+
+    def write_tag(self, name: str, content: str) -> Path:
+        path = self.tags_path / name
+        path.parent.mkdir(parents=True, exist_ok=True)
+        path.write_text(content, encoding="utf8")
+        return path
+
+    def suggested_names(self, search: str) -> list[str]:
+        return [str(identifier) for identifier, _ in self.cog.get_fuzzy_matches(TagIdentifier.from_string(search))]
+
+
+class TagLookupTests(TagTestCase):
+    """Tests for looking up tags exactly, by prefix, and fuzzily."""
+
+    async def test_exact_match(self):
+        """A tag should be found by its exact name, its aliases, and its group and name."""
+        member = MockMember()
+        channel = MockTextChannel()
+
+        for search, content in (
+            ("abc", "Abstract base classes."),
+            ("await", "Use `await`."),
+            ("gotchas floats", "Floats are approximations."),
+        ):
+            with self.subTest(search=search):
+                embed = await self.cog.get_tag_embed(member, channel, TagIdentifier.from_string(search))
+                self.assertEqual(embed.description, content)
+
+    async def test_restricted_tag_is_not_suggested(self):
+        """Restricted tags should only be suggested to members with one of the allowed roles."""
+        channel = MockTextChannel()
+
+        self.assertIsNone(await self.cog.get_tag_embed(MockMember(), channel, TagIdentifier(None, "staf")))
+        embed = await self.cog.get_tag_embed(
+            MockMember(roles=[MockRole(id=1234)]), channel, TagIdentifier(None, "staf")
+        )
+        self.assertEqual(embed.description, "Secret.")
+
+    def test_prefix_match(self):
+        """A prefix of a tag's name, or of each of its words, should fully match it."""
+        self.assertEqual(self.suggested_names("asyn"), ["async-await"])
+        self.assertEqual(self.suggested_names("mutdef"), ["mutable-default-args"])
+
+    async def test_autocomplete(self):
+        """Autocomplete should suggest the names containing the current input, at most 25."""
+        for i in range(30):
+            self.write_tag(f"extra-{i}.md", "Extra.")
+        self.cog.initialize_tags()
+
+        async def autocomplete(current: str) -> list[str]:
+            return [choice.value for choice in await self.cog.name_autocomplete(None, current)]
+
+        self.assertEqual(await autocomplete("ASYNC"), ["async-await"])
+        self.assertEqual(len(await autocomplete("extra")), 25)
+
+    def test_fuzzy_match(self):
+        """Searches with typos should suggest the tags matching best, and only those."""
+        # 7 of the 9 letters are found in order, for a score of ~78.
+        self.assertEqual(self.suggested_names("asyncawit"), ["async-await"])
+        self.assertEqual(self.suggested_names("gotchas floatz"), ["gotchas floats"])
+        self.assertEqual(self.suggested_names("zzz"), [])
+
+    def test_cutoff_boundary(self):
+        """Tags should be suggested from a score of 60, and only those with the best score bracket."""
+        # 3 of 5 letters for "abc" is exactly the cutoff, 2 of 5 is below it.
+        self.assertEqual(self.suggested_names("abcxy"), ["abc"])
+        self.assertEqual(self.suggested_names("abxyz"), [])
+        # "await" scores 100, which hides "async-await" and "abc" scoring 50.
+        self.assertEqual(self.suggested_names("aw"), ["await"])
+
+    def test_scores_match_reference_implementation(self):
+        """The index should score every tag the same as scoring each one against the search directly."""
+        os.chdir(Path(tags.__file__).parents[3])
+        self.cog.initialize_tags()
+        identifiers = list(self.cog.tags)
+        rng = random.Random(4)
+
+        searches = [*identifiers]
+        for _ in range(1000):
+            name = "".join(rng.choices(string.ascii_lowercase + "-", k=rng.randint(1, 12)))
+            group = rng.choice([None, None, *{identifier.group for identifier in identifiers}])
+            searches.append(TagIdentifier(group, name))
+
+        for search in searches:
+            expected = {
+                identifier: score for identifier in identifiers if (score := _reference_score(identifier, search))
+            }
+            actual = {
+                self.cog.index.identifiers[position]: score for position, score in self.cog.index.fuzzy_scores(search)
+            }
+            self.assertEqual(actual, expected, search)
+
+
+class TagReloadTests(TagTestCase):
+    """Tests for reloading tags, and rebuilding their index."""
+
+    def test_added_tag_is_indexed(self):
+        """A tag added since the last load should be found by exact and fuzzy lookups after reloading."""
+        self.assertEqual(self.suggested_names("walrus"), [])
+
+        self.write_tag("walrus-operator.md", '---\naliases: ["walrus"]\n---\n`:=`')
+        self.cog.initialize_tags()
+
+        self.assertIn(TagIdentifier(None, "walrus"), self.cog.tags)
+        self.assertIn("walrus", self.suggested_names("walrus"))
+        self.assertIn("walrus-operator", self.cog.index.autocomplete_names)
+
+    def test_removed_tag_is_unindexed(self):
+        """A tag removed since the last load should no longer be found after reloading."""
+        (self.tags_path / "abc.md").unlink()
+        self.cog.initialize_tags()
+
+        self.assertNotIn(TagIdentifier(None, "abc"), self.cog.tags)
+        self.assertEqual(self.suggested_names("abc"), [])
+        self.assertNotIn("abc", self.cog.index.autocomplete_names)
+
+    def test_only_modified_tags_are_read_again(self):
+        """Reloading should only read the tag files modified since the last load."""
+        unchanged = self.cog.tags[TagIdentifier(None, "abc")]
+        path = self.write_tag("async-await.md", '---\naliases: ["coroutines"]\n---\nUse `async def`.')
+        os.utime(path, (0, 0))
+
+        self.cog.initialize_tags()
+
+        self.assertIs(self.cog.tags[TagIdentifier(None, "abc")], unchanged)
+        self.assertEqual(self.cog.tags[TagIdentifier(None, "async-await")].content, "Use `async def`.")
+        self.assertNotIn(TagIdentifier(None, "await"), self.cog.tags)
+        self.assertEqual(self.suggested_names("corout"), ["coroutines"])
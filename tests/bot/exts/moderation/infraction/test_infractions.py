@@ -342,3 +342,41 @@ class CleanBanTests(unittest.IsolatedAsyncioTestCase):
             None,
             reason=f"[Clean log]({self.log_url})"
         )
+
+
+@patch("bot.exts.moderation.infraction.management.send_log_message", new=AsyncMock())
+@patch("bot.exts.moderation.infraction.management.get_or_fetch_member", new=AsyncMock(return_value=None))
+class InfractionEditTests(unittest.IsolatedAsyncioTestCase):
+    """Tests for editing infractions."""
+
+    def setUp(self):
+        self.bot = MockBot()
+        self.ctx = MockContext(bot=self.bot)
+        self.cog = ModManagement(self.bot)
+        self.infraction = {
+            "id": 42,
+            "type": "ban",
+            "active": True,
+            "expires_at": None,
+            "reason": "Old reason",
+            "user": 1234,
+            "actor": 5678,
+        }
+
+    async def test_edit_invalidates_user_info(self):
+        """Editing an infraction should invalidate the cached `!user` information of its user."""
+        self.bot.api_client.patch.return_value = {**self.infraction, "reason": "New reason"}
+
+        await self.cog.infraction_edit(self.cog, self.ctx, self.infraction, None, reason="New reason")
+
+        self.bot.api_client.patch.assert_awaited_once_with("bot/infractions/42", json={"reason": "New reason"})
+        self.bot.dispatch.assert_called_once_with("user_info_update", 1234)
+
+    async def test_failed_edit_does_not_invalidate_user_info(self):
+        """The cached `!user` information shouldn't be invalidated when the edit fails."""
+        self.bot.api_client.patch.side_effect = ValueError
+
+        with self.assertRaises(ValueError):
+            await self.cog.infraction_edit(self.cog, self.ctx, self.infraction, None, reason="New reason")
+
+        self.bot.dispatch.assert_not_called()
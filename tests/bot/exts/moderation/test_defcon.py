@@ -0,0 +1,118 @@
+import asyncio
+import unittest
+from datetime import UTC, datetime, timedelta
+from unittest.mock import AsyncMock, MagicMock, patch
+
+from dateutil.relativedelta import relativedelta
+
+from bot.exts.moderation import defcon
+from tests.helpers import MockBot, MockMember
+
+LATENCY = 0.01
+
+
+def make_new_member(member_id: int, **kwargs) -> MockMember:
+    """Return a member whose account is too new to join, and whose DM and kick take a while."""
+    async def respond(*_args, **_kwargs) -> None:
+        await asyncio.sleep(LATENCY)
+
+    member = MockMember(id=member_id, created_at=datetime.now(tz=UTC) - timedelta(hours=1), **kwargs)
+    member.send = AsyncMock(side_effect=respond)
+    member.kick = AsyncMock(side_effect=respond)
+    return member
+
+
+@patch("bot.exts.moderation.defcon.send_log_message", new_callable=AsyncMock)
+class DefconRejectionTests(unittest.IsolatedAsyncioTestCase):
+    """Tests for rejecting members who join while a DEFCON threshold is active."""
+
+    def setUp(self):
+        self.bot = MockBot()
+        with patch.object(defcon.Defcon, "_sync_settings", new=MagicMock()):
+            self.cog = defcon.Defcon(self.bot)
+        self.cog.threshold = relativedelta(days=1)
+
+    async def asyncTearDown(self):
+        for worker in self.cog._rejection_workers:
+            worker.cancel()
+        if self.cog._rejection_log_task is not None:
+            self.cog._rejection_log_task.cancel()
+
+    async def reject(self, *members: MockMember) -> None:
+        """Have `members` join the server, and wait for all of them to be rejected."""
+        for member in members:
+            await self.cog.on_member_join(member)
+        await self.cog.rejection_queue.join()
+
+    async def test_old_accounts_are_not_rejected(self, send_log_message):
+        """Members whose accounts are older than the threshold shouldn't be queued."""
+        member = make_new_member(1)
+        member.created_at = datetime.now(tz=UTC) - timedelta(days=2)
+
+        await self.cog.on_member_join(member)
+
+        self.assertEqual(self.cog.rejection_queue.qsize(), 0)
+        self.assertEqual(self.cog._rejection_workers, [])
+
+    async def test_single_rejection_is_logged_on_its_own(self, send_log_message):
+        """A lone rejection should be DMed, kicked and logged with the member's details."""
+        member = make_new_member(1)
+
+        with patch.object(defcon, "REJECTION_LOG_INTERVAL", 0):
+            await self.reject(member)
+            await self.cog._rejection_log_task
+
+        member.send.assert_awaited_once()
+        member.kick.assert_awaited_once()
+        send_log_message.assert_awaited_once()
+        self.assertEqual(send_log_message.call_args.args[3], "Entry denied")
+        self.assertEqual(send_log_message.call_args.kwargs["thumbnail"], member.display_avatar.url)
+
+    async def test_kick_does_not_wait_for_slow_dm(self, send_log_message):
+        """A member should still be kicked if sending them the rejection DM takes too long."""
+        member = make_new_member(1)
+        member.send = AsyncMock(side_effect=asyncio.Event().wait)
+
+        with patch.object(defcon, "REJECTION_DM_TIMEOUT", LATENCY):
+            await self.reject(member)
+
+        member.kick.assert_awaited_once()
+        self.assertEqual(self.cog._rejections, [(member, False)])
+
+    async def test_join_storm(self, send_log_message):
+        """
+        A burst of joins should be rejected by all the workers at once, and logged in a single message.
+
+        Once the backlog is large, members are kicked without being DMed so the queue drains faster.
+        """
+        members = [make_new_member(i) for i in range(200)]
+        in_flight_kicks = peak_in_flight_kicks = 0
+
+        async def kick(*_args, **_kwargs) -> None:
+            nonlocal in_flight_kicks, peak_in_flight_kicks
+            in_flight_kicks += 1
+            peak_in_flight_kicks = max(peak_in_flight_kicks, in_flight_kicks)
+            await asyncio.sleep(LATENCY)
+            in_flight_kicks -= 1
+
+        for member in members:
+            member.kick.side_effect = kick
+
+        await self.reject(*members)
+
+        self.assertEqual(peak_in_flight_kicks, defcon.MAX_REJECTION_WORKERS)
+        for member in members:
+            member.kick.assert_awaited_once()
+        # Members are only DMed once fewer than the backlog limit are left queued behind them.
+        dmed = [member.id for member in members if member.send.called]
+        self.assertEqual(dmed, list(range(len(members) - defcon.REJECTION_DM_BACKLOG_LIMIT, len(members))))
+
+        timings = [call for call in self.bot.stats.timing.call_args_list if call.args[0].endswith("time_to_kick")]
+        self.assertEqual(len(timings), len(members))
+        self.bot.stats.gauge.assert_any_call("defcon.rejections.queue_depth", len(members))
+
+        await self.cog.cog_unload()
+        send_log_message.assert_awaited_once()
+        self.assertEqual(send_log_message.call_args.args[3], "200 accounts denied")
+        self.assertIn("...and 190 more", send_log_message.call_args.args[4])
+        self.assertEqual(len(send_log_message.call_args.kwargs["files"]), 1)
@@ -0,0 +1,163 @@
+import asyncio
+import tracemalloc
+import unittest
+from unittest.mock import MagicMock, patch
+
+from bot.exts.moderation import metabase
+from bot.exts.moderation.metabase import Export, ExportTooLargeError, Metabase
+from tests.helpers import MockBot
+
+
+class FakeContent:
+    """The streamed body of a response, made of `count` repetitions of `chunk`."""
+
+    def __init__(self, chunk: bytes, count: int):
+        self.chunk = chunk
+        self.count = count
+        self.chunks_read = 0
+
+    async def iter_chunked(self, _size: int):
+        for _ in range(self.count):
+            self.chunks_read += 1
+            yield self.chunk
+
+
+def mock_response(chunk: bytes, count: int = 1) -> MagicMock:
+    """Return a mock of the context manager returned by posting to Metabase."""
+    response = MagicMock()
+    response.content = FakeContent(chunk, count)
+    context_manager = MagicMock()
+    context_manager.__aenter__.return_value = response
+    return context_manager
+
+
+class MetabaseExportTests(unittest.IsolatedAsyncioTestCase):
+    """Tests for streaming and saving Metabase extracts."""
+
+    async def asyncSetUp(self):
+        self.bot = MockBot()
+        self.bot.loop = asyncio.get_running_loop()
+        self.cog = Metabase(self.bot)
+        self.addCleanup(self.cog._export_dir.cleanup)
+
+    async def test_extract_csv_rows_are_parsed_lazily(self):
+        """A CSV extract should be spooled to a file and parsed into rows when iterated."""
+        self.bot.http_session.post.return_value = mock_response(b"id,name\r\n1,a\r\n2,b\r\n")
+
+        export = await self.cog.extract(1, "csv")
+
+        self.assertTrue(export.path.exists())
+        self.assertEqual(export.rows(), [{"id": "1", "name": "a"}, {"id": "2", "name": "b"}])
+        self.assertEqual(export[1], {"id": "2", "name": "b"})
+        self.assertEqual(export[-2], {"id": "1", "name": "a"})
+        self.assertEqual(len(export), 2)
+        with self.assertRaises(IndexError):
+            export[2]
+
+    async def test_csv_rows_are_looked_up_by_offset(self):
+        """Rows spanning several lines, or with non-ASCII text, should be found by index after indexing once."""
+        content = 'id,name\r\n1,"multi\r\nline"\r\n\r\n2,caf\u00e9\r\n3,"a,b"\r\n'.encode()
+        self.bot.http_session.post.return_value = mock_response(content)
+        export = await self.cog.extract(1, "csv")
+
+        with patch.object(metabase.csv, "reader", wraps=metabase.csv.reader) as reader:
+            rows = [export[i] for i in range(len(export))]
+
+        self.assertEqual(rows, export.rows())
+        self.assertEqual(rows[0], {"id": "1", "name": "multi\r\nline"})
+        self.assertEqual(rows[1], {"id": "2", "name": "caf\u00e9"})
+        self.assertEqual(rows[2], {"id": "3", "name": "a,b"})
+        # Once to index the file, then once per lookup.
+        self.assertEqual(reader.call_count, 1 + len(rows))
+
+    async def test_rows_are_sliced(self):
+        """Slicing an export should return the rows in the slice, for both CSV and JSON extracts."""
+        for extension, content in (
+            ("csv", b"id\r\n1\r\n2\r\n3\r\n4\r\n"),
+            ("json", b'[{"id": "1"}, {"id": "2"}, {"id": "3"}, {"id": "4"}]'),
+        ):
+            with self.subTest(extension=extension):
+                self.bot.http_session.post.return_value = mock_response(content)
+                export = await self.cog.extract(1, extension)
+
+                self.assertEqual(export[1:3], [{"id": "2"}, {"id": "3"}])
+                self.assertEqual(export[::-2], [{"id": "4"}, {"id": "2"}])
+                self.assertEqual(export[10:], [])
+
+    async def test_json_rows_are_parsed_once(self):
+        """A JSON extract should only be parsed the first time its rows are used."""
+        self.bot.http_session.post.return_value = mock_response(b'[{"id": 1}, {"id": 2}, {"id": 3}]')
+        export = await self.cog.extract(1, "json")
+
+        with patch.object(metabase.json, "load", wraps=metabase.json.load) as load:
+            rows = [export[i] for i in range(len(export))]
+            self.assertEqual(list(export), rows)
+
+        self.assertEqual(rows, [{"id": 1}, {"id": 2}, {"id": 3}])
+        load.assert_called_once()
+
+    async def test_extract_json_is_formatted_for_humans(self):
+        """A JSON extract should be parsed into rows, and formatted with indentation for pasting."""
+        self.bot.http_session.post.return_value = mock_response(b'[{"b": 1, "a": 2}]')
+
+        export = await self.cog.extract(1, "json")
+
+        self.assertEqual(export.rows(), [{"b": 1, "a": 2}])
+        self.assertEqual(export.format(), '[\n    {\n        "a": 2,\n        "b": 1\n    }\n]')
+
+    @patch("bot.exts.moderation.metabase.MAX_EXPORT_SIZE", 10)
+    async def test_extract_too_large_is_aborted(self):
+        """An extract exceeding the size limit should be aborted, and its file deleted."""
+        self.bot.http_session.post.return_value = mock_response(b"123456", count=2)
+
+        with self.assertRaises(ExportTooLargeError):
+            await self.cog.extract(1, "csv")
+
+        self.assertEqual(list(metabase.Path(self.cog._export_dir.name).iterdir()), [])
+
+    @patch("bot.exts.moderation.metabase.MAX_EXPORTS", 2)
+    def test_add_export_evicts_least_recent(self):
+        """Exports beyond the count limit should be deleted, least recently extracted first."""
+        exports = [MagicMock(spec=Export, size=1) for _ in range(3)]
+
+        for question_id, export in enumerate(exports):
+            self.cog.add_export(question_id, export)
+
+        self.assertEqual(list(self.cog.exports), [1, 2])
+        exports[0].delete.assert_called_once()
+
+    @patch("bot.exts.moderation.metabase.MAX_EXPORTS_SIZE", 10)
+    def test_add_export_evicts_over_total_size(self):
+        """Exports should be deleted once their total size exceeds the limit, keeping the newest."""
+        old, new = MagicMock(spec=Export, size=6), MagicMock(spec=Export, size=6)
+
+        self.cog.add_export(1, old)
+        self.cog.add_export(2, new)
+
+        self.assertEqual(list(self.cog.exports), [2])
+        old.delete.assert_called_once()
+        new.delete.assert_not_called()
+
+    async def test_extract_memory_is_bounded(self):
+        """Streaming an extract should write it chunk by chunk, only ever holding a few chunks in memory."""
+        chunk = b"id,value\r\n" + b"1,abcdefghijklmnopqrstuvwxyz\r\n" * (metabase.CHUNK_SIZE // 30)
+        count = (8 * 1024 * 1024) // len(chunk)
+        context_manager = mock_response(chunk, count)
+        response = context_manager.__aenter__.return_value
+        self.bot.http_session.post.return_value = context_manager
+
+        tracemalloc.start()
+        try:
+            export = await self.cog.extract(1, "csv")
+            _, peak = tracemalloc.get_traced_memory()
+        finally:
+            tracemalloc.stop()
+
+        self.assertEqual(response.content.chunks_read, count)
+        self.assertEqual(export.size, count * len(chunk))
+        self.assertEqual(export.path.stat().st_size, export.size)
+        self.assertLess(peak, 1024 * 1024)
+        # The body is only streamed, never read whole.
+        response.read.assert_not_called()
+        response.text.assert_not_called()
+        response.json.assert_not_called()
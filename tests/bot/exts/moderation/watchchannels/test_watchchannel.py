@@ -0,0 +1,109 @@
+import unittest
+from collections import deque
+from datetime import UTC, datetime
+from unittest.mock import AsyncMock, MagicMock, patch
+
+from bot.exts.moderation.watchchannels._watchchannel import MAX_CONTENT_LENGTH, WatchChannel
+from tests.helpers import MockBot, MockMember, MockMessage, MockTextChannel
+
+
+class ConcreteWatchChannel(WatchChannel):
+    """A concrete watch channel for testing."""
+
+    def __init__(self, bot):
+        super().__init__(bot, 1, 2, "bot/infractions", {}, MagicMock())
+
+
+class RelayTests(unittest.IsolatedAsyncioTestCase):
+    """Tests for relaying watched users' messages."""
+
+    def setUp(self):
+        self.bot = MockBot()
+        self.cog = ConcreteWatchChannel(self.bot)
+        self.cog.webhook = MagicMock(send=AsyncMock())
+        self.cog.send_header = AsyncMock()
+        self.author = MockMember(display_name="watched user")
+        self.channel = MockTextChannel()
+
+        patcher = patch("bot.exts.moderation.watchchannels._watchchannel.DiscordTokenFilter")
+        patcher.start().find_token_in_message.return_value = None
+        self.addCleanup(patcher.stop)
+
+    def make_messages(self, count: int, content: str = "hello", **kwargs) -> deque[MockMessage]:
+        """Return a queue of `count` messages from the watched user."""
+        return deque(
+            MockMessage(
+                author=self.author,
+                channel=self.channel,
+                content=content,
+                clean_content=content,
+                embeds=[],
+                created_at=datetime.now(tz=UTC),
+                **kwargs,
+            )
+            for _ in range(count)
+        )
+
+    @patch("bot.exts.moderation.watchchannels._watchchannel.BigBrotherConfig.header_message_limit", 100)
+    async def test_consecutive_messages_are_batched(self):
+        """A high volume of messages should be relayed in as few payloads as the content limit allows."""
+        queue = self.make_messages(200, "x" * 99)
+
+        await self.cog.relay_messages(queue, {})
+
+        self.assertFalse(queue)
+        self.assertEqual(self.cog.send_header.await_count, 2)
+        sent = [call.kwargs["content"] for call in self.cog.webhook.send.await_args_list]
+        # 20 messages of 99 characters fit in each payload, along with their separating newlines.
+        self.assertEqual(len(sent), 10)
+        self.assertTrue(all(len(content) <= MAX_CONTENT_LENGTH for content in sent))
+        self.assertEqual("\n".join(sent), "\n".join(["x" * 99] * 200))
+
+    async def test_header_limit_starts_new_batch(self):
+        """Messages after the header message limit should be sent after a new header."""
+        with patch("bot.exts.moderation.watchchannels._watchchannel.BigBrotherConfig.header_message_limit", 3):
+            await self.cog.relay_messages(self.make_messages(7), {})
+
+        self.assertEqual(self.cog.send_header.await_count, 3)
+        sent = [call.kwargs["content"] for call in self.cog.webhook.send.await_args_list]
+        self.assertEqual(sent, ["hello\nhello\nhello", "hello\nhello\nhello", "hello"])
+
+    @patch("bot.exts.moderation.watchchannels._watchchannel.messages.send_attachments", new_callable=AsyncMock)
+    async def test_attachments_are_relayed_in_order(self, send_attachments):
+        """Content before a message's attachments should be sent before them, and content after, after."""
+        queue = self.make_messages(2)
+        queue.append(MockMessage(
+            author=self.author,
+            channel=self.channel,
+            content="with file",
+            clean_content="with file",
+            embeds=[],
+            attachments=[MagicMock()],
+            created_at=datetime.now(tz=UTC),
+        ))
+        queue.extend(self.make_messages(1, "after"))
+        order = []
+        self.cog.webhook.send.side_effect = lambda **kwargs: order.append(kwargs["content"])
+        send_attachments.side_effect = lambda *_: order.append("attachment")
+
+        await self.cog.relay_messages(queue, {})
+
+        self.assertEqual(order, ["hello\nhello\nwith file", "attachment", "after"])
+
+    async def test_relay_reports_lag_and_queue_depth(self):
+        """Relay lag should be reported for each message, and queue depth as messages are queued."""
+        self.cog.watched_users[self.author.id] = {"reason": "testing"}
+        self.cog._consume_task = MagicMock(done=MagicMock(return_value=False))
+
+        for msg in self.make_messages(3):
+            await self.cog.on_message(msg)
+        self.bot.stats.gauge.assert_called_with("watch_channels.concretewatchchannel.queue_depth", 3)
+
+        await self.cog.consume_messages(delay_consumption=False)
+
+        self.bot.stats.gauge.assert_called_with("watch_channels.concretewatchchannel.queue_depth", 0)
+        lag_calls = [
+            call for call in self.bot.stats.timing.call_args_list
+            if call.args[0] == "watch_channels.concretewatchchannel.relay_lag"
+        ]
+        self.assertEqual(len(lag_calls), 3)
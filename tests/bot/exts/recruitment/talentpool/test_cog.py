@@ -0,0 +1,47 @@
+import unittest
+from unittest.mock import AsyncMock, Mock, patch
+
+from bot.exts.recruitment.talentpool import _cog
+from tests.helpers import MockBot, MockTextChannel
+
+
+class PruneTalentpoolTests(unittest.IsolatedAsyncioTestCase):
+    """Tests for pruning inactive users from the talent pool."""
+
+    def setUp(self):
+        self.bot = MockBot()
+        self.cog = _cog.TalentPool(self.bot)
+        self.cog.api = Mock(edit_nominations=AsyncMock())
+        self.channel = MockTextChannel()
+
+        patcher = patch.object(_cog, "get_or_fetch_channel", AsyncMock(return_value=self.channel))
+        patcher.start()
+        self.addCleanup(patcher.stop)
+
+    async def prune(self, user_count: int) -> list[str]:
+        """Prune `user_count` inactive users, returning the messages sent to the nomination discussion."""
+        nominations = [Mock(id=i, user_id=10**17 + i, reviewed=False) for i in range(user_count)]
+        self.cog.api.get_nominations = AsyncMock(return_value=nominations)
+        self.cog.api.get_activity = AsyncMock(return_value=dict.fromkeys((n.user_id for n in nominations), 0))
+
+        await self.cog.prune_talentpool.coro(self.cog)
+        return [call.args[0] for call in self.channel.send.await_args_list]
+
+    async def test_summary_fits_in_one_message(self):
+        """A short summary should be sent as the header followed directly by one line per user."""
+        messages = await self.prune(2)
+
+        self.assertEqual(len(messages), 1)
+        header, *lines = messages[0].split("\n")
+        self.assertTrue(header.startswith(":warning:"))
+        self.assertEqual(lines, [f"<@{10**17 + i}> ({10**17 + i})" for i in range(2)])
+
+    async def test_long_summary_is_split_without_blank_lines(self):
+        """A summary which doesn't fit in one message should be split on lines, without empty lines."""
+        messages = await self.prune(200)
+
+        self.assertGreater(len(messages), 1)
+        for message in messages:
+            self.assertLessEqual(len(message), _cog.MAX_MESSAGE_SIZE)
+            self.assertNotIn("", message.split("\n"))
+        self.assertEqual(sum(len(message.split("\n")) for message in messages), 201)
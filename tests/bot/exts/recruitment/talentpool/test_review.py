@@ -261,3 +261,37 @@ class ReviewerTests(unittest.IsolatedAsyncioTestCase):
                         res = await self.reviewer.get_nomination_to_review()
                         self.assertEqual(res, case[i])
                         get_nominations_mock.assert_called_once_with(active=True)
+
+    @patch("bot.exts.recruitment.talentpool._review.MIN_NOMINATION_TIME", timedelta(days=7))
+    async def test_filter_nominations_only_fetches_eligible_members(self):
+        """Members should only be fetched for nominations that pass the checks which don't need an API call."""
+        now = datetime.now(UTC)
+        eligible = nomination(now - timedelta(days=10), 1)
+        nominations = [
+            nomination(now - timedelta(days=1), 5),
+            nomination(now - timedelta(days=10), 5, reviewed=True),
+            nomination(now - timedelta(days=10), 5, msg_count=0),
+            eligible,
+        ]
+        activity = {nomination.id: nomination._msg_count for nomination in nominations}
+
+        with patch("bot.exts.recruitment.talentpool._review.get_or_fetch_member", AsyncMock()) as fetch_member_mock:
+            res = await self.reviewer.filter_nominations_ready_for_review(nominations, activity, now)
+
+        self.assertEqual(res, [eligible])
+        fetch_member_mock.assert_awaited_once_with(self.bot.get_guild.return_value, eligible.user_id)
+
+    async def test_filter_nominations_excludes_non_members(self):
+        """Nominations for users who are no longer in the server should be filtered out."""
+        now = datetime.now(UTC)
+        nominations = [nomination(now - timedelta(days=10), 1, id=1), nomination(now - timedelta(days=10), 1, id=2)]
+        activity = {nomination.id: nomination._msg_count for nomination in nominations}
+
+        members = {1: None, 2: MockMember()}
+        with patch(
+            "bot.exts.recruitment.talentpool._review.get_or_fetch_member",
+            AsyncMock(side_effect=lambda _guild, user_id: members[user_id])
+        ):
+            res = await self.reviewer.filter_nominations_ready_for_review(nominations, activity, now)
+
+        self.assertEqual(res, [nominations[1]])
@@ -0,0 +1,105 @@
+import asyncio
+import unittest
+from unittest.mock import AsyncMock, MagicMock
+
+from bot.exts.utils.snekbox._dispatcher import EvalDispatcher, EvalQueueFullError
+
+
+class EvalDispatcherTests(unittest.IsolatedAsyncioTestCase):
+    """Tests for the bot-wide snekbox job dispatcher."""
+
+    def setUp(self):
+        self.stats = MagicMock()
+        self.dispatcher = EvalDispatcher(max_concurrent=1, max_queued=2, stats=self.stats)
+
+    async def test_slot_granted_immediately_when_free(self):
+        """A job should run straight away, without being queued, while a slot is free."""
+        on_queued = AsyncMock()
+
+        async with self.dispatcher.slot(1, on_queued):
+            self.assertEqual(self.dispatcher.queued, 0)
+
+        on_queued.assert_not_awaited()
+        self.stats.timing.assert_called_once_with("snekbox.queue.wait_time", 0)
+
+    async def test_queue_full_rejects_job(self):
+        """A job submitted while the queue is full should be rejected."""
+        started = asyncio.Event()
+        release = asyncio.Event()
+
+        async def hold(user_id):
+            async with self.dispatcher.slot(user_id):
+                started.set()
+                await release.wait()
+
+        tasks = [asyncio.create_task(hold(user_id)) for user_id in (1, 2, 3)]
+        await started.wait()
+        await asyncio.sleep(0)
+        self.assertEqual(self.dispatcher.queued, 2)
+
+        with self.assertRaises(EvalQueueFullError):
+            async with self.dispatcher.slot(4):
+                pass
+        self.stats.incr.assert_called_once_with("snekbox.queue.rejected")
+
+        release.set()
+        await asyncio.gather(*tasks)
+        self.assertEqual(self.dispatcher.queued, 0)
+
+    async def test_waiting_jobs_are_served_round_robin(self):
+        """Waiting jobs should alternate between users rather than run in submission order."""
+        self.dispatcher.max_queued = 10
+        order = []
+        positions = {}
+        release = asyncio.Event()
+
+        async def job(user_id, name):
+            async def on_queued(position):
+                positions[name] = position
+
+            async with self.dispatcher.slot(user_id, on_queued):
+                order.append(name)
+                await release.wait()
+
+        first = asyncio.create_task(job(1, "a0"))
+        await asyncio.sleep(0)
+        tasks = [
+            asyncio.create_task(job(user_id, name))
+            for user_id, name in ((1, "a1"), (1, "a2"), (2, "b1"))
+        ]
+        await asyncio.sleep(0)
+        release.set()
+        await asyncio.gather(first, *tasks)
+
+        self.assertEqual(order, ["a0", "a1", "b1", "a2"])
+        # Positions are reported on submission, before later jobs from other users could move ahead
+        self.assertEqual(positions, {"a1": 1, "a2": 2, "b1": 2})
+
+    async def test_cancelled_waiter_leaves_queue(self):
+        """Cancelling a queued job should remove it from the queue without leaking a slot."""
+        release = asyncio.Event()
+
+        async def hold():
+            async with self.dispatcher.slot(1):
+                await release.wait()
+
+        holder = asyncio.create_task(hold())
+        await asyncio.sleep(0)
+
+        async def wait():
+            async with self.dispatcher.slot(2):
+                pass
+
+        waiter = asyncio.create_task(wait())
+        await asyncio.sleep(0)
+        self.assertEqual(self.dispatcher.queued, 1)
+
+        waiter.cancel()
+        with self.assertRaises(asyncio.CancelledError):
+            await waiter
+        self.assertEqual(self.dispatcher.queued, 0)
+
+        release.set()
+        await holder
+        async with self.dispatcher.slot(3):
+            pass
@@ -32,3 +32,12 @@ class SnekboxIOTests(TestCase):
                 # Test FileAttachment.to_file()
                 obj = _io.FileAttachment(name, b"")
                 self.assertEqual(obj.to_file().filename, expected)
+
+    def test_preview_is_bounded(self):
+        """The text preview should be decoded at most once and limited to `PREVIEW_SIZE_LIMIT` bytes."""
+        small = _io.FileAttachment("small.txt", "héllo".encode())
+        self.assertEqual(small.preview, "héllo")
+        self.assertIs(small.preview, small.preview)
+
+        large = _io.FileAttachment("large.txt", b"a" * (_io.PREVIEW_SIZE_LIMIT * 2))
+        self.assertEqual(len(large.preview), _io.PREVIEW_SIZE_LIMIT)
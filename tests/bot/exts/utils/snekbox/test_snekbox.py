@@ -1,4 +1,6 @@
 import asyncio
+import json
+import threading
 import unittest
 from base64 import b64encode
 from unittest.mock import AsyncMock, MagicMock, Mock, call, create_autospec, patch
@@ -32,7 +34,8 @@ class SnekboxTests(unittest.IsolatedAsyncioTestCase):
     async def test_post_job(self):
         """Post the eval code to the URLs.snekbox_eval_api endpoint."""
         resp = MagicMock()
-        resp.json = AsyncMock(return_value={"stdout": "Hi", "returncode": 137, "files": []})
+        resp.read = AsyncMock(return_value=json.dumps({"stdout": "Hi", "returncode": 137, "files": []}).encode())
+        self.bot.loop = asyncio.get_running_loop()
 
         context_manager = MagicMock()
         context_manager.__aenter__.return_value = resp
@@ -56,7 +59,133 @@ class SnekboxTests(unittest.IsolatedAsyncioTestCase):
             json=expected,
             raise_for_status=True
         )
-        resp.json.assert_awaited_once()
+        resp.read.assert_awaited_once()
+
+    async def test_post_job_decodes_files_off_the_event_loop(self):
+        """Attachments and text previews should be decoded in a worker thread, not on the event loop."""
+        content = b"line\n" * (256 * 1024)
+        body = json.dumps({
+            "stdout": "",
+            "returncode": 0,
+            "files": [
+                {"path": f"output{i}.txt", "size": len(content), "content": b64encode(content).decode()}
+                for i in range(5)
+            ],
+        }).encode()
+        resp = MagicMock()
+        resp.read = AsyncMock(return_value=body)
+        context_manager = MagicMock()
+        context_manager.__aenter__.return_value = resp
+        self.bot.http_session.post.return_value = context_manager
+        self.bot.loop = asyncio.get_running_loop()
+
+        decoding_threads = set()
+        from_dict = FileAttachment.from_dict.__func__
+
+        def record_thread(cls, *args, **kwargs):
+            decoding_threads.add(threading.current_thread())
+            return from_dict(cls, *args, **kwargs)
+
+        with patch.object(FileAttachment, "from_dict", classmethod(record_thread)):
+            result = await self.cog.post_job(self.job)
+
+        self.assertEqual(len(result.files), 5)
+        self.assertNotIn(threading.main_thread(), decoding_threads)
+        # The previews were decoded while parsing and are cached on the attachments
+        for file in result.files:
+            self.assertIn("preview", vars(file))
+
+    @patch("bot.exts.utils.snekbox._cog.SnekboxConfig.cache_results", True)
+    async def test_run_eval_reuses_cached_result(self):
+        """An identical deterministic job should reuse the previous result instead of being evaluated again."""
+        ctx = MockContext()
+        result = EvalResult("Hi", 0)
+        self.cog.post_job = AsyncMock(return_value=result)
+        job = EvalJob.from_code("print('Hi')")
+
+        self.assertIs(await self.cog.run_eval(ctx, job), result)
+        self.assertIs(await self.cog.run_eval(ctx, EvalJob.from_code("print('Hi')")), result)
+
+        self.cog.post_job.assert_awaited_once_with(job)
+        self.bot.stats.incr.assert_has_calls([call("snekbox.cache.miss"), call("snekbox.cache.hit")])
+
+    @patch("bot.exts.utils.snekbox._cog.SnekboxConfig.cache_results", True)
+    async def test_run_eval_coalesces_concurrent_identical_jobs(self):
+        """Identical jobs evaluated at the same time should share one evaluation."""
+        release = asyncio.Event()
+        result = EvalResult("Hi", 0)
+
+        async def post_job(_job):
+            await release.wait()
+            return result
+
+        self.cog.post_job = AsyncMock(side_effect=post_job)
+        tasks = [
+            asyncio.create_task(self.cog.run_eval(MockContext(), EvalJob.from_code("print('Hi')")))
+            for _ in range(3)
+        ]
+        await asyncio.sleep(0)
+        release.set()
+
+        self.assertEqual(await asyncio.gather(*tasks), [result] * 3)
+        self.cog.post_job.assert_awaited_once()
+        self.assertEqual(self.cog.pending_results, {})
+
+    @patch("bot.exts.utils.snekbox._cog.SnekboxConfig.cache_results", True)
+    async def test_run_eval_does_not_cache_nondeterministic_or_failed_jobs(self):
+        """Jobs which may not give the same result again, or which failed, should always be evaluated."""
+        cases = (
+            (EvalJob.from_code("import random; print(random.random())"), EvalResult("0.5", 0)),
+            (EvalJob(["-m", "timeit", "1 + 1"], name="timeit"), EvalResult("10 loops", 0)),
+            (EvalJob.from_code("while True: pass"), EvalResult("", 137)),
+        )
+        for job, result in cases:
+            with self.subTest(job=job):
+                self.cog.post_job = AsyncMock(return_value=result)
+
+                await self.cog.run_eval(MockContext(), job)
+                await self.cog.run_eval(MockContext(), job)
+
+                self.assertEqual(self.cog.post_job.await_count, 2)
+
+    async def test_run_eval_without_cache(self):
+        """Results should not be reused when result caching is disabled."""
+        self.cog.post_job = AsyncMock(return_value=EvalResult("Hi", 0))
+
+        await self.cog.run_eval(MockContext(), self.job)
+        await self.cog.run_eval(MockContext(), self.job)
+
+        self.assertEqual(self.cog.post_job.await_count, 2)
+        self.assertEqual(len(self.cog.result_cache), 0)
+
+    def test_eval_job_is_cacheable(self):
+        """Only jobs which can't give a different result each time, and weren't opted out, should be cacheable."""
+        for code in ("print(1 + 1)", "print({'a': 1})", "print(f'{1}')", "print([x for x in 'ab'])"):
+            with self.subTest(code=code):
+                self.assertTrue(EvalJob.from_code(code).is_cacheable)
+
+        for code in (
+            "print({1, 2})",
+            "print({x for x in 'ab'})",
+            "print(__import__('random').random())",
+            "import importlib; print(importlib.import_module('random').random())",
+            "print(open('/dev/urandom', 'rb').read(4))",
+            "print(object())",
+            "print(getattr(__builtins__, 'id')(1))",
+            "print(1 + 1)  # no-cache",
+            "print(1 +",
+        ):
+            with self.subTest(code=code):
+                self.assertFalse(EvalJob.from_code(code).is_cacheable)
+
+    def test_eval_job_cache_key(self):
+        """Jobs should share a cache key only if their args, files and version are the same."""
+        job = EvalJob.from_code("print(1)")
+
+        self.assertEqual(job.cache_key, EvalJob.from_code("print(1)").cache_key)
+        self.assertNotEqual(job.cache_key, EvalJob.from_code("print(2)").cache_key)
+        self.assertNotEqual(job.cache_key, job.as_version("3.13").cache_key)
+        self.assertNotEqual(job.cache_key, EvalJob.from_code("print(1)", path="other.py").cache_key)
 
     @patch(
         "bot.exts.utils.snekbox._cog.paste_service._lexers_supported_by_pastebin",
@@ -0,0 +1,259 @@
+import asyncio
+import unittest
+from datetime import UTC, datetime, timedelta
+from unittest.mock import AsyncMock, MagicMock, patch
+
+from pydis_core.site_api import ResponseCodeError
+
+from bot.errors import LockedResourceError
+from bot.exts.utils import reminders
+from tests.helpers import MockBot, MockContext, MockMember
+
+LATENCY = 0.02
+
+
+def make_reminder(reminder_id: int, *, channel_id: int = 1, minutes: int = -5) -> dict:
+    """Return a reminder which arrives, or arrived, `minutes` from now."""
+    return {
+        "id": reminder_id,
+        "author": 100,
+        "channel_id": channel_id,
+        "content": f"Reminder {reminder_id}",
+        "expiration": (datetime.now(UTC) + timedelta(minutes=minutes)).isoformat(),
+        "jump_url": f"https://discord.com/channels/1/{channel_id}/{reminder_id}",
+        "mentions": [],
+    }
+
+
+class ReminderCatchUpTests(unittest.IsolatedAsyncioTestCase):
+    """Tests for sending the reminders which became overdue while the bot was offline."""
+
+    def setUp(self):
+        self.bot = MockBot()
+        self.cog = reminders.Reminders(self.bot)
+        self.cog.scheduler = MagicMock()
+        self.cog.scheduler.schedule_at.side_effect = lambda _time, _id, coroutine: coroutine.close()
+
+        self.sending: dict[int, int] = {}
+        self.max_channels_sending = 0
+        self.sent: list[int] = []
+        self.cog.send_reminder = AsyncMock(side_effect=self.send_reminder)
+
+    async def asyncTearDown(self):
+        await self.cog.cog_unload()
+
+    async def send_reminder(self, reminder: dict, _expected_time: datetime) -> None:
+        """Simulate sending a reminder, tracking how many are sent at once in each channel."""
+        channel_id = reminder["channel_id"]
+        self.sending[channel_id] = self.sending.get(channel_id, 0) + 1
+        self.max_channels_sending = max(self.max_channels_sending, len(self.sending))
+        await asyncio.sleep(LATENCY)
+
+        self.assertEqual(self.sending[channel_id], 1, "Reminders were sent to the same channel at once.")
+        self.sending[channel_id] -= 1
+        if not self.sending[channel_id]:
+            del self.sending[channel_id]
+        self.sent.append(reminder["id"])
+
+    async def test_overdue_reminders_are_sent_in_the_background(self):
+        """Loading the cog should schedule future reminders without waiting for overdue ones to be sent."""
+        overdue = [make_reminder(i) for i in range(3)]
+        future = [make_reminder(i, minutes=5) for i in range(3, 5)]
+        self.bot.api_client.get.return_value = overdue + future
+
+        await self.cog.cog_load()
+
+        self.assertEqual(self.sent, [])
+        scheduled = [call.args[1] for call in self.cog.scheduler.schedule_at.call_args_list]
+        self.assertEqual(scheduled, [3, 4])
+
+        await self.cog.catch_up_task
+        self.assertEqual(self.sent, [0, 1, 2])
+
+    async def test_channels_are_caught_up_concurrently(self):
+        """Channels should be caught up at the same time, up to a limit, each sending one reminder at a time."""
+        overdue = [make_reminder(i, channel_id=i % 10) for i in range(40)]
+
+        await self.cog.send_overdue_reminders(overdue)
+
+        self.assertCountEqual(self.sent, range(40))
+        self.assertEqual(self.max_channels_sending, reminders.MAX_CATCH_UP_CHANNELS)
+        for channel_id in range(10):
+            sent_to_channel = [reminder_id for reminder_id in self.sent if reminder_id % 10 == channel_id]
+            self.assertEqual(sent_to_channel, sorted(sent_to_channel))
+
+    async def test_oldest_reminders_are_sent_first(self):
+        """Each channel's reminders should be sent from the oldest to the most recent."""
+        overdue = [make_reminder(i, minutes=-i) for i in range(5)]
+
+        await self.cog.send_overdue_reminders(overdue)
+
+        self.assertEqual(self.sent, [4, 3, 2, 1, 0])
+
+    async def test_failures_do_not_stop_the_catch_up(self):
+        """A reminder which fails to be sent, or is locked, shouldn't stop the others from being sent."""
+        send = self.cog.send_reminder.side_effect
+
+        async def send_reminder(reminder: dict, expected_time: datetime) -> None:
+            if reminder["id"] == 1:
+                raise ValueError
+            if reminder["id"] == 2:
+                raise LockedResourceError("reminder", 2)
+            await send(reminder, expected_time)
+
+        self.cog.send_reminder.side_effect = send_reminder
+        overdue = [make_reminder(i, minutes=-10 + i) for i in range(4)]
+
+        with self.assertLogs(reminders.log, "ERROR"):
+            await self.cog.send_overdue_reminders(overdue)
+
+        self.assertEqual(self.sent, [0, 3])
+        self.bot.stats.incr.assert_called_once_with("reminders.catch_up.failed")
+
+    async def test_progress_and_duration_are_reported(self):
+        """The number of overdue reminders left to send, and how long the catch-up took, should be reported."""
+        overdue = [make_reminder(i) for i in range(3)]
+
+        await self.cog.send_overdue_reminders(overdue)
+
+        remaining = [call.args[1] for call in self.bot.stats.gauge.call_args_list]
+        self.assertEqual(remaining, [3, 2, 1, 0])
+        self.assertEqual(self.bot.stats.timing.call_args.args[0], "reminders.catch_up.duration")
+
+    async def test_invalid_reminders_are_deleted_in_tracked_tasks(self):
+        """Reminders in channels which no longer exist should be deleted, with the deletions tracked until done."""
+        self.bot.get_channel.return_value = None
+        self.bot.api_client.get.return_value = [make_reminder(1), make_reminder(2, minutes=5)]
+
+        await self.cog.cog_load()
+
+        self.assertEqual(len(self.cog.invalid_reminder_deletions), 2)
+        await asyncio.gather(*self.cog.invalid_reminder_deletions)
+        self.assertEqual(self.cog.invalid_reminder_deletions, set())
+        self.assertIsNone(self.cog.catch_up_task)
+        self.bot.api_client.delete.assert_any_await("bot/reminders/1")
+        self.bot.api_client.delete.assert_any_await("bot/reminders/2")
+
+
+class CountingAPIClient:
+    """A fake site API client storing reminders, which counts the requests made to it."""
+
+    def __init__(self, reminders_: list[dict]):
+        self.reminders = {reminder["id"]: reminder for reminder in reminders_}
+        self.requests: list[tuple[str, str]] = []
+        self.in_flight = 0
+        self.max_in_flight = 0
+
+    async def _request(self, method: str, endpoint: str) -> None:
+        self.requests.append((method, endpoint))
+        self.in_flight += 1
+        self.max_in_flight = max(self.max_in_flight, self.in_flight)
+        await asyncio.sleep(LATENCY)
+        self.in_flight -= 1
+
+    async def get(self, endpoint: str, params: dict | None = None) -> dict | list[dict]:
+        await self._request("GET", endpoint)
+        if endpoint == "bot/reminders":
+            author_id = int(params["author__id"])
+            return [reminder for reminder in self.reminders.values() if reminder["author"] == author_id]
+
+        reminder_id = int(endpoint.removeprefix("bot/reminders/"))
+        if reminder_id not in self.reminders:
+            raise ResponseCodeError(MagicMock(status=404))
+        return self.reminders[reminder_id]
+
+    async def post(self, endpoint: str, json: dict) -> dict:
+        await self._request("POST", endpoint)
+        reminder = {"id": max(self.reminders, default=0) + 1, **json}
+        self.reminders[reminder["id"]] = reminder
+        return reminder
+
+    async def delete(self, endpoint: str) -> None:
+        await self._request("DELETE", endpoint)
+        del self.reminders[int(endpoint.removeprefix("bot/reminders/"))]
+
+    def count(self, method: str) -> int:
+        return sum(request_method == method for request_method, _ in self.requests)
+
+
+class BulkReminderOperationTests(unittest.IsolatedAsyncioTestCase):
+    """Tests for deleting reminders in bulk, and counting a user's active reminders."""
+
+    def setUp(self):
+        self.bot = MockBot()
+        self.cog = reminders.Reminders(self.bot)
+        self.cog.scheduler = MagicMock()
+        self.cog.scheduler.schedule_at.side_effect = lambda _time, _id, coroutine: coroutine.close()
+
+        self.author = MockMember(id=100)
+        self.ctx = MockContext(author=self.author, bot=self.bot)
+        self.ctx.channel.id = reminders.WHITELISTED_CHANNELS[0]
+
+        own = [make_reminder(i, minutes=5) for i in range(1, 6)]
+        others = [{**make_reminder(i, minutes=5), "author": 200} for i in range(6, 9)]
+        self.api = CountingAPIClient(own + others)
+        self.bot.api_client = self.api
+
+        patcher = patch.object(reminders, "has_any_role_check", AsyncMock(return_value=False))
+        self.has_any_role_check = patcher.start()
+        self.addCleanup(patcher.stop)
+
+    async def test_deleting_own_reminders_checks_ownership_once(self):
+        """Deleting several reminders should fetch the author's reminders once, then delete them concurrently."""
+        await self.cog.delete_reminder(self.cog, self.ctx, [1, 2, 3, 4, 5])
+
+        self.assertEqual(self.api.count("GET"), 1)
+        self.assertEqual(self.api.count("DELETE"), 5)
+        self.assertEqual(self.api.max_in_flight, 5)
+        self.assertNotIn(1, self.api.reminders)
+        self.assertIn("1, 2, 3, 4, 5", self.ctx.send.call_args.kwargs["embed"].description)
+
+    async def test_other_users_reminders_are_not_fetched_for_non_admins(self):
+        """Reminders which aren't in the author's listing shouldn't be fetched or deleted for non-admins."""
+        await self.cog.delete_reminder(self.cog, self.ctx, [1, 6, 42])
+
+        self.assertEqual(self.api.requests, [("GET", "bot/reminders"), ("DELETE", "bot/reminders/1")])
+        self.assertIn("could not be deleted", self.ctx.send.call_args.kwargs["embed"].description)
+
+    async def test_admins_can_delete_other_users_reminders(self):
+        """Admins should be asked to confirm deleting each reminder of another user, which is fetched first."""
+        self.has_any_role_check.return_value = True
+        self.cog._can_modify_reminder = AsyncMock(return_value=True)
+        self.cog.active_reminder_counts.set(200, 3)
+
+        await self.cog.delete_reminder(self.cog, self.ctx, [1, 6, 42])
+
+        self.assertEqual(self.api.count("GET"), 3)
+        self.assertEqual(self.api.count("DELETE"), 2)
+        self.assertNotIn(6, self.api.reminders)
+        self.cog._can_modify_reminder.assert_awaited_once()
+        self.assertEqual(self.cog.active_reminder_counts.get(200), 2)
+
+    async def test_active_reminder_count_is_cached(self):
+        """Creating reminders should only fetch the author's reminders once, keeping their count up to date."""
+        with (
+            patch.object(reminders, "has_no_roles_check", AsyncMock(return_value=True)),
+            patch.object(reminders, "OptInReminderMentionView") as view,
+        ):
+            view.return_value.get_embed = AsyncMock()
+            expiration = datetime.now(UTC) + timedelta(minutes=5)
+            for _ in range(3):
+                await self.cog.new_reminder(self.cog, self.ctx, [], expiration, content="Stretch")
+
+        self.assertEqual(self.api.count("GET"), 1)
+        self.assertEqual(self.api.count("POST"), 1)
+        self.assertEqual(self.cog.active_reminder_counts.get(100), 6)
+        self.assertEqual(self.ctx.send.call_args.kwargs["embed"].description, "You have too many active reminders!")
+
+    async def test_active_reminder_count_follows_deletions(self):
+        """Deleting reminders, or sending them, should update the author's cached count."""
+        await self.cog.delete_reminder(self.cog, self.ctx, [1, 2])
+        self.assertEqual(self.cog.active_reminder_counts.get(100), 3)
+
+        self.bot.get_channel.return_value = None
+        self.cog.ensure_valid_reminder(self.api.reminders[3])
+        await asyncio.gather(*self.cog.invalid_reminder_deletions)
+
+        self.assertEqual(self.cog.active_reminder_counts.get(100), 2)
+        self.assertEqual(await self.cog.get_active_reminder_count(100), 2)
+        self.assertEqual(self.api.count("GET"), 1)
@@ -0,0 +1,163 @@
+import asyncio
+from unittest.mock import AsyncMock, MagicMock
+
+import discord
+
+from bot.exts.utils import thread_bumper
+from tests.base import RedisTestCase
+from tests.helpers import MockBot, MockGuild
+
+LATENCY = 0.05
+
+
+def make_thread(thread_id: int, *, archived: bool, parent_id: int = 100) -> MagicMock:
+    """Return a thread whose edits take a while."""
+    thread = MagicMock(spec=discord.Thread, id=thread_id, archived=archived, parent_id=parent_id)
+    thread.name = f"thread-{thread_id}"
+
+    async def edit(**_kwargs) -> None:
+        await asyncio.sleep(LATENCY)
+
+    thread.edit = AsyncMock(side_effect=edit)
+    return thread
+
+
+async def async_iter(items: list):
+    for item in items:
+        yield item
+
+
+class ThreadBumperReconcileTests(RedisTestCase):
+    """Tests for reconciling the bumped threads with the guild on startup."""
+
+    async def asyncSetUp(self):
+        await super().asyncSetUp()
+        self.bot = MockBot()
+        self.cog = thread_bumper.ThreadBumper(self.bot)
+
+        # Threads 0-9 are active and cached, 10-29 are archived, 30-39 were deleted.
+        # The parents of threads 0-24 and 30-34 are known: 10-19 are in channel 100, and 20-24 in channel 101.
+        self.active = {i: make_thread(i, archived=False) for i in range(10)}
+        self.archived = {
+            i: make_thread(i, archived=True, parent_id=100 if i < 20 else 101 if i < 25 else 102)
+            for i in range(10, 30)
+        }
+        self.bumped_ids = list(range(40))
+        await self.cog.thread_parents.update({
+            **{i: thread.parent_id for i, thread in (self.active | self.archived).items() if i < 25},
+            **dict.fromkeys(range(30, 35), 100),
+        })
+
+        # Other threads were archived in both channels since, and channel 101 has many more.
+        self.listed_threads = {100: 0, 101: 0}
+        other_threads = {i: make_thread(i, archived=True) for i in [*range(200, 210), *range(300, 400)]}
+        self.parents = {
+            100: self.make_parent(100, [*(other_threads[i] for i in range(200, 210)), *self.archived_in(100)]),
+            101: self.make_parent(101, [*self.archived_in(101), *(other_threads[i] for i in range(300, 400))]),
+        }
+
+        self.concurrent_requests = 0
+        self.max_concurrent_requests = 0
+        self.bot.get_channel.side_effect = lambda id_: self.active.get(id_) or self.parents.get(id_)
+        self.bot.fetch_channel = AsyncMock(side_effect=self.fetch_channel)
+        self.bot.api_client.get = AsyncMock(return_value=self.bumped_ids)
+        self.bot.api_client.delete = AsyncMock(side_effect=self.delete)
+
+        # Threads 10-14 were manually archived.
+        entries = [MagicMock(after=MagicMock(archived=True), target=MagicMock(id=i)) for i in range(10, 15)]
+        guild = MockGuild()
+        guild.audit_logs = MagicMock(return_value=async_iter(entries))
+        self.bot.get_guild.return_value = guild
+
+    def archived_in(self, parent_id: int) -> list[MagicMock]:
+        return [thread for thread in self.archived.values() if thread.parent_id == parent_id]
+
+    def make_parent(self, parent_id: int, archived_threads: list[MagicMock]) -> MagicMock:
+        """Return a channel listing `archived_threads`, which counts how many were listed."""
+        async def list_archived_threads(limit: int):
+            for thread in archived_threads[:limit]:
+                self.listed_threads[parent_id] += 1
+                yield thread
+
+        parent = MagicMock(spec=discord.TextChannel, id=parent_id)
+        parent.archived_threads = MagicMock(side_effect=list_archived_threads)
+        return parent
+
+    async def request(self) -> None:
+        """Simulate a request, tracking how many are made at the same time."""
+        self.concurrent_requests += 1
+        self.max_concurrent_requests = max(self.max_concurrent_requests, self.concurrent_requests)
+        await asyncio.sleep(LATENCY)
+        self.concurrent_requests -= 1
+
+    async def fetch_channel(self, thread_id: int) -> MagicMock:
+        await self.request()
+        if thread_id not in self.archived:
+            raise discord.NotFound(MagicMock(status=404), "Unknown Channel")
+        return self.archived[thread_id]
+
+    async def delete(self, endpoint: str) -> None:
+        await self.request()
+
+    async def test_reconcile_bumped_threads(self):
+        """Stale threads should be removed from the site and archived ones unarchived, concurrently."""
+        await self.cog.reconcile_bumped_threads()
+
+        deleted = {call.args[0] for call in self.bot.api_client.delete.await_args_list}
+        expected_deleted = {f"{thread_bumper.THREAD_BUMP_ENDPOINT}/{i}" for i in [*range(10, 15), *range(30, 40)]}
+        self.assertEqual(deleted, expected_deleted)
+
+        for thread_id, thread in self.archived.items():
+            if thread_id < 15:
+                thread.edit.assert_not_awaited()
+            else:
+                thread.edit.assert_awaited_once_with(archived=False)
+        for thread in self.active.values():
+            thread.edit.assert_not_awaited()
+
+        self.assertGreater(self.max_concurrent_requests, 1)
+        self.assertLessEqual(self.max_concurrent_requests, thread_bumper.MAX_CONCURRENT_REQUESTS)
+        self.bot.stats.gauge.assert_called_once_with("thread_bumper.reconcile.threads", 40)
+        self.bot.stats.timing.assert_called_once()
+
+    async def test_archived_threads_are_listed_per_parent(self):
+        """Archived threads should be found by listing each parent's archived threads once, and fetched otherwise."""
+        await self.cog.reconcile_bumped_threads()
+
+        for parent in self.parents.values():
+            parent.archived_threads.assert_called_once()
+        # Channel 100 was listed in full looking for the deleted threads, channel 101 only until its threads were found.
+        self.assertEqual(self.listed_threads, {100: 20, 101: 5})
+
+        # Only the threads whose parent is unknown, or which weren't listed, are fetched.
+        fetched = {call.args[0] for call in self.bot.fetch_channel.await_args_list}
+        self.assertEqual(fetched, set(range(25, 40)))
+
+    async def test_thread_parents_are_remembered(self):
+        """The parents of the threads found should be stored, and those of removed threads forgotten."""
+        await self.cog.reconcile_bumped_threads()
+
+        threads = self.active | self.archived
+        expected = {i: thread.parent_id for i, thread in threads.items() if i not in range(10, 15)}
+        self.assertEqual(await self.cog.thread_parents.to_dict(), expected)
+
+        # The threads which had to be fetched are listed from their parent next time.
+        self.parents[102] = self.make_parent(102, self.archived_in(102))
+        self.listed_threads[102] = 0
+        self.bot.fetch_channel.reset_mock()
+        self.bot.api_client.get.return_value = list(range(25, 30))
+
+        await self.cog.reconcile_bumped_threads()
+
+        self.bot.fetch_channel.assert_not_awaited()
+        self.assertEqual(self.listed_threads[102], 5)
+
+    async def test_cog_load_does_not_wait_for_reconciliation(self):
+        """Loading the cog should schedule the reconciliation rather than run it."""
+        await self.cog.cog_load()
+
+        self.assertFalse(self.cog.reconcile_task.done())
+        self.bot.api_client.get.assert_not_awaited()
+
+        await self.cog.reconcile_task
+        self.bot.api_client.get.assert_awaited_once()
@@ -0,0 +1,144 @@
+import asyncio
+import sys
+import tempfile
+import textwrap
+import unittest
+from pathlib import Path
+from unittest.mock import MagicMock
+
+import discord
+from discord.ext import commands
+
+from bot.bot import Bot
+from bot.utils.stats import ListenerTimings
+
+EXTENSION_SOURCE = textwrap.dedent(
+    """
+    import asyncio
+    import time
+
+    from discord.ext import commands
+
+    time.sleep(0.02)
+
+
+    class {cog_name}(commands.Cog):
+        async def cog_load(self):
+            await asyncio.sleep({cog_load_delay})
+
+
+    async def setup(bot):
+        await asyncio.sleep(0.02)
+        await bot.add_cog({cog_name}())
+    """
+)
+
+
+class ExtensionTimingTests(unittest.IsolatedAsyncioTestCase):
+    """Tests for the extension load timings recorded by the bot."""
+
+    def setUp(self):
+        directory = tempfile.TemporaryDirectory()
+        self.addCleanup(directory.cleanup)
+        sys.path.insert(0, directory.name)
+        self.addCleanup(sys.path.remove, directory.name)
+
+        extensions = (("fast_extension", "FastCog", 0), ("slow_extension", "SlowCog", 0.05))
+        for name, cog_name, delay in extensions:
+            source = EXTENSION_SOURCE.format(cog_name=cog_name, cog_load_delay=delay)
+            Path(directory.name, f"{name}.py").write_text(source)
+            self.addCleanup(sys.modules.pop, name, None)
+
+        self.bot = Bot(
+            command_prefix="!",
+            guild_id=1,
+            allowed_roles=[],
+            http_session=MagicMock(),
+            intents=discord.Intents.none(),
+        )
+        self.bot.stats = MagicMock()
+        self.bot.all_extensions = frozenset({"fast_extension", "slow_extension"})
+
+    async def test_each_stage_is_timed(self):
+        """The import, setup and cog_load of an extension should be timed separately and sent to statsd."""
+        await self.bot.load_extension("slow_extension")
+
+        timing = self.bot.extension_timings["slow_extension"]
+        self.assertGreaterEqual(timing.import_time, 0.02)
+        self.assertGreaterEqual(timing.setup_time, 0.02)
+        self.assertGreaterEqual(timing.cog_load_time, 0.05)
+        self.assertLess(timing.setup_time, 0.05)
+
+        sent = {call.args[0] for call in self.bot.stats.timing.call_args_list}
+        self.assertEqual(
+            sent,
+            {
+                "extensions.slow_extension.import",
+                "extensions.slow_extension.setup",
+                "extensions.slow_extension.cog_load",
+            }
+        )
+
+    async def test_extensions_loaded_gate_opens_after_every_extension(self):
+        """The readiness gate should open once every extension was tried, and report the slowest first."""
+        await self.bot.load_extension("slow_extension")
+        self.assertFalse(self.bot._extensions_loaded.is_set())
+
+        await self.bot.load_extension("fast_extension")
+        await self.bot.wait_until_extensions_loaded()
+
+        slowest = [name for name, _ in self.bot.get_slowest_extensions()]
+        self.assertEqual(slowest, ["slow_extension", "fast_extension"])
+        self.assertEqual(len(self.bot.get_slowest_extensions(1)), 1)
+
+    async def test_module_loader_is_restored(self):
+        """The loaded extension module shouldn't keep the timing loader wrapper."""
+        await self.bot.load_extension("fast_extension")
+
+        module = self.bot.extensions["fast_extension"]
+        self.assertNotIn("_TimedLoader", type(module.__loader__).__name__)
+        self.assertNotIn("_TimedLoader", type(module.__spec__.loader).__name__)
+
+
+class ListenerTimingTests(unittest.IsolatedAsyncioTestCase):
+    """Tests for timing the bot's event listeners."""
+
+    async def asyncSetUp(self):
+        self.bot = Bot(
+            command_prefix="!",
+            guild_id=1,
+            allowed_roles=[],
+            http_session=MagicMock(),
+            intents=discord.Intents.none(),
+        )
+        self.bot.loop = asyncio.get_running_loop()
+        self.bot.stats = MagicMock()
+
+        class Listener(commands.Cog):
+            @commands.Cog.listener()
+            async def on_test_event(self) -> None:
+                pass
+
+        await self.bot.add_cog(Listener())
+
+    async def dispatch(self) -> None:
+        """Dispatch the test event and wait for its listener to run."""
+        self.bot.dispatch("test_event")
+        await asyncio.sleep(0)
+        await asyncio.sleep(0)
+
+    async def test_listeners_are_not_timed_by_default(self):
+        """Listeners shouldn't be timed unless it's enabled."""
+        await self.dispatch()
+
+        self.assertIsNone(self.bot.listener_timings)
+        self.bot.stats.timing.assert_not_called()
+
+    async def test_listeners_are_timed_when_enabled(self):
+        """Cog listeners should be timed under their cog's name when timing is enabled."""
+        self.bot.listener_timings = ListenerTimings()
+
+        await self.dispatch()
+
+        self.assertEqual(self.bot.listener_timings.listeners["Listener", "on_test_event"].calls, 1)
+        self.bot.stats.timing.assert_called_once()
@@ -0,0 +1,63 @@
+import unittest
+from unittest.mock import patch
+
+from bot.utils.caching import TTLCache
+
+
+class TestTTLCache(unittest.TestCase):
+    """Tests for the TTLCache class in the `bot.utils.caching` module."""
+
+    def test_get_returns_set_value(self):
+        """A value which was set should be returned until it expires."""
+        cache = TTLCache(max_size=2, ttl=10)
+        cache.set("key", "value")
+
+        self.assertEqual(cache.get("key"), "value")
+        self.assertIn("key", cache)
+
+    def test_get_returns_default_for_missing_key(self):
+        """A missing key should return the given default."""
+        cache = TTLCache(max_size=2, ttl=10)
+
+        self.assertIsNone(cache.get("key"))
+        self.assertEqual(cache.get("key", 1), 1)
+
+    @patch("bot.utils.caching.time.monotonic")
+    def test_expired_entries_are_dropped(self, monotonic):
+        """An entry should no longer be returned once its TTL has passed."""
+        cache = TTLCache(max_size=2, ttl=10)
+        monotonic.return_value = 100
+        cache.set("key", "value")
+
+        monotonic.return_value = 109
+        self.assertEqual(cache.get("key"), "value")
+
+        monotonic.return_value = 110
+        self.assertIsNone(cache.get("key"))
+        self.assertEqual(len(cache), 0)
+
+    def test_setting_over_max_size_evicts_least_recently_used(self):
+        """The least recently used entry should be evicted when the cache is full."""
+        cache = TTLCache(max_size=2, ttl=10)
+        cache.set("a", 1)
+        cache.set("b", 2)
+        cache.get("a")
+        cache.set("c", 3)
+
+        self.assertIn("a", cache)
+        self.assertNotIn("b", cache)
+        self.assertIn("c", cache)
+
+    def test_pop_removes_entry(self):
+        """Popping a key should return its value and remove it from the cache."""
+        cache = TTLCache(max_size=2, ttl=10)
+        cache.set("key", "value")
+
+        self.assertEqual(cache.pop("key"), "value")
+        self.assertNotIn("key", cache)
+        self.assertIsNone(cache.pop("key"))
+
+    def test_non_positive_max_size_raises(self):
+        """A cache must be able to hold at least one entry."""
+        with self.assertRaises(ValueError):
+            TTLCache(max_size=0, ttl=10)
@@ -0,0 +1,68 @@
+import asyncio
+import time
+import unittest
+from unittest.mock import MagicMock
+
+from bot.utils.loop_monitor import LoopMonitor
+
+
+async def blocking_coroutine(duration: float) -> None:
+    """Block the event loop for `duration` seconds."""
+    time.sleep(duration)
+
+
+class LoopMonitorTests(unittest.IsolatedAsyncioTestCase):
+    """Tests for the `LoopMonitor` class."""
+
+    async def asyncSetUp(self):
+        self.stats = MagicMock()
+        self.monitor = LoopMonitor(asyncio.get_running_loop(), self.stats, interval=0.02, threshold=0.05)
+        self.monitor.start()
+        self.addCleanup(self.monitor.stop)
+
+    async def test_lag_is_reported(self):
+        """The heartbeat's lag should be sent to stats periodically."""
+        await asyncio.sleep(0.1)
+
+        lags = [call.args for call in self.stats.timing.call_args_list if call.args[0] == "event_loop.lag"]
+        self.assertGreaterEqual(len(lags), 2)
+
+    async def test_blocking_coroutine_is_captured(self):
+        """A coroutine blocking the loop for longer than the threshold should be recorded with its stack."""
+        await blocking_coroutine(0.2)
+        await asyncio.sleep(0.05)
+
+        offenders = self.monitor.get_worst_offenders()
+        self.assertEqual(len(offenders), 1)
+        self.assertIn("blocking_coroutine", offenders[0].location)
+        self.assertIn("time.sleep(duration)", offenders[0].stack)
+        self.assertGreaterEqual(offenders[0].worst_duration, 0.15)
+        self.assertGreaterEqual(self.monitor.worst_lag, 0.15)
+        self.stats.incr.assert_called_once_with("event_loop.slow_callbacks")
+
+    async def test_short_blocks_are_ignored(self):
+        """Blocking for less than the threshold shouldn't be recorded."""
+        await blocking_coroutine(0.01)
+        await asyncio.sleep(0.05)
+
+        self.assertEqual(self.monitor.get_worst_offenders(), [])
+
+    async def test_repeated_offender_is_aggregated(self):
+        """Blocking the loop several times from the same place should count as one offender."""
+        for duration in (0.1, 0.2):
+            await blocking_coroutine(duration)
+            await asyncio.sleep(0.05)
+
+        offenders = self.monitor.get_worst_offenders()
+        self.assertEqual(len(offenders), 1)
+        self.assertEqual(offenders[0].count, 2)
+        self.assertGreaterEqual(offenders[0].worst_duration, 0.15)
+
+    async def test_stopped_monitor_does_not_report(self):
+        """No more lag should be reported once the monitor is stopped."""
+        self.monitor.stop()
+        self.stats.reset_mock()
+
+        await asyncio.sleep(0.05)
+
+        self.stats.timing.assert_not_called()
@@ -0,0 +1,180 @@
+import asyncio
+import unittest
+from collections import Counter
+from unittest.mock import MagicMock
+
+from aiohttp import web
+from aiohttp.test_utils import TestServer
+from pydis_core.site_api import ResponseCodeError
+
+from bot.utils.site_api import SiteAPIClient
+
+
+class FakeSiteAPI:
+    """A site API serving reminders, which counts the requests it receives and can hold responses back."""
+
+    def __init__(self):
+        self.requests: Counter[tuple[str, str]] = Counter()
+        self.released = asyncio.Event()
+        self.released.set()
+        self.reminders = {1: {"id": 1, "content": "Water the plants"}}
+
+        self.app = web.Application()
+        self.app.router.add_get("/bot/reminders", self.list_reminders)
+        self.app.router.add_get("/bot/reminders/{id}", self.get_reminder)
+        self.app.router.add_patch("/bot/reminders/{id}", self.edit_reminder)
+        self.app.router.add_get("/bot/users/{id}", self.get_user)
+
+    async def _handle(self, request: web.Request) -> None:
+        self.requests[request.method, request.path_qs] += 1
+        await self.released.wait()
+
+    async def list_reminders(self, request: web.Request) -> web.Response:
+        await self._handle(request)
+        return web.json_response(list(self.reminders.values()))
+
+    async def get_reminder(self, request: web.Request) -> web.Response:
+        await self._handle(request)
+        reminder = self.reminders.get(int(request.match_info["id"]))
+        if reminder is None:
+            return web.json_response({"detail": "Not found."}, status=404)
+        return web.json_response(reminder)
+
+    async def edit_reminder(self, request: web.Request) -> web.Response:
+        self.requests[request.method, request.path_qs] += 1
+        reminder = self.reminders[int(request.match_info["id"])]
+        reminder.update(await request.json())
+        return web.json_response(reminder)
+
+    async def get_user(self, request: web.Request) -> web.Response:
+        await self._handle(request)
+        return web.json_response({"id": int(request.match_info["id"])})
+
+
+class SiteAPIClientTests(unittest.IsolatedAsyncioTestCase):
+    """Tests for the `SiteAPIClient` class, against a local fake site API."""
+
+    async def asyncSetUp(self):
+        self.site = FakeSiteAPI()
+        server = TestServer(self.site.app)
+        await server.start_server()
+        self.addAsyncCleanup(server.close)
+
+        self.client = SiteAPIClient(str(server.make_url("")).rstrip("/"), "token", cache_ttls={"bot/reminders": 60})
+        self.client.stats = MagicMock()
+        self.addAsyncCleanup(self.client.close)
+
+    async def test_concurrent_identical_gets_are_merged(self):
+        """Identical GET requests sent at the same time should share one request, but not one response object."""
+        self.site.released.clear()
+        requests = [asyncio.create_task(self.client.get("bot/users/5")) for _ in range(10)]
+        await asyncio.sleep(0.05)
+        self.site.released.set()
+        responses = await asyncio.gather(*requests)
+
+        self.assertEqual(self.site.requests, {("GET", "/bot/users/5"): 1})
+        self.assertTrue(all(response == {"id": 5} for response in responses))
+        self.assertEqual(len({id(response) for response in responses}), 10)
+        self.assertEqual(self.client.stats.incr.call_count, 9)
+        self.client.stats.incr.assert_called_with("site_api.coalesced")
+
+    async def test_different_requests_are_not_merged(self):
+        """GET requests to different endpoints or with different parameters should each be sent."""
+        await asyncio.gather(
+            self.client.get("bot/users/5"),
+            self.client.get("bot/users/6"),
+            self.client.get("bot/reminders", params={"author__id": 1}),
+            self.client.get("bot/reminders", params={"author__id": 2}),
+            self.client.get("bot/reminders", params={"random_items": 1}),
+            self.client.get("bot/reminders", params={"random_items": 1}),
+        )
+
+        self.assertEqual(sum(self.site.requests.values()), 6)
+
+    async def test_uncached_resources_are_requested_each_time(self):
+        """GET requests to resources without a TTL should be sent each time once the previous one finished."""
+        await self.client.get("bot/users/5")
+        await self.client.get("bot/users/5")
+
+        self.assertEqual(self.site.requests, {("GET", "/bot/users/5"): 2})
+
+    async def test_cached_resources_are_served_from_the_cache(self):
+        """Responses from resources with a TTL should be served from the cache until it expires."""
+        first = await self.client.get("bot/reminders/1")
+        first["content"] = "Modified by the caller"
+        second = await self.client.get("bot/reminders/1")
+
+        self.assertEqual(self.site.requests, {("GET", "/bot/reminders/1"): 1})
+        self.assertEqual(second, {"id": 1, "content": "Water the plants"})
+        self.client.stats.incr.assert_any_call("site_api.cache.miss")
+        self.client.stats.incr.assert_called_with("site_api.cache.hit")
+
+        self.client.caches["bot/reminders"].ttl = 0
+        self.client.caches["bot/reminders"].clear()
+        await self.client.get("bot/reminders/1")
+        await self.client.get("bot/reminders/1")
+        self.assertEqual(self.site.requests, {("GET", "/bot/reminders/1"): 3})
+
+    async def test_writes_invalidate_the_resource(self):
+        """Writing to any endpoint of a resource should clear the responses cached from it."""
+        await self.client.get("bot/reminders")
+        await self.client.get("bot/reminders/1")
+
+        await self.client.patch("bot/reminders/1", json={"content": "Feed the cat"})
+        reminders = await self.client.get("bot/reminders")
+        reminder = await self.client.get("bot/reminders/1")
+
+        self.assertEqual(reminders, [{"id": 1, "content": "Feed the cat"}])
+        self.assertEqual(reminder, {"id": 1, "content": "Feed the cat"})
+        self.assertEqual(self.site.requests["GET", "/bot/reminders"], 2)
+        self.assertEqual(self.site.requests["GET", "/bot/reminders/1"], 2)
+
+    async def test_writes_during_a_get_prevent_sharing_its_response(self):
+        """A GET request sent before a write shouldn't be joined by later requests, nor have its response cached."""
+        self.site.released.clear()
+        stale_request = asyncio.create_task(self.client.get("bot/reminders/1"))
+        await asyncio.sleep(0.05)
+
+        await self.client.patch("bot/reminders/1", json={"content": "Feed the cat"})
+        fresh_request = asyncio.create_task(self.client.get("bot/reminders/1"))
+        await asyncio.sleep(0.05)
+        self.site.released.set()
+        await asyncio.gather(stale_request, fresh_request)
+        cached = await self.client.get("bot/reminders/1")
+
+        self.assertEqual(self.site.requests["GET", "/bot/reminders/1"], 2)
+        self.assertEqual(cached, {"id": 1, "content": "Feed the cat"})
+
+    async def test_errors_are_raised_for_every_caller_and_not_cached(self):
+        """An error response should be raised in every merged caller, and not be cached."""
+        results = await asyncio.gather(
+            self.client.get("bot/reminders/2"),
+            self.client.get("bot/reminders/2"),
+            return_exceptions=True,
+        )
+        with self.assertRaises(ResponseCodeError):
+            await self.client.get("bot/reminders/2")
+
+        self.assertTrue(all(isinstance(result, ResponseCodeError) for result in results))
+        self.assertEqual(self.site.requests, {("GET", "/bot/reminders/2"): 2})
+
+    async def test_cancelled_caller_does_not_cancel_the_request(self):
+        """Cancelling one of the merged callers shouldn't cancel the request for the others."""
+        self.site.released.clear()
+        cancelled = asyncio.create_task(self.client.get("bot/users/5"))
+        remaining = asyncio.create_task(self.client.get("bot/users/5"))
+        await asyncio.sleep(0.05)
+
+        cancelled.cancel()
+        self.site.released.set()
+
+        self.assertEqual(await remaining, {"id": 5})
+        self.assertTrue(cancelled.cancelled())
+
+    async def test_latency_is_reported_per_method(self):
+        """The latency of every request sent should be reported under its method."""
+        await self.client.get("bot/users/5")
+        await self.client.patch("bot/reminders/1", json={})
+
+        stats = [call.args[0] for call in self.client.stats.timing.call_args_list]
+        self.assertEqual(stats, ["site_api.latency.get", "site_api.latency.patch"])
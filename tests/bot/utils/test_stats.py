@@ -0,0 +1,232 @@
+import asyncio
+import unittest
+from unittest.mock import MagicMock, patch
+
+from discord.ext.commands import Cog
+
+from bot.utils import stats
+from bot.utils.stats import BufferedStatsClient, ListenerTiming, ListenerTimings
+
+
+class UDPSink(asyncio.DatagramProtocol):
+    """A statsd server which records the packets it receives."""
+
+    def __init__(self):
+        self.packets: list[str] = []
+        self.received = asyncio.Event()
+
+    def datagram_received(self, data: bytes, addr: tuple) -> None:
+        self.packets.append(data.decode("ascii"))
+        self.received.set()
+
+    @property
+    def lines(self) -> list[str]:
+        return [line for packet in self.packets for line in packet.split("\n")]
+
+    async def wait_for_packets(self, count: int) -> None:
+        """Wait until at least `count` packets were received."""
+        async with asyncio.timeout(1):
+            while len(self.packets) < count:
+                self.received.clear()
+                await self.received.wait()
+
+
+class BufferedStatsClientTests(unittest.IsolatedAsyncioTestCase):
+    """Tests for the `BufferedStatsClient` class, against a local UDP sink."""
+
+    async def asyncSetUp(self):
+        loop = asyncio.get_running_loop()
+        self.transport, self.sink = await loop.create_datagram_endpoint(UDPSink, local_addr=("127.0.0.1", 0))
+        self.addCleanup(self.transport.close)
+        _, port = self.transport.get_extra_info("sockname")
+
+        self.client = BufferedStatsClient(loop, "127.0.0.1", port, prefix="bot", flush_interval=60, max_buffered=100)
+        await self.client.create_socket()
+        self.addCleanup(self.client._transport.close)
+        self.addCleanup(self.client.stop)
+
+    async def test_metrics_are_aggregated(self):
+        """Counters should be summed, gauges keep their last value, and timings be sent individually."""
+        for _ in range(10):
+            self.client.incr("messages")
+        self.client.incr("messages", 5)
+        self.client.gauge("queue", 3)
+        self.client.gauge("queue", 7)
+        self.client.gauge("members", 2, delta=True)
+        self.client.gauge("members", -5, delta=True)
+        self.client.gauge("balance", -1)
+        self.client.timing("latency", 10)
+        self.client.timing("latency", 20)
+
+        self.assertEqual(self.sink.packets, [])
+        self.client.flush()
+        await self.sink.wait_for_packets(1)
+
+        self.assertEqual(len(self.sink.packets), 1)
+        self.assertEqual(
+            self.sink.lines,
+            [
+                "bot.messages:15|c",
+                "bot.queue:7|g",
+                "bot.balance:0|g",
+                "bot.balance:-1|g",
+                "bot.members:-3.0|g",
+                "bot.latency:10.000000|ms",
+                "bot.latency:20.000000|ms",
+            ]
+        )
+
+    async def test_flush_when_buffer_is_full(self):
+        """The buffer should be flushed as soon as it holds `max_buffered` metrics."""
+        for i in range(99):
+            self.client.incr(f"counter.{i}")
+        await asyncio.sleep(0.05)
+        self.assertEqual(self.sink.packets, [])
+
+        self.client.incr("counter.99")
+        await self.sink.wait_for_packets(2)
+
+        self.assertEqual(len(self.sink.lines), 100)
+        self.assertEqual(self.client.buffered, 0)
+
+    async def test_packets_stay_under_max_size(self):
+        """Metrics which don't fit in one packet should be split over as few packets as possible."""
+        for i in range(99):
+            self.client.timing(f"a.fairly.long.timing.name.{i}", i)
+        self.client.flush()
+        await self.sink.wait_for_packets(1)
+        await asyncio.sleep(0.05)
+
+        self.assertGreater(len(self.sink.packets), 1)
+        self.assertTrue(all(len(packet) <= stats.MAX_PACKET_SIZE for packet in self.sink.packets))
+        self.assertLess(len(self.sink.packets[0]), stats.MAX_PACKET_SIZE)
+        self.assertGreater(len(self.sink.packets[0]), stats.MAX_PACKET_SIZE - 40)
+        self.assertEqual(len(self.sink.lines), 99)
+
+    async def test_flush_on_interval(self):
+        """Buffered metrics should be flushed once the interval has passed."""
+        self.client.flush_interval = 0.01
+        self.client._flush_handle.cancel()
+        self.client._schedule_flush()
+
+        self.client.incr("ping")
+        await self.sink.wait_for_packets(1)
+
+        self.assertEqual(self.sink.lines, ["bot.ping:1|c"])
+
+    async def test_flush_time_and_drops_are_reported(self):
+        """The client should report its flush time, and the metrics it couldn't send, with the next flush."""
+        self.client.incr("ping")
+        self.client.flush()
+
+        with patch.object(self.client._transport, "sendto", side_effect=OSError):
+            self.client.incr("lost")
+            self.client.timing("lost", 1)
+            self.client.flush()
+        self.assertEqual(self.client.dropped, 3)
+
+        self.client.incr("ping")
+        self.client.flush()
+        await self.sink.wait_for_packets(2)
+
+        self.assertEqual(self.sink.lines[0], "bot.ping:1|c")
+        self.assertEqual(self.sink.lines[1], "bot.ping:1|c")
+        self.assertEqual(self.sink.lines[2], "bot.stats.dropped:3|c")
+        self.assertRegex(self.sink.lines[3], r"^bot\.stats\.flush_time:\d+\.\d+\|ms$")
+
+    async def test_closed_transport_drops_metrics(self):
+        """Metrics flushed after the socket was closed should be counted as dropped."""
+        self.client._transport.close()
+        self.client.incr("ping")
+        self.client.flush()
+
+        self.assertEqual(self.client.dropped, 1)
+
+    async def test_own_metrics_do_not_cause_flushes(self):
+        """An empty buffer shouldn't be flushed just to report the previous flush."""
+        self.client.incr("ping")
+        self.client.flush()
+        await self.sink.wait_for_packets(1)
+
+        self.client.flush()
+        await asyncio.sleep(0.05)
+
+        self.assertEqual(len(self.sink.packets), 1)
+
+
+class ListenerCog(Cog):
+    """A cog with a listener which waits until it's released."""
+
+    def __init__(self):
+        self.release = asyncio.Event()
+
+    async def on_message(self, fail: bool = False) -> None:
+        await self.release.wait()
+        if fail:
+            raise ValueError
+
+
+class ListenerTimingsTests(unittest.IsolatedAsyncioTestCase):
+    """Tests for the `ListenerTimings` class."""
+
+    def setUp(self):
+        self.stats = MagicMock()
+        self.timings = ListenerTimings()
+        self.cog = ListenerCog()
+
+    async def test_invocations_are_timed_per_cog_and_event(self):
+        """Each invocation should be timed, with the in-flight count tracked while it runs."""
+        listener = self.timings.wrap(self.cog.on_message, "on_message", self.stats)
+        tasks = [asyncio.create_task(listener()) for _ in range(3)]
+        await asyncio.sleep(0)
+
+        timing = self.timings.listeners["ListenerCog", "on_message"]
+        self.assertEqual(timing.in_flight, 3)
+        self.stats.gauge.assert_called_with("listeners.ListenerCog.on_message.in_flight", 3)
+
+        self.cog.release.set()
+        await asyncio.gather(*tasks)
+
+        self.assertEqual(timing.calls, 3)
+        self.assertEqual(timing.in_flight, 0)
+        self.assertEqual(timing.peak_in_flight, 3)
+        self.assertEqual(len(timing.durations), 3)
+        self.assertEqual(self.stats.timing.call_count, 3)
+        self.assertEqual(self.stats.timing.call_args.args[0], "listeners.ListenerCog.on_message")
+
+    async def test_stat_names_are_sanitised(self):
+        """Cog names with spaces should only be used as is for display, not in the stat names."""
+        self.cog.__cog_name__ = "Code Block"
+        listener = self.timings.wrap(self.cog.on_message, "on_message", self.stats)
+        self.cog.release.set()
+
+        await listener()
+
+        self.assertIn(("Code Block", "on_message"), self.timings.listeners)
+        self.stats.gauge.assert_called_with("listeners.Code_Block.on_message.in_flight", 0)
+        self.stats.timing.assert_called_once()
+        self.assertEqual(self.stats.timing.call_args.args[0], "listeners.Code_Block.on_message")
+
+    async def test_failing_invocations_are_timed(self):
+        """An invocation which raises should still be timed, and the error propagated."""
+        listener = self.timings.wrap(self.cog.on_message, "on_message", self.stats)
+        self.cog.release.set()
+
+        with self.assertRaises(ValueError):
+            await listener(fail=True)
+
+        timing = self.timings.listeners["ListenerCog", "on_message"]
+        self.assertEqual(timing.in_flight, 0)
+        self.assertEqual(len(timing.durations), 1)
+
+    def test_percentiles_and_slowest(self):
+        """Percentiles should be taken from the recent durations, and listeners ordered by their 95th percentile."""
+        fast = self.timings.listeners["Fast", "on_message"] = ListenerTiming()
+        slow = self.timings.listeners["Slow", "on_message"] = ListenerTiming()
+        fast.durations.extend(i / 1000 for i in range(100))
+        slow.durations.extend(i / 100 for i in range(100))
+
+        self.assertEqual(fast.percentile(50), 0.05)
+        self.assertEqual(fast.percentile(99), 0.099)
+        self.assertEqual(ListenerTiming().percentile(95), 0)
+        self.assertEqual([key for key, _ in self.timings.slowest()], [("Slow", "on_message"), ("Fast", "on_message")])